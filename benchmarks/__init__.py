@@ -0,0 +1,5 @@
+"""performance benchmarks for simpleschema.
+
+Run a single module with `python -m benchmarks.<module>`, everything with `python -m benchmarks`,
+or compare two git revisions with `python -m benchmarks.compare`.
+"""
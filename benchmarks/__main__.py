@@ -0,0 +1,7 @@
+"""run every benchmark, `python -m benchmarks [pattern] [--repeat N] [--json PATH]`.
+"""
+from benchmarks.harness import load_all, main
+
+
+load_all()
+main()
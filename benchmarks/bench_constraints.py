@@ -0,0 +1,83 @@
+"""benchmarks for calling each constraint, and for the `method_dispatch` they're built with.
+"""
+from itertools import cycle, islice
+
+from simpleschema.constraints import Constraint
+from simpleschema.utils import method_dispatch
+
+from benchmarks.harness import benchmark, main
+
+
+SIZES = (1, 100, 10000)
+
+# constraint value and the values to call it on, keyed by constraint pyname
+SAMPLES = {
+    'min_length': (2, ['a', 'boop', '']),
+    'max_length': (3, ['a', 'boop', '']),
+    'min_items': (2, [[1], [1, 2, 3], []]),
+    'max_items': (2, [[1], [1, 2, 3], []]),
+    'min_properties': (1, [{}, {'a': 1}]),
+    'max_properties': (1, [{}, {'a': 1, 'b': 2}]),
+    'required': (['a', 'b'], [{'a': 1, 'b': 2, 'c': 3}, {'a': 1}]),
+    'unique_items': (True, [[1, 2, 3], [1, 1, 2], [{'a': 1}, {'a': True}]]),
+    'pattern': (r'^[a-z]+\d$', ['boop1', 'boop', 'Boop1']),
+    'format': ('email', ['joe.bloggs@example.com', 'joe..bloggs@example.com']),
+    'minimum': (0, [1, -1, 0.5]),
+    'maximum': (0, [1, -1, 0.5]),
+    'exclusive_minimum': (0, [1, -1, 0.5]),
+    'exclusive_maximum': (0, [1, -1, 0.5]),
+    'multiple_of': (0.1, [0.3, 1, 0.25]),
+}
+
+
+def _register(pyname: str, value, samples: list):
+    @benchmark(f'constraints.call.{pyname}', sizes=SIZES)
+    def call(size: int):
+        constraint = Constraint.__registry__[pyname](value)
+        values = list(islice(cycle(samples), size))
+        return lambda: [constraint(v) for v in values]
+
+
+for _pyname, (_value, _samples) in SAMPLES.items():
+    _register(_pyname, _value, _samples)
+
+
+class _Dispatched:
+
+    @method_dispatch
+    def handle(self, x):
+        return x
+
+    @handle.register
+    def _(self, x: int):
+        return x
+
+    def direct(self, x):
+        return x
+
+
+@benchmark('utils.method_dispatch.dispatched', sizes=SIZES)
+def dispatched(size: int):
+    handle = _Dispatched().handle
+    values = list(range(size))
+    return lambda: [handle(v) for v in values]
+
+
+@benchmark('utils.method_dispatch.baseline', sizes=SIZES)
+def undispatched(size: int):
+    # the same call without dispatch, the difference to `dispatched` is the dispatch overhead
+    direct = _Dispatched().direct
+    values = list(range(size))
+    return lambda: [direct(v) for v in values]
+
+
+@benchmark('constraints.init.min_length', sizes=SIZES)
+def init(size: int):
+    # built through `method_dispatch` on the value type
+    cls = Constraint.__registry__['min_length']
+    values = list(range(size))
+    return lambda: [cls(v) for v in values]
+
+
+if __name__ == '__main__':
+    main()
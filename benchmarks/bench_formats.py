@@ -0,0 +1,45 @@
+"""benchmarks for each format checker over a mix of valid and invalid values.
+"""
+from itertools import cycle, islice
+
+from simpleschema.format_checkers import get_checker
+from simpleschema.formats import Format
+
+from benchmarks.harness import benchmark, main
+
+
+SAMPLES = {
+    Format.date_time: ['2019-08-04T12:30:00.123+01:00', '2019-02-30T12:30:00Z'],
+    Format.time: ['12:30:00Z', '12:60:00Z'],
+    Format.date: ['2019-08-04', '2019-02-29'],
+    Format.email: ['joe.bloggs@example.com', 'joe..bloggs@example.com'],
+    Format.idn_email: ['실례@실례.테스트', 'joe bloggs@example.com'],
+    Format.hostname: ['www.example.com', '-example.com'],
+    Format.idn_hostname: ['실례.테스트', '-실례.테스트'],
+    Format.ipv4: ['192.168.0.1', '192.168.0.256'],
+    Format.ipv6: ['fe80::1ff:fe23:4567:890a', '1::2::3'],
+    Format.uri: ['http://example.com/a/b?c=d#e', '//example.com'],
+    Format.uri_reference: ['/a/b?c=d#e', 'a b'],
+    Format.iri: ['http://ƒøø.ßår/?∂éœ=πîx', '/relative'],
+    Format.iri_reference: ['/∂éœ?πîx', '∂ éœ'],
+    Format.uri_template: ['http://example.com/{term:1}/{+path}', 'http://example.com/{term'],
+    Format.json_pointer: ['/a~0b/c~1d/0', '/a~2'],
+    Format.relative_json_pointer: ['1/foo/0', '01/foo'],
+    Format.regex: [r'^[a-z]+@[a-z]+\.com$', '[a-'],
+}
+
+
+def _register(fmt: Format, samples: list):
+    @benchmark(f'formats.{fmt.value}', sizes=(1, 100))
+    def setup(size: int):
+        check = get_checker(fmt)
+        values = list(islice(cycle(samples), size))
+        return lambda: [check(v) for v in values]
+
+
+for _fmt, _samples in SAMPLES.items():
+    _register(_fmt, _samples)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+"""benchmarks for compiling patterns into the pattern cache and matching with them.
+"""
+from simpleschema.patterns import PatternCache
+
+from benchmarks.harness import benchmark, main
+
+
+@benchmark('patterns.compile', sizes=(1, 100, 1000))
+def compile_patterns(size: int):
+    # every pattern misses a fresh cache, so this is the cost of compiling and building matchers
+    patterns = [rf'^[a-z]+_{i}\d*$' for i in range(size)]
+
+    def run():
+        cache = PatternCache(maxsize=size)
+        for p in patterns:
+            cache.get(p)
+
+    return run
+
+
+@benchmark('patterns.get_cached', sizes=(1, 100, 1000))
+def get_cached(size: int):
+    cache = PatternCache(maxsize=size)
+    patterns = [rf'^[a-z]+_{i}\d*$' for i in range(size)]
+    for p in patterns:
+        cache.get(p)
+    return lambda: [cache.get(p) for p in patterns]
+
+
+def _register_match(kind: str, pattern: str, prefix: str):
+    @benchmark(f'patterns.match.{kind}', sizes=(10, 1000, 100000))
+    def match(size: int):
+        # size is the length of the string being matched
+        matcher = PatternCache().get(pattern).match
+        s = (prefix * size)[:size]
+        return lambda: matcher(s)
+
+
+_register_match('literal', '^boop$', 'boop')
+_register_match('prefix', '^boop', 'boop')
+_register_match('suffix', '^.*boop$', 'boop')
+_register_match('regex', r'^[a-z]+$', 'boop')
+
+
+if __name__ == '__main__':
+    main()
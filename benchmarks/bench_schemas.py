@@ -0,0 +1,85 @@
+"""benchmarks for building and serializing schemas, directly and through the atomic types.
+"""
+from itertools import cycle, islice
+
+from simpleschema.atomics import Integer, Number, String
+from simpleschema.formats import Format
+from simpleschema.schema import IntegerSchema, NumberSchema, StringSchema
+
+from benchmarks.harness import benchmark, main
+
+
+SIZES = (1, 100, 10000)
+
+FIELDS = {
+    # an enum member rather than the format's name, which older revisions don't accept
+    StringSchema: dict(
+        title='name', min_length=1, max_length=64, pattern='^[a-z]', format=Format.email
+    ),
+    NumberSchema: dict(title='score', minimum=0, maximum=1.5, multiple_of=0.5),
+    IntegerSchema: dict(title='count', minimum=0, exclusive_maximum=100, multiple_of=2),
+}
+
+ATOMICS = {String: StringSchema, Number: NumberSchema, Integer: IntegerSchema}
+
+
+def _kwargs(schema_cls: type, size: int):
+    # `size` distinct field sets, varying the title so they're all different schemas
+    fields = FIELDS[schema_cls]
+    return [dict(fields, title=f'{fields["title"]}_{i}') for i in range(size)]
+
+
+def _no_caches(schema):
+    pass
+
+
+def _register(schema_cls: type):
+    name = schema_cls.__name__
+
+    @benchmark(f'schemas.construct.{name}', sizes=SIZES)
+    def construct(size: int):
+        kwargs = _kwargs(schema_cls, size)
+        return lambda: [schema_cls(**kw) for kw in kwargs]
+
+    @benchmark(f'schemas.to_dict.{name}', sizes=SIZES)
+    def to_dict(size: int):
+        schemas = [schema_cls(**kw) for kw in _kwargs(schema_cls, size)]
+        # older revisions don't cache to_dict, so have no caches to clear
+        clear = getattr(schema_cls, '_clear_caches', _no_caches)
+
+        def run():
+            for schema in schemas:
+                clear(schema)
+                schema.to_dict()
+
+        return run
+
+    @benchmark(f'schemas.to_dict_cached.{name}', sizes=SIZES)
+    def to_dict_cached(size: int):
+        schemas = [schema_cls(**kw) for kw in _kwargs(schema_cls, size)]
+        return lambda: [schema.to_dict() for schema in schemas]
+
+
+def _register_atomic(atomic: type, schema_cls: type):
+    # sizes are the number of distinct schemas asked for, so the largest overflows the intern cache
+    @benchmark(f'atomics.__schema__.{atomic.__name__}', sizes=SIZES)
+    def schema(size: int):
+        kwargs = _kwargs(schema_cls, size)
+        return lambda: [atomic.__schema__(**kw) for kw in kwargs]
+
+
+for _schema_cls in FIELDS:
+    _register(_schema_cls)
+
+for _atomic, _schema_cls in ATOMICS.items():
+    _register_atomic(_atomic, _schema_cls)
+
+
+@benchmark('schemas.construct.StringSchema.format_enum', sizes=SIZES)
+def construct_with_enum(size: int):
+    formats = list(islice(cycle(Format), size))
+    return lambda: [StringSchema(format=f) for f in formats]
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+"""startup benchmarks, importing simpleschema in a fresh interpreter and defining many schemas.
+"""
+import os
+import subprocess
+import sys
+
+from simpleschema.schema import StringSchema
+
+from benchmarks.harness import benchmark, main
+
+
+def _python(code: str):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(p for p in sys.path if p))
+    cmd = [sys.executable, '-c', code]
+    return lambda: subprocess.run(cmd, env=env, check=True)
+
+
+@benchmark('startup.interpreter')
+def interpreter(size: int):
+    # the baseline to subtract from `startup.import`
+    return _python('pass')
+
+
+@benchmark('startup.import')
+def import_simpleschema(size: int):
+    return _python('import simpleschema.schema, simpleschema.atomics')
+
+
+@benchmark('startup.define_schemas', sizes=(1000,))
+def define_schemas(size: int):
+    def define():
+        for i in range(size):
+            annotations = {f'field_{i}': int, f'other_{i}': str}
+            type(f'Generated{i}', (StringSchema,), {'__annotations__': annotations})
+
+    return define
+
+
+if __name__ == '__main__':
+    main()
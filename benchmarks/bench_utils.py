@@ -0,0 +1,16 @@
+"""benchmarks for `to_pascalcase`.
+"""
+from simpleschema.utils import to_pascalcase
+
+from benchmarks.harness import benchmark, main
+
+
+@benchmark('utils.to_pascalcase', sizes=(1, 4, 16))
+def pascalcase(size: int):
+    # size is the number of words in the identifier
+    name = '_'.join(['word'] * size)
+    return lambda: to_pascalcase(name)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+"""compare benchmark results between two git revisions.
+
+Each revision is checked out into a temporary git worktree and the benchmarks from the *current*
+tree are run against its `src`, so both revisions are measured with the same suite. Benchmarks that
+can't run against a revision are skipped for it.
+
+Usage:
+    python -m benchmarks.compare BASE [HEAD] [-k PATTERN] [--repeat N] [--threshold 0.1]
+
+`HEAD` defaults to the working tree. Results slower than `BASE` by more than the threshold are
+marked as regressions and make the command exit non zero.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Sequence, Tuple
+
+Key = Tuple[str, int]
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _git(*args: str) -> str:
+    return subprocess.run(
+        ['git', *args], cwd=ROOT, check=True, stdout=subprocess.PIPE, universal_newlines=True
+    ).stdout.strip()
+
+
+@contextmanager
+def checkout(rev: Optional[str]) -> Iterator[str]:
+    """the root of a checkout of `rev`, or of the working tree if `rev` is None.
+    """
+    if rev is None:
+        yield ROOT
+        return
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'tree')
+        _git('worktree', 'add', '--detach', path, rev)
+        try:
+            yield path
+        finally:
+            _git('worktree', 'remove', '--force', path)
+
+
+def measure(rev: Optional[str], pattern: str, repeat: int) -> Dict[Key, float]:
+    """run the benchmarks against `rev`, returning seconds per call by benchmark name and size.
+    """
+    with checkout(rev) as tree, tempfile.TemporaryDirectory() as tmp:
+        out = os.path.join(tmp, 'results.json')
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join([os.path.join(tree, 'src'), ROOT]))
+        cmd = [sys.executable, '-m', 'benchmarks', pattern, '--repeat', str(repeat), '--json', out]
+        subprocess.run(cmd, cwd=ROOT, env=env, check=True, stdout=subprocess.DEVNULL)
+        with open(out) as f:
+            return {(r['name'], r['size']): r['seconds'] for r in json.load(f)}
+
+
+def report(base: Dict[Key, float], head: Dict[Key, float], threshold: float) -> int:
+    """print the results side by side, returning the number of regressions.
+    """
+    regressions = 0
+    print(f'{"benchmark":<48} {"size":>8} {"base us":>12} {"head us":>12} {"ratio":>8}')
+    for key in sorted(base.keys() | head.keys()):
+        name, size = key
+        if key not in base or key not in head:
+            only = 'base' if key in base else 'head'
+            print(f'{name:<48} {size:>8} {"only in " + only:>34}')
+            continue
+        ratio = head[key] / base[key]
+        flag = ''
+        if ratio > 1 + threshold:
+            flag = '  regression'
+            regressions += 1
+        elif ratio < 1 - threshold:
+            flag = '  improvement'
+        print(
+            f'{name:<48} {size:>8} {base[key] * 1e6:>12.3f} {head[key] * 1e6:>12.3f} '
+            f'{ratio:>8.2f}{flag}'
+        )
+    return regressions
+
+
+def main(argv: Sequence[str] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('base', help='git revision to compare against')
+    parser.add_argument('head', nargs='?', help='revision to compare, the working tree if unset')
+    parser.add_argument('-k', dest='pattern', default='*', help='glob of benchmark names to run')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--threshold', type=float, default=0.1, help='relative change to flag')
+    args = parser.parse_args(argv)
+    base = measure(args.base, args.pattern, args.repeat)
+    head = measure(args.head, args.pattern, args.repeat)
+    return 1 if report(base, head, args.threshold) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""a tiny timeit based benchmark harness.
+
+Benchmarks are registered with the `benchmark` decorator on a setup function which takes an input
+size and returns the zero argument callable to time, so setup cost is never measured.
+
+A benchmark which raises, in its setup or while being timed, eg. because it targets an api the
+simpleschema being measured doesn't have, is reported as skipped rather than failing the run. That
+way the same suite can be run against older revisions, see `benchmarks.compare`.
+"""
+import argparse
+import fnmatch
+import importlib
+import json
+import pkgutil
+import sys
+import timeit
+from typing import Callable, Dict, Iterator, List, NamedTuple, Sequence, Tuple
+
+
+Setup = Callable[[int], Callable[[], object]]
+
+REGISTRY: Dict[str, Tuple[Setup, Tuple[int, ...]]] = {}
+
+
+class Result(NamedTuple):
+
+    name: str
+    size: int
+    seconds: float
+
+
+def benchmark(name: str, sizes: Sequence[int] = (1,)) -> Callable[[Setup], Setup]:
+    """register a benchmark setup function, to be run once for each input size.
+    """
+
+    def decorator(setup: Setup) -> Setup:
+        REGISTRY[name] = (setup, tuple(sizes))
+        return setup
+
+    return decorator
+
+
+def run(pattern: str = '*', repeat: int = 5) -> Iterator[Result]:
+    """run the registered benchmarks with names matching a glob `pattern`.
+
+    Yields:
+        Result: the best time per call over `repeat` runs for each benchmark and size
+    """
+    for name, (setup, sizes) in sorted(REGISTRY.items()):
+        if not fnmatch.fnmatch(name, pattern):
+            continue
+        for size in sizes:
+            try:
+                timer = timeit.Timer(setup(size))
+                number, _ = timer.autorange()
+                seconds = min(timer.repeat(repeat, number)) / number
+            except Exception as err:
+                print(f'skipped {name} [{size}] : {err!r}', file=sys.stderr)
+                continue
+            yield Result(name, size, seconds)
+
+
+def load_all() -> List[str]:
+    """import every `bench_*` module in this package, registering their benchmarks.
+
+    Modules which can't be imported, eg. against an older simpleschema, are skipped.
+
+    Returns:
+        List[str]: names of the modules loaded
+    """
+    package = __name__.rpartition('.')[0]
+    loaded = []
+    for module in pkgutil.iter_modules(sys.modules[package].__path__):
+        if not module.name.startswith('bench_'):
+            continue
+        try:
+            importlib.import_module(f'{package}.{module.name}')
+        except ImportError as err:
+            print(f'skipped {module.name} : {err!r}', file=sys.stderr)
+        else:
+            loaded.append(module.name)
+    return loaded
+
+
+def main(argv: Sequence[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('pattern', nargs='?', default='*', help='glob of benchmark names to run')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--json', help='also write the results to this path as json')
+    args = parser.parse_args(argv)
+    results = []
+    for result in run(args.pattern, args.repeat):
+        print(f'{result.name:<40} {result.size:>8} {result.seconds * 1e6:>12.3f} us')
+        results.append(result._asdict())
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=1)
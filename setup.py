@@ -13,6 +13,8 @@ with open('HISTORY.rst') as history_file:
 
 requirements = [ ]
 
+extras_requirements = {'numpy': ['numpy']}
+
 setup_requirements = ['pytest-runner']
 
 test_requirements = ['pytest']
@@ -30,6 +32,7 @@ setup(
     ],
     description="simpleschema : simple code based json schema creation and validation.",
     install_requires=requirements,
+    extras_require=extras_requirements,
     license="MIT license",
     long_description=readme + '\n\n' + history,
     include_package_data=True,
@@ -0,0 +1,186 @@
+"""order a schema's checks at runtime by the failure rates seen in sampled traffic.
+
+`AdaptiveValidator` validates like the compiled validator it wraps, but every `sample_every`-th
+value is instead checked against each constraint in turn, recording how often each `Constraint`
+subclass fails and how long it takes in a `FailureStats` table shared between validators. Every
+`refresh_every` values the checks are sorted by their expected time per rejection, mean time over
+failure rate, so the checks most likely to reject a value cheaply run first. The validator is only
+recompiled when the new order is expected to save at least `MIN_SAVING` of the time per value.
+
+The overhead is bounded: most values only pay for a counter on top of the compiled validator,
+sampled values a timer call per constraint, and recompiling happens at most once per
+`refresh_every` values. Stats only keep the last `window` samples of each class or so, by halving
+the counts once they reach it, so the order follows shifts in traffic. Counts may be slightly off
+when validating from many threads at once.
+
+Examples:
+    >>> from simpleschema.schema import StringSchema
+    >>> validate = AdaptiveValidator(StringSchema(max_length=8, pattern='^[a-z]+$'))
+    >>> validate('boop'), validate('Boop')
+    (True, False)
+"""
+import time
+import typing as t
+
+from simpleschema.algebra import simplify
+from simpleschema.compiler import TYPE_CHECKS, Validator, _parts, compile
+from simpleschema.constraints import Constraint
+from simpleschema.profiling import Stats
+from simpleschema.schema.base import SchemaABC, _type_validator
+from simpleschema.types import JSONABLE
+
+
+SchemaLike = t.Union[SchemaABC, t.Dict[str, JSONABLE]]
+
+SAMPLE_EVERY = 64
+REFRESH_EVERY = 8192
+WINDOW = 4096
+# relative saving in expected time per value needed to switch to a new order, so timing noise
+# between checks of about the same cost doesn't cause recompiling on every refresh
+MIN_SAVING = 0.1
+
+# stands in for the time of one unit of `Constraint.__cost__`, until a class has been sampled
+NOMINAL_SECONDS = 1e-7
+
+
+class FailureStats:
+    """sampled calls, failures and time of each constraint class.
+
+    Args:
+        window (int): samples kept per class, older samples are discounted by halving the counts
+            once they reach it.
+    """
+
+    def __init__(self, window: int = WINDOW):
+        self.window = window
+        self._table: t.Dict[type, Stats] = {}
+
+    def record(self, cls: type, failed: bool, seconds: float):
+        try:
+            stats = self._table[cls]
+        except KeyError:
+            stats = self._table[cls] = Stats()
+        stats.calls += 1
+        stats.failures += failed
+        stats.seconds += seconds
+        if stats.calls >= self.window:
+            stats.calls //= 2
+            stats.failures //= 2
+            stats.seconds /= 2
+
+    def get(self, cls: type) -> Stats:
+        """a copy of the stats for a constraint class.
+        """
+        stats = self._table.get(cls)
+        return Stats() if stats is None else stats.copy()
+
+    def estimate(self, constraint: Constraint) -> t.Tuple[float, float]:
+        """mean seconds per check and failure rate of a constraint of this class.
+
+        The failure rate is smoothed towards one half, so classes with few samples aren't ranked
+        on chance.
+        """
+        stats = self._table.get(type(constraint))
+        if stats is None or not stats.calls:
+            return constraint.__cost__ * NOMINAL_SECONDS, 0.5
+        return stats.seconds / stats.calls, (stats.failures + 1) / (stats.calls + 2)
+
+    def reset(self):
+        self._table.clear()
+
+
+STATS = FailureStats()
+
+
+def _expected_seconds(
+    constraints: t.List[Constraint], estimates: t.Dict[type, t.Tuple[float, float]]
+) -> float:
+    # each check only runs for values which passed every check before it
+    total, reached = 0.0, 1.0
+    for c in constraints:
+        seconds, rate = estimates[type(c)]
+        total += reached * seconds
+        reached *= 1 - rate
+    return total
+
+
+class AdaptiveValidator:
+    """a validator reordering its checks by sampled failure rates, see the module docs.
+
+    Args:
+        schema (SchemaLike): schema object or dict accepted by `compile`
+        stats (Optional[FailureStats]): table to record samples in and order checks by, the module
+            wide `STATS` by default.
+        sample_every (int): values validated per sampled value
+        refresh_every (int): values validated between reorderings
+    """
+
+    def __init__(
+        self,
+        schema: SchemaLike,
+        stats: t.Optional[FailureStats] = None,
+        sample_every: int = SAMPLE_EVERY,
+        refresh_every: int = REFRESH_EVERY,
+    ):
+        self.schema = schema
+        self.stats = STATS if stats is None else stats
+        self.sample_every = sample_every
+        self.refresh_every = refresh_every
+        type_, constraints = _parts(schema)
+        if type_ is not None and type_ not in TYPE_CHECKS:
+            raise ValueError(f'cannot compile schema of type {type_}')
+        self._type_check = None if type_ is None else _type_validator(type_)
+        self._constraints = simplify(constraints, type_)
+        self._calls = 0
+        self.validator: Validator = None
+        self.order: t.Tuple[type, ...] = ()
+        self.refresh()
+
+    def refresh(self):
+        """reorder the checks by the current stats, recompiling if it saves enough time.
+        """
+        # estimates only depend on the class, and are taken once so both orderings agree
+        estimates = {type(c): self.stats.estimate(c) for c in self._constraints}
+
+        def score(c: Constraint) -> float:
+            seconds, rate = estimates[type(c)]
+            return seconds / rate
+
+        ranked = sorted(self._constraints, key=score)
+        if self.validator is not None:
+            current = _expected_seconds(self._constraints, estimates)
+            if _expected_seconds(ranked, estimates) > current * (1 - MIN_SAVING):
+                return
+        self.validator = compile(self.schema, key=score)
+        self._constraints = ranked
+        self.order = tuple(type(c) for c in ranked)
+
+    def __call__(self, x: t.Any) -> bool:
+        self._calls += 1
+        if self._calls % self.sample_every:
+            return self.validator(x)
+        if self._calls >= self.refresh_every:
+            self._calls = 0
+            self.refresh()
+        return self._sample(x)
+
+    def _applies(self, c: Constraint, x: t.Any) -> bool:
+        # in a schema without a type each keyword only applies to values of its own json type
+        if self._type_check is not None or c.__json_type__ is None:
+            return True
+        return _type_validator(c.__json_type__)(x)
+
+    def _sample(self, x: t.Any) -> bool:
+        # every constraint is checked so the failure rate of each class isn't skewed by the order
+        if self._type_check is not None and not self._type_check(x):
+            return False
+        perf_counter, record = time.perf_counter, self.stats.record
+        valid = True
+        for c in self._constraints:
+            if not self._applies(c, x):
+                continue
+            start = perf_counter()
+            ok = bool(c(x))
+            record(type(c), not ok, perf_counter() - start)
+            valid = valid and ok
+        return valid
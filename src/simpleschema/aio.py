@@ -0,0 +1,174 @@
+"""validate async streams of records without blocking the event loop.
+
+`validate_async` validates records from an async (or plain) iterable as they arrive, handing control
+back to the event loop every `yield_every` records so a long run of records that are already
+buffered can't starve other tasks.
+
+Schemas whose checks are cpu heavy, ie. with patterns or formats anywhere in them, can instead be
+validated in chunks on an executor. At most `max_pending` chunks are in flight at once and no more
+records are pulled from the source until one completes, and since results are produced lazily a
+slow consumer holds back the source too, so memory use stays bounded either way.
+
+Examples:
+    >>> import asyncio
+    >>> from simpleschema.schema import IntegerSchema
+    >>> async def collect():
+    ...     return [r async for r in validate_async(IntegerSchema(minimum=0), [1, -1])]
+    >>> asyncio.run(collect())
+    [(0, True), (1, False)]
+"""
+import asyncio
+import json
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Executor
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, List, Optional, Tuple, Union
+
+from simpleschema.compiler import Validator, get_validator
+from simpleschema.parallel import _check
+from simpleschema.schema.base import SchemaABC
+from simpleschema.types import JSONABLE
+
+
+Records = Union[AsyncIterable[Any], Iterable[Any]]
+SchemaLike = Union[SchemaABC, Dict[str, JSONABLE]]
+
+YIELD_EVERY = 256
+CHUNK_SIZE = 1024
+MAX_PENDING = 4
+
+# validators kept in each executor worker
+MAX_VALIDATORS = 256
+
+_CPU_HEAVY = ('pattern', 'format', 'patternProperties')
+_SUBSCHEMAS = ('items', 'additionalProperties')
+
+# validators in executor workers by schema key, least recently used first. Schemas arrive freshly
+# unpickled in each chunk sent to a process pool and mustn't be recompiled every time.
+_validators: 'OrderedDict[str, Validator]' = OrderedDict()
+_validators_lock = threading.Lock()
+
+
+def _key(schema: SchemaLike) -> str:
+    if isinstance(schema, dict):
+        return json.dumps(schema, sort_keys=True)
+    return schema.fingerprint()
+
+
+def _validator(schema: SchemaLike) -> Validator:
+    key = _key(schema)
+    with _validators_lock:
+        validate = _validators.get(key)
+        if validate is not None:
+            _validators.move_to_end(key)
+            return validate
+    validate = get_validator(schema)
+    with _validators_lock:
+        _validators[key] = validate
+        while len(_validators) > MAX_VALIDATORS:
+            _validators.popitem(last=False)
+    return validate
+
+
+def _check_chunk(schema: SchemaLike, start: int, chunk: List[Any]) -> Tuple[int, List[bool]]:
+    return _check(_validator(schema), start, chunk)
+
+
+def is_cpu_heavy(schema: SchemaLike) -> bool:
+    """whether a schema has pattern or format checks anywhere in it.
+
+    Only keywords are looked at, so a property named eg. `pattern` doesn't count.
+    """
+    stack = [schema if isinstance(schema, dict) else schema.to_dict()]
+    while stack:
+        d = stack.pop()
+        if any(k in d for k in _CPU_HEAVY):
+            return True
+        stack.extend(v for v in d.get('properties', {}).values() if isinstance(v, dict))
+        stack.extend(d[k] for k in _SUBSCHEMAS if isinstance(d.get(k), dict))
+    return False
+
+
+async def _aiter(records: Records) -> AsyncIterator[Any]:
+    if hasattr(records, '__aiter__'):
+        async for record in records:
+            yield record
+    else:
+        for record in records:
+            yield record
+
+
+async def _chunks(records: Records, size: int) -> AsyncIterator[Tuple[int, List[Any]]]:
+    start, chunk = 0, []
+    async for record in _aiter(records):
+        chunk.append(record)
+        if len(chunk) == size:
+            yield start, chunk
+            start, chunk = start + size, []
+    if chunk:
+        yield start, chunk
+
+
+async def _inline(validate: Validator, records: Records, yield_every: int):
+    index = 0
+    async for record in _aiter(records):
+        yield index, validate(record)
+        index += 1
+        if index % yield_every == 0:
+            await asyncio.sleep(0)
+
+
+async def _offloaded(
+    schema: SchemaLike, records: Records, executor: Executor, chunk_size: int, max_pending: int
+):
+    loop = asyncio.get_running_loop()
+    pending = deque()
+    try:
+        async for start, chunk in _chunks(records, chunk_size):
+            pending.append(loop.run_in_executor(executor, _check_chunk, schema, start, chunk))
+            if len(pending) >= max_pending:
+                start, results = await pending.popleft()
+                for item in enumerate(results, start):
+                    yield item
+        while pending:
+            start, results = await pending.popleft()
+            for item in enumerate(results, start):
+                yield item
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def validate_async(
+    schema: SchemaLike,
+    records: Records,
+    yield_every: int = YIELD_EVERY,
+    executor: Optional[Executor] = None,
+    offload: Optional[bool] = None,
+    chunk_size: int = CHUNK_SIZE,
+    max_pending: int = MAX_PENDING,
+) -> AsyncIterator[Tuple[int, bool]]:
+    """validate records from an async iterable against a schema.
+
+    Args:
+        schema (SchemaLike): schema object or dict accepted by `compile`, must be picklable to be
+            offloaded to a process pool.
+        records (Records): async or plain iterable of records, consumed lazily
+        yield_every (int): records to validate between handing control to the event loop, when
+            validating on the event loop.
+        executor (Optional[Executor]): executor to offload chunks of records to
+        offload (Optional[bool]): whether to use `executor`, by default only for cpu heavy schemas
+            as decided by `is_cpu_heavy`.
+        chunk_size (int): number of records sent to the executor at a time
+        max_pending (int): chunks in flight on the executor before waiting on the oldest
+
+    Returns:
+        AsyncIterator[Tuple[int, bool]]: index of each record and whether it's valid, in order
+    """
+    if offload is None:
+        offload = executor is not None and is_cpu_heavy(schema)
+    if offload:
+        if executor is None:
+            raise ValueError('an executor is needed to offload validation')
+        return _offloaded(schema, records, executor, chunk_size, max_pending)
+    return _inline(get_validator(schema), records, yield_every)
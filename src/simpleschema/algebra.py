@@ -0,0 +1,208 @@
+"""fold a schema's constraints into the tightest equivalent set before they're compiled.
+
+`simplify` merges constraints of the same kind (two `Minimum`s keep the larger, two `MultipleOf`s
+become their least common multiple, `Required` names are unioned), keeps only the tighter of an
+inclusive and an exclusive bound, and orders what's left by each constraint class's `__cost__`,
+cheapest first, so failing values are rejected as early as possible.
+
+Constraints no value can satisfy, eg. a `MinLength` greater than the `MaxLength` or bounds with no
+multiple of `MultipleOf` between them, collapse into a single `Unsatisfiable` constraint, which
+compiles to a constant `False`. In a schema without a type it only takes the place of the keywords
+of its own json type, so it only fails values of that type.
+
+Examples:
+    >>> from simpleschema.constraints import ExclusiveMinimum, Maximum, Minimum
+    >>> simplify([Minimum(1), Minimum(3), ExclusiveMinimum(2), Maximum(5)])
+    [Minimum(3), Maximum(5)]
+    >>> simplify([Minimum(3), Maximum(2)])
+    [Unsatisfiable('minimum 3 is above maximum 2')]
+"""
+import math
+import typing as t
+from fractions import Fraction
+
+from simpleschema.constraints import (
+    Constraint,
+    ExclusiveMaximum,
+    ExclusiveMinimum,
+    MaxItems,
+    MaxLength,
+    MaxProperties,
+    Maximum,
+    MinItems,
+    MinLength,
+    MinProperties,
+    Minimum,
+    MultipleOf,
+    Required,
+    UniqueItems,
+    _as_fraction,
+)
+
+
+class Unsatisfiable(Constraint):
+    """fails every value, standing in for a set of constraints that contradict each other.
+
+    Args:
+        value (str): why no value can satisfy the constraints
+        json_type (Optional[str]): json type of the contradicting keywords, if not every value fails
+    """
+
+    __template__ = 'False'
+    __cost__ = 0
+
+    def __init__(self, value: str, json_type: t.Optional[str] = None):
+        self.value = value
+        self.__json_type__ = json_type
+
+    def __call__(self, x: t.Any) -> bool:
+        return False
+
+
+# how to merge several constraints of the same class
+_TIGHTEST = {
+    Minimum: max,
+    ExclusiveMinimum: max,
+    MinLength: max,
+    MinItems: max,
+    MinProperties: max,
+    Maximum: min,
+    ExclusiveMaximum: min,
+    MaxLength: min,
+    MaxItems: min,
+    MaxProperties: min,
+}
+
+# json type of the keywords applying to values of each schema type
+_KEYWORD_TYPES = {'integer': 'number'}
+
+_LENGTHS = ((MinLength, MaxLength), (MinItems, MaxItems), (MinProperties, MaxProperties))
+
+
+def _lcm(a: Fraction, b: Fraction) -> Fraction:
+    # of reduced fractions, the lcm of the numerators over the gcd of the denominators
+    n = a.numerator * b.numerator // math.gcd(a.numerator, b.numerator)
+    return Fraction(n, math.gcd(a.denominator, b.denominator))
+
+
+def _multiple_of(group: t.List[MultipleOf]) -> MultipleOf:
+    if len(group) == 1:
+        return group[0]
+    divisor = group[0]._exact
+    for c in group[1:]:
+        divisor = _lcm(divisor, c._exact)
+    # plain numbers are kept as such when they're exact, so the merged check keeps its fast path
+    if all(isinstance(c.value, int) for c in group):
+        return MultipleOf(int(divisor))
+    if all(isinstance(c.value, (int, float)) for c in group):
+        value = float(divisor)
+        if _as_fraction(value) == divisor:
+            return MultipleOf(value)
+    return MultipleOf(divisor)
+
+
+def _merge(cls: type, group: t.List[Constraint]) -> t.List[Constraint]:
+    if cls in _TIGHTEST:
+        return [_TIGHTEST[cls](group, key=lambda c: c.value)]
+    if cls is MultipleOf:
+        return [_multiple_of(group)]
+    if cls is Required:
+        return [group[0] if len(group) == 1 else Required(set().union(*(c.value for c in group)))]
+    if cls is UniqueItems:
+        return [max(group, key=lambda c: c.value)]
+    unique = []
+    for c in group:
+        if not any(getattr(c, 'value', c) == getattr(u, 'value', u) for u in unique):
+            unique.append(c)
+    return unique
+
+
+def _bound(by_cls: t.Dict[type, t.List[Constraint]], inclusive: type, exclusive: type, pick):
+    # keep only the tighter of an inclusive and an exclusive bound
+    if inclusive in by_cls and exclusive in by_cls:
+        inc, exc = by_cls[inclusive][0], by_cls[exclusive][0]
+        if pick(inc.value, exc.value) == inc.value and inc.value != exc.value:
+            del by_cls[exclusive]
+        else:
+            del by_cls[inclusive]
+    for cls in (inclusive, exclusive):
+        if cls in by_cls:
+            return by_cls[cls][0]
+    return None
+
+
+def _first_multiple(divisor: Fraction, lower: Constraint) -> Fraction:
+    q = math.ceil(_as_fraction(lower.value) / divisor)
+    if isinstance(lower, ExclusiveMinimum) and q * divisor == _as_fraction(lower.value):
+        q += 1
+    return q * divisor
+
+
+def _bounds_contradiction(by_cls: t.Dict[type, t.List[Constraint]], type_: t.Optional[str]) -> str:
+    lower = _bound(by_cls, Minimum, ExclusiveMinimum, max)
+    upper = _bound(by_cls, Maximum, ExclusiveMaximum, min)
+    if lower is None or upper is None:
+        return None
+    either = isinstance(lower, ExclusiveMinimum) or isinstance(upper, ExclusiveMaximum)
+    if lower.value > upper.value or (lower.value == upper.value and either):
+        return f'{lower.__pyname__} {lower.value!r} is above {upper.__pyname__} {upper.value!r}'
+    divisor = Fraction(1) if type_ == 'integer' else None
+    if MultipleOf in by_cls:
+        exact = by_cls[MultipleOf][0]._exact
+        divisor = exact if divisor is None else _lcm(divisor, exact)
+    if divisor is None or not (math.isfinite(lower.value) and math.isfinite(upper.value)):
+        return None
+    first, last = _first_multiple(divisor, lower), _as_fraction(upper.value)
+    if first > last or (first == last and isinstance(upper, ExclusiveMaximum)):
+        return f'no multiple of {divisor} between {lower.value!r} and {upper.value!r}'
+    return None
+
+
+def _size_contradictions(by_cls: t.Dict[type, t.List[Constraint]]) -> t.Iterator[Unsatisfiable]:
+    for low, high in _LENGTHS:
+        if low in by_cls and high in by_cls and by_cls[low][0].value > by_cls[high][0].value:
+            low, high = by_cls[low][0], by_cls[high][0]
+            reason = f'{low.__pyname__} {low.value} is above {high.__pyname__} {high.value}'
+            yield Unsatisfiable(reason, low.__json_type__)
+    if Required in by_cls and MaxProperties in by_cls:
+        required, most = by_cls[Required][0].value, by_cls[MaxProperties][0].value
+        if len(required) > most:
+            reason = f'{len(required)} required properties but max_properties {most}'
+            yield Unsatisfiable(reason, 'object')
+
+
+def simplify(
+    constraints: t.Iterable[Constraint], type_: t.Optional[str] = None
+) -> t.List[Constraint]:
+    """the tightest equivalent set of constraints, cheapest first.
+
+    Args:
+        constraints (Iterable[Constraint]): constraints a value must all pass
+        type_ (Optional[str]): json type the values are checked against, if any. Keywords of
+            another json type are dropped, and integer bounds with no integer between them are
+            unsatisfiable.
+
+    Returns:
+        List[Constraint]: merged constraints ordered by `__cost__`, or a single `Unsatisfiable`.
+            Without `type_`, an `Unsatisfiable` instead replaces the constraints of its json type.
+    """
+    by_cls: t.Dict[type, t.List[Constraint]] = {}
+    keyword_type = _KEYWORD_TYPES.get(type_, type_)
+    for c in constraints:
+        if type_ is not None and c.__json_type__ not in (None, keyword_type):
+            continue
+        by_cls.setdefault(type(c), []).append(c)
+    by_cls = {cls: _merge(cls, group) for cls, group in by_cls.items()}
+    unsatisfiable = by_cls.pop(Unsatisfiable, [])
+    reason = _bounds_contradiction(by_cls, type_)
+    if reason is not None:
+        unsatisfiable.append(Unsatisfiable(reason, 'number'))
+    unsatisfiable.extend(_size_contradictions(by_cls))
+    # without a type each contradiction only fails the values its keywords apply to
+    failing = {}
+    for u in unsatisfiable:
+        failing.setdefault(u.__json_type__, u)
+    if failing and (type_ is not None or None in failing):
+        return [failing.get(None, unsatisfiable[0])]
+    merged = [c for group in by_cls.values() for c in group if c.__json_type__ not in failing]
+    return sorted(merged + list(failing.values()), key=lambda c: c.__cost__)
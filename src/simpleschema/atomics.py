@@ -1,36 +1,121 @@
+import functools
+from enum import Enum
+from typing import Any, Callable, ClassVar, Dict, Optional, Tuple, Type
+
 from simpleschema.schema import BooleanSchema, IntegerSchema, NumberSchema, NullSchema, StringSchema
-from simpleschema.types import SchemaType
+from simpleschema.schema.base import SchemaABC
+from simpleschema.types import JSONABLE, SchemaType
+
+
+SCHEMA_CACHE_SIZE = 1024
+
+_Key = Tuple[Tuple[str, type, JSONABLE], ...]
+
+
+def _normalize(kwargs: Dict[str, JSONABLE]) -> Optional[_Key]:
+    key = []
+    for k, v in kwargs.items():
+        if isinstance(v, Enum):
+            v = v.value
+        key.append((k, type(v), v))
+    key.sort(key=lambda item: item[0])
+    key = tuple(key)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _build(schema_cls: Type[SchemaABC], key: _Key) -> SchemaABC:
+    # shared instances are frozen, so setting a field on one can't change what later callers get
+    return schema_cls(**{k: v for k, _, v in key}).freeze()
+
+
+_interned = functools.lru_cache(maxsize=SCHEMA_CACHE_SIZE)(_build)
+
+
+def intern_schema(schema_cls: Type[SchemaABC], **kwargs) -> SchemaABC:
+    """get the shared schema instance of `schema_cls` for the given fields.
+
+    Schemas are immutable so identical schemas can share a single instance, which is frozen so no
+    unset fields can be set on it either. Instances are kept in an LRU cache keyed on the schema
+    class and the normalized fields (enums are compared by value, and `1`, `1.0` and `True` are
+    kept apart). Schemas with unhashable field values aren't cached.
+
+    Examples:
+        >>> intern_schema(StringSchema, min_length=1) is intern_schema(StringSchema, min_length=1)
+        True
+    """
+    key = _normalize(kwargs)
+    if key is None:
+        return schema_cls(**kwargs)
+    return _interned(schema_cls, key)
+
+
+def schema_cache_info() -> functools._CacheInfo:
+    """hit / miss statistics and size of the schema interning cache.
+    """
+    return _interned.cache_info()
+
+
+def clear_schema_cache():
+    _interned.cache_clear()
+
+
+def set_schema_cache_size(maxsize: Optional[int]):
+    """resize the schema interning cache, `None` makes it unbounded. Clears the cache.
+    """
+    global _interned
+    _interned = functools.lru_cache(maxsize=maxsize)(_build)
+
+
+def _to_null(x: Any) -> None:
+    if x is not None:
+        raise ValueError(f'{x!r} is not null')
 
 
 class AtomicSchema(SchemaType):
+    """base for the atomic types, each a casting constructor linked to its schema class.
+
+    `__cast__` casts to the plain python type rather than the atomic type itself, so values already
+    of that type are returned as they are, without a copy.
+    """
 
     __schema_cls__ = NotImplemented
+    __cast__: ClassVar[Callable[[Any], Any]] = NotImplemented
     __atomic__ = True
 
     @classmethod
     def __schema__(cls, **kwargs):
-        return cls.__schema_cls__(**kwargs).to_dict()
+        """the json schema dict for this type, built from the interned schema's cached dict.
+        """
+        return intern_schema(cls.__schema_cls__, **kwargs).to_dict()
 
 
 class String(AtomicSchema, str):
 
     __schema_cls__ = StringSchema
+    __cast__ = str
 
 
 class Number(AtomicSchema, float):
 
     __schema_cls__ = NumberSchema
+    __cast__ = float
 
 
 class Integer(AtomicSchema, int):
 
     __schema_cls__ = IntegerSchema
+    __cast__ = int
 
 
 class Boolean(AtomicSchema):
 
     __supertype__ = bool
     __schema_cls__ = BooleanSchema
+    __cast__ = bool
 
     def __new__(cls, x):
         return bool(x)
@@ -40,6 +125,7 @@ class Null(AtomicSchema):
 
     __supertype__ = type(None)
     __schema_cls__ = NullSchema
+    __cast__ = staticmethod(_to_null)
 
     def __new__(cls):
         return None
@@ -0,0 +1,290 @@
+"""generate a standalone python module of validator functions from schemas.
+
+`compile` builds validators at runtime, binding helpers like pattern matchers and format checkers
+into the generated function's namespace. `generate` renders the same checks as the source of a
+module instead, copying in the source of any helpers it needs, so the module can be shipped and
+imported without simpleschema installed and with no compile step at startup.
+
+Each validator is one straight-line expression as in `compile`, with a comment holding the json
+schema it was generated from. Subschemas of object and array schemas become their own functions.
+
+Examples:
+    >>> from simpleschema.schema import StringSchema
+    >>> source = generate({'validate_name': StringSchema(min_length=1, pattern='^[a-z]')})
+    >>> namespace = {}
+    >>> exec(source, namespace)
+    >>> namespace['validate_name']('boop')
+    True
+    >>> namespace['validate_name']('Boop')
+    False
+"""
+import inspect
+import json
+import keyword
+import math
+import re
+import textwrap
+import types
+import typing as t
+from fractions import Fraction
+
+from simpleschema import constraints as _constraints
+from simpleschema import format_checkers
+from simpleschema.algebra import simplify
+from simpleschema.compiler import TYPE_CHECKS, _applying, _constraints_from_dict, _is_literal
+from simpleschema.constraints import Constraint, MultipleOf, Pattern, StringFormat, UniqueItems
+from simpleschema.schema.base import Schema, SchemaABC
+from simpleschema.schema.compound import ArraySchema, ObjectSchema
+from simpleschema.types import JSONABLE
+from simpleschema.utils import method_dispatch
+
+
+SchemaLike = t.Union[SchemaABC, t.Dict[str, JSONABLE]]
+
+# copied helpers keep their annotations, which mustn't be evaluated without their imports
+HEADER = (
+    '"""validators generated by simpleschema, do not edit."""\n'
+    'from __future__ import annotations\n'
+)
+
+
+def _code_names(code: types.CodeType) -> t.Iterator[str]:
+    yield from code.co_names
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            yield from _code_names(const)
+
+
+def _function_source(f: types.FunctionType, name: str) -> str:
+    lines = textwrap.dedent(inspect.getsource(f)).splitlines()
+    while lines[0].startswith('@'):
+        lines.pop(0)
+    lines[0] = re.sub(rf'^def {f.__name__}\(', f'def {name}(', lines[0])
+    return '\n'.join(lines) + '\n'
+
+
+class _Module:
+    """accumulates the source of a generated module.
+
+    Copied helpers and constants are kept apart from tables referring to generated functions, which
+    have to come after the functions themselves.
+    """
+
+    def __init__(self):
+        self.imports: t.Set[str] = set()
+        self.from_imports: t.Dict[str, str] = {}
+        self.definitions: t.Dict[str, str] = {}
+        self.functions: t.List[str] = []
+        self.tables: t.List[str] = []
+        self.count = 0
+
+    def fresh(self, prefix: str) -> str:
+        self.count += 1
+        return f'{prefix}_{self.count}'
+
+    def helper(self, name: str) -> str:
+        # name for a function validating a subschema of the validator `name`
+        return self.fresh(f"_{name.lstrip('_')}")
+
+    def define(self, expr: str) -> str:
+        name = self.fresh('_c')
+        self.definitions[name] = f'{name} = {expr}\n'
+        return name
+
+    def import_(self, name: str, value: t.Union[types.ModuleType, type]):
+        if isinstance(value, types.ModuleType):
+            self.imports.add(name)
+        else:
+            self.from_imports[name] = value.__module__
+
+    def copy(self, name: str, namespace: t.Dict[str, t.Any], as_name: str = None) -> str:
+        """copy a global from a module's namespace, along with every global it refers to.
+        """
+        as_name = as_name or name
+        if as_name in self.definitions or name in self.imports or name in self.from_imports:
+            return as_name
+        value = namespace[name]
+        if isinstance(value, (types.ModuleType, type)):
+            self.import_(name, value)
+        elif isinstance(value, types.FunctionType):
+            self.definitions[as_name] = _function_source(value, as_name)
+            for dep in _code_names(value.__code__):
+                if dep in namespace:
+                    self.copy(dep, namespace)
+        elif isinstance(value, re.Pattern):
+            self.imports.add('re')
+            expr = f're.compile({value.pattern!r}, {value.flags})'
+            self.definitions[as_name] = f'{as_name} = {expr}\n'
+        else:
+            self.definitions[as_name] = f'{as_name} = {value!r}\n'
+        return as_name
+
+    def literal(self, value: t.Any) -> str:
+        """source for a constraint value, used as the `bind` argument to `Constraint.inline`.
+        """
+        if type(value) is float and not math.isfinite(value):
+            return self.define(f"float('{value}')")
+        if _is_literal(value):
+            return repr(value)
+        if isinstance(value, frozenset) and all(_is_literal(v) for v in value):
+            return self.define(repr(value))
+        if type(value) is Fraction:
+            self.import_('Fraction', Fraction)
+            return self.define(f'Fraction({value.numerator}, {value.denominator})')
+        raise ValueError(f'cannot generate standalone code for {value!r}')
+
+    @method_dispatch
+    def constraint(self, c: Constraint, x: str) -> str:
+        return c.inline(x, self.literal)
+
+    @constraint.register
+    def _(self, c: Pattern, x: str) -> str:
+        self.imports.add('re')
+        return f'{self.define(f"re.compile({c.value!r}).match")}({x}) is not None'
+
+    @constraint.register
+    def _(self, c: StringFormat, x: str) -> str:
+        pattern = format_checkers.get_pattern(c.value)
+        if pattern is not None:
+            self.imports.add('re')
+            expr, flags = pattern
+            return f'{self.define(f"re.compile({expr!r}, {flags}).fullmatch")}({x}) is not None'
+        if c.check.__module__ != format_checkers.__name__:
+            raise ValueError(f'cannot generate standalone code for the {c.value} format checker')
+        name = f'_format_{c.check.__name__}'
+        return f'{self.copy(c.check.__name__, vars(format_checkers), name)}({x})'
+
+    @constraint.register
+    def _(self, c: MultipleOf, x: str) -> str:
+        def bind(value: t.Any) -> str:
+            if isinstance(value, types.FunctionType):
+                return self.copy(value.__name__, vars(_constraints))
+            return self.literal(value)
+
+        return c.inline(x, bind)
+
+    @constraint.register
+    def _(self, c: UniqueItems, x: str) -> str:
+        if not c.value:
+            return 'True'
+        freeze = self.copy('_freeze', vars(_constraints))
+        return f'len(set(map({freeze}, {x}))) == len({x})'
+
+    def schema(self, schema: t.Union[bool, SchemaLike], name: str) -> str:
+        """add the function validating `schema`, and any it depends on, returning its name.
+        """
+        if isinstance(schema, bool):
+            # a boolean subschema accepts any value or none
+            self.functions.append(f'def {name}(x):\n    return {schema}\n')
+            return name
+        if isinstance(schema, dict):
+            type_, constraints = schema.get('type'), _constraints_from_dict(schema)
+            doc = json.dumps(schema, separators=(',', ':'))
+        else:
+            type_, constraints = schema.type, Schema.constraints(schema)
+            doc = schema.to_json().decode()
+        if type_ is not None and type_ not in TYPE_CHECKS:
+            raise ValueError(f'cannot compile schema of type {type_}')
+        checks = [TYPE_CHECKS[type_].format(x='x')] if type_ is not None else []
+        checks.extend(
+            _applying(type_, c, self.constraint(c, 'x'), 'x') for c in simplify(constraints, type_)
+        )
+        if isinstance(schema, ObjectSchema) and any(
+            hasattr(schema, k) for k in schema._subschema_fields
+        ):
+            checks.append(f'{self.properties(schema, name)}(x)')
+        if isinstance(schema, ArraySchema) and getattr(schema, 'items', True) is not True:
+            items = self.schema(schema.items, self.helper(name))
+            checks.append(f'all(map({items}, x))')
+        body = '\n        and '.join(checks) or 'True'
+        self.functions.append(f'def {name}(x):\n    # {doc}\n    return (\n        {body}\n    )\n')
+        return name
+
+    def properties(self, schema: ObjectSchema, name: str) -> str:
+        # mirrors `PropertyIndex`: a key is checked against its property and every matching
+        # pattern property, and only against additional properties if there are neither.
+        fn = f"_{name.lstrip('_')}_properties"
+        properties = getattr(schema, 'properties', {})
+        patterns = getattr(schema, 'pattern_properties', {})
+        additional = getattr(schema, 'additional_properties', True)
+        lines = [f'def {fn}(x):', '    for k, v in x.items():']
+        if properties:
+            table = self.helper(f'{name}_props')
+            entries = ', '.join(
+                f'{k!r}: {self.schema(s, self.helper(name))}' for k, s in properties.items()
+            )
+            self.tables.append(f'{table} = {{{entries}}}\n')
+            lines += [f'        found = k in {table}', f'        if found and not {table}[k](v):']
+            lines.append('            return False')
+        else:
+            lines.append('        found = False')
+        if patterns:
+            self.imports.add('re')
+            table = self.helper(f'{name}_patterns')
+            entries = ''.join(
+                f'(re.compile({p!r}).match, {self.schema(s, self.helper(name))}), '
+                for p, s in patterns.items()
+            )
+            self.tables.append(f'{table} = ({entries})\n')
+            lines += [
+                '        if isinstance(k, str):',
+                f'            for match, check in {table}:',
+                '                if match(k) is not None:',
+                '                    found = True',
+                '                    if not check(v):',
+                '                        return False',
+            ]
+        if additional is False:
+            lines += ['        if not found:', '            return False']
+        elif additional is not True:
+            check = self.schema(additional, self.helper(name))
+            lines.append(f'        if not found and not {check}(v):')
+            lines.append('            return False')
+        lines.append('    return True')
+        self.functions.append('\n'.join(lines) + '\n')
+        return fn
+
+    def source(self, names: t.Iterable[str]) -> str:
+        parts = [HEADER]
+        parts.append(''.join(f'import {m}\n' for m in sorted(self.imports)))
+        parts.append(
+            ''.join(f'from {m} import {n}\n' for n, m in sorted(self.from_imports.items()))
+        )
+        parts.append(f'__all__ = {sorted(names)!r}\n')
+        parts.extend(self.definitions.values())
+        parts.extend(self.functions)
+        parts.extend(self.tables)
+        return '\n\n'.join(p for p in parts if p)
+
+
+def generate(validators: t.Mapping[str, SchemaLike]) -> str:
+    """render the source of a module defining a validator function for each schema.
+
+    Args:
+        validators (Mapping[str, SchemaLike]): schema objects, or dicts accepted by `compile`, by
+            the name of the function validating them. Names must be public identifiers.
+
+    Returns:
+        str: module source, depending only on the standard library
+
+    Raises:
+        ValueError: for invalid names, or schemas with custom format checkers which can't be
+            copied into the module.
+    """
+    module = _Module()
+    for name, schema in validators.items():
+        if not name.isidentifier() or keyword.iskeyword(name) or name.startswith('_'):
+            raise ValueError(f'{name!r} is not a valid validator name')
+        module.schema(schema, name)
+    generated = module.imports | module.from_imports.keys() | module.definitions.keys()
+    clashes = set(validators) & generated
+    if clashes:
+        raise ValueError(f'validator names clash with generated code : {sorted(clashes)}')
+    return module.source(validators)
+
+
+def write(validators: t.Mapping[str, SchemaLike], path: str):
+    """write the module generated for `validators` to `path`.
+    """
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(generate(validators))
@@ -0,0 +1,127 @@
+"""cast values with the atomic types and validate the result, in a single pass.
+
+Each value is cast once with its atomic type's `__cast__`, and the converted value is checked with
+the compiled validator of the interned `__schema_cls__` schema. Values already of the right type
+aren't copied, and errors are only worked out for values that fail.
+
+Examples:
+    >>> from simpleschema.atomics import Integer, String
+    >>> coerce_and_validate(Integer, '12', minimum=0)
+    (12, None)
+    >>> coerce_and_validate(Integer, '-1', minimum=0)[1]
+    ValidationError('Invalid value at # : does not satisfy minimum 0')
+    >>> coerce = RecordCoercer({'name': (String, {'min_length': 1}), 'age': Integer})
+    >>> coerce({'name': 'joe', 'age': '42'})
+    ({'name': 'joe', 'age': 42}, mappingproxy({}))
+"""
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, Iterator, Mapping, NamedTuple, Optional, Tuple
+from typing import Type, Union
+
+from simpleschema.atomics import AtomicSchema, intern_schema
+from simpleschema.compiler import Validator
+from simpleschema.constraints import ValidationError
+from simpleschema.schema.base import Schema, json_pointer
+
+
+FieldSpec = Union[Type[AtomicSchema], Tuple[Type[AtomicSchema], Dict[str, Any]]]
+
+NO_ERRORS: Mapping[str, ValidationError] = MappingProxyType({})
+
+
+class _Field(NamedTuple):
+
+    name: str
+    path: str
+    cast: Callable[[Any], Any]
+    validate: Validator
+    schema: Schema
+
+
+def _field(name: str, spec: FieldSpec) -> _Field:
+    atomic, kwargs = (spec, {}) if isinstance(spec, type) else spec
+    schema = intern_schema(atomic.__schema_cls__, **kwargs)
+    return _Field(name, json_pointer('', name), atomic.__cast__, schema.validator(), schema)
+
+
+def _cast_error(schema: Schema, path: str, err: Exception) -> ValidationError:
+    return ValidationError(path, 'type', f'cannot be cast to {schema.type} : {err}')
+
+
+def coerce_and_validate(
+    atomic: Type[AtomicSchema], x: Any, **kwargs
+) -> Tuple[Any, Optional[ValidationError]]:
+    """cast `x` with an atomic type and validate it against the atomic type's schema.
+
+    Args:
+        atomic (Type[AtomicSchema]): the atomic type, eg. `Integer`
+        x (Any): value to cast
+        **kwargs: schema fields, as for `atomic.__schema__`
+
+    Returns:
+        Tuple[Any, Optional[ValidationError]]: the converted value and None, or None and the
+            first error.
+    """
+    schema = intern_schema(atomic.__schema_cls__, **kwargs)
+    try:
+        value = atomic.__cast__(x)
+    except (TypeError, ValueError, ArithmeticError) as err:  # eg. OverflowError from int(inf)
+        return None, _cast_error(schema, '', err)
+    if schema.validator()(value):
+        return value, None
+    return None, next(schema.iter_errors(value))
+
+
+class RecordCoercer:
+    """casts and validates each field of a record in one pass.
+
+    Schemas and validators are resolved once, when the coercer is built.
+
+    Args:
+        fields (Mapping[str, FieldSpec]): atomic type of each field, or a tuple of the atomic type
+            and its schema fields, eg. `(String, {'min_length': 1})`.
+    """
+
+    def __init__(self, fields: Mapping[str, FieldSpec]):
+        self.fields = tuple(_field(name, spec) for name, spec in fields.items())
+
+    def __call__(
+        self, record: Mapping[str, Any]
+    ) -> Tuple[Dict[str, Any], Mapping[str, ValidationError]]:
+        """coerce a record.
+
+        Args:
+            record (Mapping[str, Any]): the raw record, fields not declared are left out of the
+                result.
+
+        Returns:
+            Tuple[Dict[str, Any], Mapping[str, ValidationError]]: the converted fields which are
+                valid, and the error for each field which isn't. Records with no errors share the
+                empty `NO_ERRORS` mapping.
+        """
+        out = {}
+        errors = NO_ERRORS
+        for name, path, cast, validate, schema in self.fields:
+            try:
+                value = cast(record[name])
+            except KeyError:
+                error = ValidationError(path, 'required', 'is missing')
+            except (TypeError, ValueError, ArithmeticError) as err:
+                error = _cast_error(schema, path, err)
+            else:
+                if validate(value):
+                    out[name] = value
+                    continue
+                error = next(schema.iter_errors(value, path))
+            if errors is NO_ERRORS:
+                errors = {}
+            errors[name] = error
+        return out, errors
+
+    def many(
+        self, records: Iterable[Mapping[str, Any]]
+    ) -> Iterator[Tuple[Dict[str, Any], Mapping[str, ValidationError]]]:
+        """coerce each record in turn, lazily.
+        """
+        for record in records:
+            yield self(record)
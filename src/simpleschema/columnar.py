@@ -0,0 +1,178 @@
+"""validate column oriented batches of records without pivoting them into rows.
+
+A batch is a mapping of column names to columns, each a numpy array, a list, or anything numpy can
+view as an array such as an arrow array or a pandas series. Each column is checked against its
+atomic schema as a whole: the type check is skipped outright for ndarrays of a matching dtype, and
+each constraint checks every value of the column in one `Constraint.batch` call, vectorized for
+numeric arrays.
+
+Types are checked as for rows, so eg. a float array never passes an `IntegerSchema` and a bool
+array never passes a `NumberSchema`. Object arrays and lists are type checked value by value.
+
+Examples:
+    >>> from simpleschema.schema import IntegerSchema, StringSchema
+    >>> result = validate_columns(
+    ...     {'id': IntegerSchema(minimum=1), 'name': StringSchema(min_length=1)},
+    ...     {'id': [1, 0, 3], 'name': ['a', 'b', '']},
+    ... )
+    >>> [bool(v) for v in result.valid]
+    [True, False, False]
+    >>> [int(i) for i in result.failures]
+    [1, 2]
+    >>> result.columns['name'].keywords
+    {'minLength': 1}
+"""
+from typing import Any, Dict, Mapping, NamedTuple, Sequence, Tuple
+
+from simpleschema.constraints import BatchResult, numpy
+from simpleschema.schema.atomics import AtomicSchema
+from simpleschema.schema.base import _type_validator
+
+
+class ColumnSummary(NamedTuple):
+    """errors found in a column.
+
+    `failures` holds the indices of the failing rows, and `keywords` the number of rows failing
+    each constraint by its alias, or `'type'` for values of the wrong type and `'required'` for a
+    missing column. Values of the wrong type aren't checked against constraints, and a row failing
+    several constraints is counted against each.
+    """
+
+    failures: Sequence[int]
+    keywords: Dict[str, int]
+
+    @property
+    def valid(self) -> bool:
+        return not len(self.failures)
+
+
+class ColumnarResult(NamedTuple):
+    """result of validating a column oriented batch.
+
+    `valid` holds one bool per row (a numpy bool array when numpy is installed), true when the row
+    passes every column's schema, and `columns` the summary for each column validated.
+    """
+
+    valid: Sequence[bool]
+    columns: Dict[str, ColumnSummary]
+
+    @property
+    def failures(self) -> Sequence[int]:
+        return BatchResult.from_mask(self.valid).failures
+
+
+def _as_column(column: Any) -> Any:
+    np = numpy()
+    if np is None or isinstance(column, (list, tuple, np.ndarray)):
+        return column
+    return np.asarray(column)
+
+
+def _mask(np, values: Sequence[bool]) -> Sequence[bool]:
+    if np is None:
+        return list(values)
+    return np.asarray(values, dtype=bool)
+
+
+def _full(np, n: int, value: bool) -> Sequence[bool]:
+    if np is None:
+        return [value] * n
+    return np.full(n, value, dtype=bool)
+
+
+def _and(np, a: Sequence[bool], b: Sequence[bool]) -> Sequence[bool]:
+    if np is None:
+        return [x and y for x, y in zip(a, b)]
+    return a & b
+
+
+def _type_mask(schema: AtomicSchema, column: Any) -> Sequence[bool]:
+    # None when every value has the schema's type
+    np = numpy()
+    if np is not None and isinstance(column, np.ndarray):
+        kind = column.dtype.kind
+        if kind in schema._dtype_kinds:
+            return None
+        if kind != 'O':
+            return np.zeros(len(column), dtype=bool)
+    check = _type_validator(schema.type)
+    typed = [check(x) for x in column]
+    return None if all(typed) else _mask(np, typed)
+
+
+def _compress(column: Any, mask: Sequence[bool]) -> Any:
+    np = numpy()
+    if np is not None and isinstance(column, np.ndarray):
+        return column[mask]
+    return [x for x, ok in zip(column, mask) if ok]
+
+
+def _expand(mask: Sequence[bool], passed: Sequence[bool]) -> Sequence[bool]:
+    # scatter the results for the values kept by `mask` back to every row
+    np = numpy()
+    if np is None:
+        passed = iter(passed)
+        return [ok and next(passed) for ok in mask]
+    out = np.zeros(len(mask), dtype=bool)
+    out[mask] = passed
+    return out
+
+
+def _count_failed(mask: Sequence[bool]) -> int:
+    return len(mask) - sum(map(bool, mask)) if isinstance(mask, list) else int((~mask).sum())
+
+
+def _check_column(schema: AtomicSchema, column: Any) -> Tuple[BatchResult, Dict[str, int]]:
+    np = numpy()
+    keywords = {}
+    typed = _type_mask(schema, column)
+    values = column
+    if typed is not None:
+        keywords['type'] = _count_failed(typed)
+        values = _compress(column, typed)
+    passed = _full(np, len(values), True)
+    for constraint in schema.constraints():
+        ok = _mask(np, constraint.batch(values).mask)
+        failed = _count_failed(ok)
+        if failed:
+            keywords[constraint.__alias__] = failed
+            passed = _and(np, passed, ok)
+    mask = passed if typed is None else _expand(typed, passed)
+    return BatchResult.from_mask(mask), keywords
+
+
+def validate_columns(
+    schemas: Mapping[str, AtomicSchema], columns: Mapping[str, Any]
+) -> ColumnarResult:
+    """validate a column oriented batch against an atomic schema per column.
+
+    Args:
+        schemas (Mapping[str, AtomicSchema]): atomic schema of each column to validate, columns
+            without one are ignored.
+        columns (Mapping[str, Any]): the batch, as columns of equal length by name. Every row fails
+            for a column in `schemas` which is missing from the batch.
+
+    Returns:
+        ColumnarResult: per row validity and a summary for each column in `schemas`
+
+    Raises:
+        ValueError: if the columns aren't all the same length
+    """
+    np = numpy()
+    columns = {k: _as_column(v) for k, v in columns.items() if k in schemas}
+    lengths = {len(v) for v in columns.values()}
+    if len(lengths) > 1:
+        raise ValueError(f'columns must all be the same length, got lengths {sorted(lengths)}')
+    n = lengths.pop() if lengths else 0
+    valid = _full(np, n, True)
+    summaries = {}
+    for name, schema in schemas.items():
+        if name not in columns:
+            summaries[name] = ColumnSummary(list(range(n)), {'required': n} if n else {})
+            valid = _full(np, n, False)
+            continue
+        result, keywords = _check_column(schema, columns[name])
+        summaries[name] = ColumnSummary(result.failures, keywords)
+        if keywords:
+            valid = _and(np, valid, result.mask)
+    return ColumnarResult(valid, summaries)
@@ -0,0 +1,138 @@
+"""compile schemas into a single specialized validator function.
+
+Rather than dispatching through a list of `Constraint` objects for every value, `compile` renders
+the type check and each constraint as python source and builds one function from it, so that
+validating a value costs only the comparisons themselves. Constraints are first folded and ordered
+cheapest first by `simpleschema.algebra.simplify`, and schemas no value can satisfy compile to a
+constant `False` after the type check.
+
+Examples:
+    >>> from simpleschema.schema import StringSchema
+    >>> validate = compile(StringSchema(min_length=1, max_length=3))
+    >>> validate('abc')
+    True
+    >>> validate('abcd')
+    False
+"""
+import math
+import typing as t
+
+from simpleschema.algebra import simplify
+from simpleschema.constraints import Constraint, by_alias
+from simpleschema.types import JSONABLE
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from simpleschema.schema.base import SchemaABC
+
+
+Validator = t.Callable[[t.Any], bool]
+
+TYPE_CHECKS = {
+    'string': 'isinstance({x}, str)',
+    'number': '(isinstance({x}, (int, float)) and not isinstance({x}, bool))',
+    'integer': '(isinstance({x}, int) and not isinstance({x}, bool))',
+    'boolean': 'isinstance({x}, bool)',
+    'null': '{x} is None',
+    'object': 'isinstance({x}, dict)',
+    'array': 'isinstance({x}, list)',
+}
+
+_NESTED = ('properties', 'patternProperties', 'additionalProperties', 'items')
+
+
+def _is_literal(value: t.Any) -> bool:
+    if type(value) in (int, bool, str):
+        return True
+    return type(value) is float and math.isfinite(value)
+
+
+class _Bindings(dict):
+    """namespace for the generated code, calling it binds a value and returns its source expression.
+    """
+
+    def __call__(self, value: t.Any) -> str:
+        if _is_literal(value):
+            return repr(value)
+        name = f'_b{len(self)}'
+        self[name] = value
+        return name
+
+
+def _constraints_from_dict(schema: t.Dict[str, JSONABLE]) -> t.List[Constraint]:
+    if any(k in schema for k in _NESTED):
+        raise ValueError(
+            'schemas with subschemas must be compiled from schema objects, see '
+            '`simpleschema.loading.from_dict`'
+        )
+    classes = by_alias()
+    return [classes[k](v) for k, v in schema.items() if k in classes]
+
+
+def _parts(
+    schema: t.Union['SchemaABC', t.Dict[str, JSONABLE]]
+) -> t.Tuple[t.Optional[str], t.List[Constraint]]:
+    # the type and constraints of a schema object or dict
+    if isinstance(schema, dict):
+        return schema.get('type'), _constraints_from_dict(schema)
+    return schema.type, schema.constraints()
+
+
+def _applying(type_: t.Optional[str], c: Constraint, check: str, x: str) -> str:
+    # in a schema without a type each keyword only applies to values of its own json type
+    if type_ is not None or c.__json_type__ is None:
+        return check
+    return f'(not {TYPE_CHECKS[c.__json_type__].format(x=x)} or ({check}))'
+
+
+def _render(
+    type_: t.Optional[str],
+    constraints: t.List[Constraint],
+    bind: _Bindings,
+    x: str = 'x',
+    inline: bool = True,
+    key: t.Optional[t.Callable[[Constraint], t.Any]] = None,
+) -> str:
+    if type_ is not None and type_ not in TYPE_CHECKS:
+        raise ValueError(f'cannot compile schema of type {type_}')
+    checks = [TYPE_CHECKS[type_].format(x=x)] if type_ is not None else []
+    constraints = simplify(constraints, type_)
+    if key is not None:
+        constraints.sort(key=key)
+    for c in constraints:
+        check = c.inline(x, bind) if inline else f'{bind(c)}({x})'
+        checks.append(_applying(type_, c, check, x))
+    return '\n        and '.join(checks) or 'True'
+
+
+def compile(
+    schema: t.Union['SchemaABC', t.Dict[str, JSONABLE]],
+    inline: bool = True,
+    key: t.Optional[t.Callable[[Constraint], t.Any]] = None,
+) -> Validator:
+    """build a single validator function for a schema.
+
+    Args:
+        schema (Union[SchemaABC, Dict[str, JSONABLE]]): a schema object or its `to_dict` output
+        inline (bool): inline each constraint's check, otherwise call the constraint objects, which
+            is slower but lets each call be observed, eg. by `simpleschema.profiling`.
+        key (Optional[Callable[[Constraint], Any]]): sort key ordering the checks, by default
+            their `__cost__`.
+
+    Returns:
+        Validator: function returning True if a value is valid under the schema
+    """
+    type_, constraints = _parts(schema)
+    bind = _Bindings()
+    name = f'validate_{type_ or "any"}'
+    body = _render(type_, constraints, bind, inline=inline, key=key)
+    source = f'def {name}(x):\n    return (\n        {body}\n    )\n'
+    exec(source, bind)
+    validator = bind[name]
+    validator.__source__ = source
+    return validator
+
+
+def get_validator(schema: t.Union['SchemaABC', t.Dict[str, JSONABLE]]) -> Validator:
+    """the validator for a schema, the schema object's cached validator or compiled from a dict.
+    """
+    return compile(schema) if isinstance(schema, dict) else schema.validator()
@@ -1,36 +1,178 @@
+import math
+import numbers
 import re
 import typing as t
 from abc import ABCMeta, abstractmethod
-from simpleschema.utils import to_pascalcase, method_dispatch
+from decimal import Decimal
+from fractions import Fraction
+from simpleschema.format_checkers import get_checker
+from simpleschema.formats import FormatEnum
+from simpleschema.patterns import pattern_cache
+from simpleschema.utils import lazy_classattr, to_pascalcase, method_dispatch
+
+
+_UNSET = object()
+
+np = _UNSET
+
+
+def numpy():
+    """numpy, or None if it isn't installed.
+
+    numpy is only imported the first time it's needed so it doesn't weigh on importing simpleschema.
+    """
+    global np
+    if np is _UNSET:
+        try:
+            import numpy as np
+        except ImportError:  # pragma: no cover
+            np = None
+    return np
 
 
 Numeric = t.NewType('Numeric', t.Union[int, float])
 
 
+class BatchResult(t.NamedTuple):
+    """result of validating a column of values.
+
+    `mask` holds one bool per input value (a numpy bool array when the batch was vectorized) and
+    `failures` the indices of the values that failed.
+    """
+
+    mask: t.Sequence[bool]
+    failures: t.Sequence[int]
+
+    @classmethod
+    def from_mask(cls, mask: t.Sequence[bool]) -> 'BatchResult':
+        np = numpy()
+        if np is not None and isinstance(mask, np.ndarray):
+            return cls(mask, np.flatnonzero(~mask))
+        return cls(mask, [i for i, ok in enumerate(mask) if not ok])
+
+
+def as_numeric_array(xs: t.Sequence, kinds: str = 'iuf') -> t.Optional['np.ndarray']:
+    """view `xs` as a numpy array if numpy is available and its dtype kind is one of `kinds`.
+
+    Returns:
+        Optional[np.ndarray]: the array, or None if `xs` can't be vectorized
+    """
+    np = numpy()
+    if np is None:
+        return None
+    arr = np.asarray(xs)
+    return arr if arr.ndim == 1 and arr.dtype.kind in kinds else None
+
+
 class InvalidConstraintError(ValueError):
 
     def __init__(self, name, msg):
         super().__init__(f'Invalid constraint {name} : {msg}')
 
 
+class ValidationError(ValueError):
+    """a value failing its schema.
+
+    Args:
+        path (str): json pointer to the failing value from the root of the validated value
+        keyword (str): alias of the failing constraint, or `'type'`
+        msg (str): what's wrong with the value
+    """
+
+    def __init__(self, path: str, keyword: str, msg: str):
+        super().__init__(f'Invalid value at #{path} : {msg}')
+        self.path = path
+        self.keyword = keyword
+        self.msg = msg
+
+    def __reduce__(self):
+        return self.__class__, (self.path, self.keyword, self.msg)
+
+
+class ValidationErrors(ValueError):
+    """every error found validating a value in collect all mode.
+    """
+
+    def __init__(self, errors: t.Sequence[ValidationError]):
+        super().__init__('\n'.join(str(e) for e in errors))
+        self.errors = tuple(errors)
+
+    def __reduce__(self):
+        return self.__class__, (self.errors,)
+
+
 def is_implemented(attr):
     return attr != NotImplemented
 
 
+def _alias(cls: type) -> str:
+    return to_pascalcase(cls.__pyname__)
+
+
+_by_alias: t.Dict[str, t.Type['Constraint']] = {}
+
+
+def by_alias() -> t.Dict[str, t.Type['Constraint']]:
+    """registered constraint classes by their json schema keyword, eg. `'minLength'`.
+
+    The table is built on first use, and again after a new constraint class is registered.
+    """
+    if not _by_alias:
+        _by_alias.update((c.__alias__, c) for c in Constraint.__registry__.values())
+    return _by_alias
+
+
 class Constraint(metaclass=ABCMeta):
 
     __pyname__ = NotImplemented
     __alias__ = NotImplemented
+    __template__ = NotImplemented
+    __registry__: t.Dict[str, t.Type['Constraint']] = {}
+    # relative cost of a check, cheaper constraints are checked first
+    __cost__ = 1
+    # json type of the values the keyword applies to, a schema without a type doesn't check the
+    # keyword on values of any other type
+    __json_type__: t.Optional[str] = None
 
     def __init_subclass__(cls):
         if is_implemented(cls.__pyname__):
-            cls.__alias__ = to_pascalcase(cls.__pyname__)
+            cls.__alias__ = lazy_classattr(_alias, '__alias__')
+            Constraint.__registry__[cls.__pyname__] = cls
+            _by_alias.clear()
         super().__init_subclass__()
 
+    def __repr__(self) -> str:
+        value = getattr(self, 'value', NotImplemented)
+        return f'{type(self).__name__}({"" if value is NotImplemented else repr(value)})'
+
     @abstractmethod
     def __call__(self, x) -> bool:
         return NotImplemented
 
+    def inline(self, x: str, bind: t.Callable[[t.Any], str]) -> str:
+        """render this constraint as a python expression that is truthy when `x` passes.
+
+        Args:
+            x (str): name of the variable under test in the generated code
+            bind (Callable[[Any], str]): returns a source expression for a value, either a literal
+                or the name it was bound to in the generated code's namespace.
+
+        Returns:
+            str: python expression source
+        """
+        return self.__template__.format(x=x, value=bind(self.value))
+
+    def batch(self, xs: t.Iterable) -> BatchResult:
+        """check every value in `xs`.
+
+        Args:
+            xs (Iterable): values to check
+
+        Returns:
+            BatchResult: per value mask and failing indices
+        """
+        return BatchResult.from_mask([self(x) for x in xs])
+
 
 class LengthConstraint(Constraint):
 
@@ -46,51 +188,165 @@ class LengthConstraint(Constraint):
             raise InvalidConstraintError(self.__pyname__, 'must be positive')
         self.value = value
 
+    def _holds(self, length: t.Any) -> t.Any:
+        return NotImplemented
+
+    def batch(self, xs: t.Iterable) -> BatchResult:
+        # str arrays are checked with vectorized lengths
+        arr = as_numeric_array(xs, 'U') if hasattr(xs, 'dtype') else None
+        if arr is None:
+            return super().batch(xs)
+        return BatchResult.from_mask(self._holds(numpy().char.str_len(arr)))
+
 
 class MinLength(LengthConstraint):
 
     __pyname__ = 'min_length'
+    __json_type__ = 'string'
+    __template__ = 'len({x}) >= {value}'
 
     def __call__(self, x: t.Sized) -> bool:
         return len(x) >= self.value
 
+    def _holds(self, length: t.Any) -> t.Any:
+        return length >= self.value
+
 
 class MaxLength(LengthConstraint):
 
     __pyname__ = 'max_length'
+    __json_type__ = 'string'
+    __template__ = 'len({x}) <= {value}'
 
     def __call__(self, x: t.Sized) -> bool:
         return len(x) <= self.value
 
+    def _holds(self, length: t.Any) -> t.Any:
+        return length <= self.value
+
 
 class MinItems(MinLength):
 
     __pyname__ = 'min_items'
+    __json_type__ = 'array'
 
 
 class MaxItems(MaxLength):
 
     __pyname__ = 'max_items'
+    __json_type__ = 'array'
+
+
+class MinProperties(MinLength):
+
+    __pyname__ = 'min_properties'
+    __json_type__ = 'object'
+
+
+class MaxProperties(MaxLength):
+
+    __pyname__ = 'max_properties'
+    __json_type__ = 'object'
+
+
+class Required(Constraint):
+
+    __pyname__ = 'required'
+    __json_type__ = 'object'
+    __template__ = '{value}.issubset({x})'
+    __cost__ = 2
+
+    value: t.FrozenSet[str]
+
+    def __init__(self, value: t.Iterable[str]):
+        if isinstance(value, str) or not isinstance(value, t.Iterable):
+            raise InvalidConstraintError(self.__pyname__, 'must be a list of property names')
+        value = list(value)
+        if not all(isinstance(k, str) for k in value):
+            raise InvalidConstraintError(self.__pyname__, 'property names must be strings')
+        self.value = frozenset(value)
+
+    def __call__(self, x: t.Mapping) -> bool:
+        return self.value.issubset(x)
+
+
+def _freeze(x: t.Any) -> t.Hashable:
+    # hashable form of a json value, keeping booleans apart from the numbers they equal
+    if isinstance(x, dict):
+        return frozenset((k, _freeze(v)) for k, v in x.items())
+    if isinstance(x, list):
+        return tuple(_freeze(v) for v in x)
+    return type(x) is bool, x
+
+
+class UniqueItems(Constraint):
+
+    __pyname__ = 'unique_items'
+    __json_type__ = 'array'
+    __cost__ = 5
+
+    value: bool
+
+    def __init__(self, value: bool):
+        if not isinstance(value, bool):
+            raise InvalidConstraintError(self.__pyname__, 'must be a boolean')
+        self.value = value
+
+    def __call__(self, x: t.Sequence) -> bool:
+        return not self.value or len(set(map(_freeze, x))) == len(x)
+
+    def inline(self, x: str, bind: t.Callable[[t.Any], str]) -> str:
+        return f'{bind(self)}({x})' if self.value else 'True'
 
 
 class Pattern(Constraint):
 
     __pyname__ = 'pattern'
+    __json_type__ = 'string'
+    __cost__ = 4
 
     value: str
 
     def __init__(self, value: str):
         try:
-            self.expr = re.compile(value)
+            self.expr, self.match = pattern_cache.get(value)
         except (re.error, TypeError) as err:
             raise InvalidConstraintError(self.__pyname__, f'Invalid pattern : {err}')
+        self.value = value
 
     def __call__(self, s: str) -> bool:
-        return self.expr.match(s) is not None
+        return self.match(s)
+
+    def inline(self, x: str, bind: t.Callable[[t.Any], str]) -> str:
+        return f'{bind(self.match)}({x})'
+
+
+class StringFormat(Constraint):
+
+    __pyname__ = 'format'
+    __json_type__ = 'string'
+    __cost__ = 4
+
+    value: str
+
+    def __init__(self, value: t.Union[FormatEnum, str]):
+        try:
+            self.check = get_checker(value)
+        except (KeyError, TypeError):
+            raise InvalidConstraintError(self.__pyname__, f'Unknown format : {value}')
+        self.value = value.value if isinstance(value, FormatEnum) else value
+
+    def __call__(self, s: str) -> bool:
+        return self.check(s)
+
+    def inline(self, x: str, bind: t.Callable[[t.Any], str]) -> str:
+        return f'{bind(self.check)}({x})'
 
 
 class NumericConstraint(Constraint):
 
+    __json_type__ = 'number'
+
     @method_dispatch
     def __init__(self, value):
         raise InvalidConstraintError(self.__pyname__, 'must an numeric type')
@@ -103,10 +359,17 @@ class NumericConstraint(Constraint):
     def _(self, value: int):
         self.value = value
 
+    def batch(self, xs: t.Iterable) -> BatchResult:
+        arr = as_numeric_array(xs)
+        if arr is None:
+            return super().batch(xs)
+        return BatchResult.from_mask(self(arr))
+
 
 class Minimum(NumericConstraint):
 
     __pyname__ = 'minimum'
+    __template__ = '{x} >= {value}'
 
     value: Numeric
 
@@ -117,6 +380,7 @@ class Minimum(NumericConstraint):
 class Maximum(NumericConstraint):
 
     __pyname__ = 'maximum'
+    __template__ = '{x} <= {value}'
 
     value: Numeric
 
@@ -127,6 +391,7 @@ class Maximum(NumericConstraint):
 class ExclusiveMinimum(NumericConstraint):
 
     __pyname__ = 'exclusive_minimum'
+    __template__ = '{x} > {value}'
 
     value: Numeric
 
@@ -136,7 +401,8 @@ class ExclusiveMinimum(NumericConstraint):
 
 class ExclusiveMaximum(NumericConstraint):
 
-    __pyname__ = 'exclusive_maxiumum'
+    __pyname__ = 'exclusive_maximum'
+    __template__ = '{x} < {value}'
 
     value: Numeric
 
@@ -144,14 +410,72 @@ class ExclusiveMaximum(NumericConstraint):
         return x < self.value
 
 
+# floats scaled to integers below this round to the right integer, as the error in scaling them is
+# well under a half, and those integers have few enough digits that a float they map back to
+# exactly is written as that decimal, see `_scaled_multiple`
+_EXACT = 1e15
+
+
+def _as_fraction(x: t.Any) -> Fraction:
+    # floats stand for the shortest decimal that round trips, ie. what json they were parsed from.
+    # float's own repr, as subclasses like numpy's float64 may wrap it in their type's name, and
+    # numpy's fixed width ints are made python ints so they can't overflow.
+    if isinstance(x, float):
+        return Fraction(float.__repr__(x))
+    if isinstance(x, numbers.Integral):
+        return Fraction(int(x))
+    return Fraction(x)
+
+
+def _exact_multiple(divisor: Fraction, x: t.Any) -> bool:
+    try:
+        return _as_fraction(x) % divisor == 0
+    except (ValueError, OverflowError, TypeError):  # inf and nan
+        return False
+
+
+def _scaled_multiple(scale: float, units: int, step: int, x: t.Any) -> bool:
+    # whether x is a multiple of units / scale, where scale is a power of ten. A float is when its
+    # scaled value rounds to an integer n that maps back to exactly the same float, which can only
+    # be the float nearest n / scale, and so the decimal it's written as, as long as n is below
+    # `_EXACT`, and n is a multiple of units.
+    if type(x) is float:
+        n = x * scale
+        if -_EXACT < n < _EXACT:
+            n = round(n)
+            return n / scale == x and n % units == 0
+    elif type(x) is int:
+        return x % step == 0
+    return _exact_multiple(Fraction(units, int(scale)), x)
+
+
+def _fits(arr: 'np.ndarray', value: int) -> bool:
+    # ints outside the range of an integer array's dtype can't be used in arithmetic with it
+    if arr.dtype.kind not in 'iu':
+        return True
+    info = numpy().iinfo(arr.dtype)
+    return info.min <= value <= info.max
+
+
 class MultipleOf(NumericConstraint):
+    """`x` is an exact multiple of `value`.
+
+    How values are checked is decided once, from the type of `value` :
+        - ints use `%` directly, which is exact for ints and floats alike.
+        - floats are taken as the decimal they're written as, so `0.3` is a multiple of `0.1`.
+          Values are scaled by a power of ten into integers, falling back to exact fractions for
+          values too large to scale exactly.
+        - `Decimal` and `Fraction` values are compared as exact fractions.
+    """
 
     __pyname__ = 'multiple_of'
+    __template__ = '{x} % {value} == 0'
+    __cost__ = 2
 
-    value: Numeric
+    value: t.Union[Numeric, Decimal, Fraction]
 
     def _validate_value(self, value: Numeric) -> Numeric:
-        if value > 0:
+        if math.isfinite(value) and value > 0:
             return value
         raise InvalidConstraintError(self.__pyname__, 'must be > 0')
 
@@ -159,13 +483,77 @@ class MultipleOf(NumericConstraint):
     def __init__(self, value):
         raise InvalidConstraintError(self.__pyname__, 'must an numeric type')
 
+    @__init__.register
+    def _(self, value: int):
+        self.value = self._validate_value(value)
+        self._exact = Fraction(value)
+        self._check = self._int_multiple
+
     @__init__.register
     def _(self, value: float):
         self.value = self._validate_value(value)
+        self._exact = _as_fraction(value)
+        places = max(-Decimal(float.__repr__(value)).as_tuple().exponent, 0)
+        if places > 22:  # the power of ten itself isn't an exact float
+            self._check = self._fraction_multiple
+            return
+        scale = 10 ** places
+        units = int(self._exact * scale)
+        self._scaled = (float(scale), units, units // math.gcd(units, scale))
+        self._check = self._scaled_multiple
 
     @__init__.register
-    def _(self, value: int):
+    def _(self, value: Decimal):
         self.value = self._validate_value(value)
+        self._exact = Fraction(value)
+        self._check = self._fraction_multiple
 
-    def __call__(self, x: Numeric) -> bool:
+    @__init__.register
+    def _(self, value: Fraction):
+        self.value = self._validate_value(value)
+        self._exact = value
+        self._check = self._fraction_multiple
+
+    def _int_multiple(self, x: Numeric) -> bool:
         return x % self.value == 0
+
+    def _scaled_multiple(self, x: Numeric) -> bool:
+        return _scaled_multiple(*self._scaled, x)
+
+    def _fraction_multiple(self, x: Numeric) -> bool:
+        return _exact_multiple(self._exact, x)
+
+    def __call__(self, x: Numeric) -> bool:
+        return self._check(x)
+
+    def inline(self, x: str, bind: t.Callable[[t.Any], str]) -> str:
+        if self._check == self._int_multiple:
+            return super().inline(x, bind)
+        if self._check == self._scaled_multiple:
+            args = ', '.join(map(bind, self._scaled))
+            return f'{bind(_scaled_multiple)}({args}, {x})'
+        return f'{bind(_exact_multiple)}({bind(self._exact)}, {x})'
+
+    def batch(self, xs: t.Iterable) -> BatchResult:
+        arr = as_numeric_array(xs)
+        if arr is None or self._check == self._fraction_multiple:
+            return Constraint.batch(self, xs)
+        np = numpy()
+        if self._check == self._int_multiple:
+            if not _fits(arr, self.value):
+                return Constraint.batch(self, arr.tolist())
+            with np.errstate(invalid='ignore'):  # inf and nan
+                return BatchResult.from_mask(arr % self.value == 0)
+        scale, units, step = self._scaled
+        if arr.dtype.kind in 'iu':
+            if not _fits(arr, step):
+                return Constraint.batch(self, arr.tolist())
+            return BatchResult.from_mask(arr % step == 0)
+        with np.errstate(invalid='ignore', over='ignore'):
+            n = arr * scale
+            exact = np.abs(n) < _EXACT
+            n = np.rint(n)
+            mask = exact & (n / scale == arr) & (np.fmod(n, units) == 0)
+        for i in np.flatnonzero(~exact):  # too large to scale, or not finite
+            mask[i] = self(arr[i].item())
+        return BatchResult.from_mask(mask)
@@ -0,0 +1,216 @@
+"""checkers for each `Format`, selectable through a registry keyed by format name.
+
+Checkers take a string and return a bool. They're built from compiled patterns or small hand
+written parsers rather than parsing with the standard library and catching the exception, since
+most values being checked are expected to be valid and exceptions are expensive when they aren't.
+
+Pattern based checkers are compiled the first time they're looked up with `get_checker`, which
+keeps the larger patterns, eg. for iris and emails, from slowing down importing simpleschema.
+
+Examples:
+    >>> get_checker(Format.ipv4)('127.0.0.1')
+    True
+    >>> get_checker('date')('2019-02-29')
+    False
+"""
+import re
+from typing import Callable, Dict, Optional, Tuple, Union
+
+from simpleschema.formats import Format, FormatEnum
+
+
+FormatChecker = Callable[[str], bool]
+
+_checkers: Dict[str, FormatChecker] = {}
+_factories: Dict[str, Callable[[], FormatChecker]] = {}
+_patterns: Dict[str, Tuple[str, int]] = {}
+
+
+def _name(fmt: Union[FormatEnum, str]) -> str:
+    return fmt.value if isinstance(fmt, FormatEnum) else fmt
+
+
+def register(fmt: Union[FormatEnum, str]) -> Callable[[FormatChecker], FormatChecker]:
+    """decorator registering a checker for a format, replacing any existing checker.
+    """
+
+    def decorator(checker: FormatChecker) -> FormatChecker:
+        _factories.pop(_name(fmt), None)
+        _patterns.pop(_name(fmt), None)
+        _checkers[_name(fmt)] = checker
+        return checker
+
+    return decorator
+
+
+def get_checker(fmt: Union[FormatEnum, str]) -> FormatChecker:
+    """get the checker for a format.
+
+    Raises:
+        KeyError: if no checker is registered for the format
+    """
+    name = _name(fmt)
+    try:
+        return _checkers[name]
+    except KeyError:
+        checker = _checkers[name] = _factories.pop(name)()
+        return checker
+
+
+def get_pattern(fmt: Union[FormatEnum, str]) -> Optional[Tuple[str, int]]:
+    """the pattern and flags a format's checker fully matches, or None if it isn't pattern based.
+    """
+    return _patterns.get(_name(fmt))
+
+
+def _matcher(fmt: Format, expr: str, flags: int = 0):
+    """register a checker fully matching `expr`, compiled when it's first looked up.
+    """
+
+    def build() -> FormatChecker:
+        fullmatch = re.compile(expr, flags).fullmatch
+
+        def checker(s: str) -> bool:
+            return fullmatch(s) is not None
+
+        checker.__name__ = fmt.name
+        return checker
+
+    _checkers.pop(fmt.value, None)
+    _factories[fmt.value] = build
+    _patterns[fmt.value] = (expr, flags)
+
+
+# dates and times (RFC 3339 section 5.6)
+
+_DATE = re.compile(r'(\d{4})-(\d{2})-(\d{2})', re.ASCII)
+_TIME = re.compile(r'(\d{2}):(\d{2}):(\d{2})(?:\.\d+)?(?:[Zz]|[+-](\d{2}):(\d{2}))', re.ASCII)
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _valid_date(year: str, month: str, day: str) -> bool:
+    year, month, day = int(year), int(month), int(day)
+    if not 1 <= month <= 12 or day < 1:
+        return False
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        return day <= 29
+    return day <= _DAYS_IN_MONTH[month]
+
+
+def _valid_time(hour: str, minute: str, second: str, off_hour: str, off_minute: str) -> bool:
+    if int(hour) > 23 or int(minute) > 59 or int(second) > 60:
+        return False
+    return off_hour is None or (int(off_hour) <= 23 and int(off_minute) <= 59)
+
+
+@register(Format.date)
+def date(s: str) -> bool:
+    m = _DATE.fullmatch(s)
+    return m is not None and _valid_date(*m.groups())
+
+
+@register(Format.time)
+def time(s: str) -> bool:
+    m = _TIME.fullmatch(s)
+    return m is not None and _valid_time(*m.groups())
+
+
+@register(Format.date_time)
+def date_time(s: str) -> bool:
+    if len(s) < 20 or s[10] not in 'Tt':
+        return False
+    d = _DATE.fullmatch(s, 0, 10)
+    t = _TIME.fullmatch(s, 11)
+    return d is not None and t is not None and _valid_date(*d.groups()) and _valid_time(*t.groups())
+
+
+# hostnames (RFC 1123) and emails (RFC 5321 / RFC 6531 dot-atom local parts)
+
+_LABEL = r'[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?'
+_HOSTNAME = rf'(?=.{{1,253}}$){_LABEL}(?:\.{_LABEL})*'
+_IDN_LABEL = r'[^\W_](?:[^\W_]|-){0,62}(?<!-)'
+_IDN_HOSTNAME = rf'(?=.{{1,253}}$){_IDN_LABEL}(?:\.{_IDN_LABEL})*'
+_ATOM = r"[A-Za-z0-9!#$%&'*+/=?^_`{|}~-]+"
+_IDN_ATOM = r"(?:[A-Za-z0-9!#$%&'*+/=?^_`{|}~-]|[^\x00-\x7f\s])+"
+
+_matcher(Format.hostname, _HOSTNAME)
+_matcher(Format.idn_hostname, _IDN_HOSTNAME)
+_matcher(Format.email, rf'(?=.{{1,64}}@){_ATOM}(?:\.{_ATOM})*@{_HOSTNAME}')
+_matcher(
+    Format.idn_email, rf'(?=.{{1,64}}@){_IDN_ATOM}(?:\.{_IDN_ATOM})*@{_IDN_HOSTNAME}'
+)
+
+
+# ip addresses
+
+_OCTET = r'(?:25[0-5]|2[0-4][0-9]|1[0-9][0-9]|[1-9]?[0-9])'
+_HEXTET = re.compile(r'[0-9A-Fa-f]{1,4}')
+_IPV4 = rf'{_OCTET}(?:\.{_OCTET}){{3}}'
+
+_matcher(Format.ipv4, _IPV4)
+
+
+@register(Format.ipv6)
+def ipv6(s: str) -> bool:
+    head, sep, tail = s.partition('::')
+    head = head.split(':') if head else []
+    tail = tail.split(':') if tail else []
+    last = tail if sep else head
+    width = 0
+    if last and '.' in last[-1]:
+        if re.fullmatch(_IPV4, last.pop()) is None:
+            return False
+        width = 2
+    for group in head + tail:
+        if _HEXTET.fullmatch(group) is None:
+            return False
+    width += len(head) + len(tail)
+    return width < 8 if sep else width == 8
+
+
+# resource identifiers (RFC 3986 / RFC 3987) and templates (RFC 6570)
+
+_PCT = r'%[0-9A-Fa-f]{2}'
+_URI_CHAR = r"[A-Za-z0-9\-._~!$&'()*+,;=:@/?\[\]]"
+_IRI_CHAR = r"[A-Za-z0-9\-._~!$&'()*+,;=:@/?\[\]\u00a0-\U0010ffff]"
+_SCHEME = r'[A-Za-z][A-Za-z0-9+.\-]*:'
+
+
+def _identifier(char: str, scheme: str) -> str:
+    return rf'{scheme}(?:{char}|{_PCT})*(?:#(?:{char}|{_PCT})*)?'
+
+
+_matcher(Format.uri, _identifier(_URI_CHAR, _SCHEME))
+_matcher(Format.uri_reference, _identifier(_URI_CHAR, f'(?:{_SCHEME})?'))
+_matcher(Format.iri, _identifier(_IRI_CHAR, _SCHEME))
+_matcher(Format.iri_reference, _identifier(_IRI_CHAR, f'(?:{_SCHEME})?'))
+
+_VARCHAR = rf'(?:[A-Za-z0-9_]|{_PCT})'
+_VARSPEC = rf'{_VARCHAR}(?:\.?{_VARCHAR})*(?::[1-9][0-9]{{0,3}}|\*)?'
+_LITERAL = rf'(?:[^\x00-\x20"\'%<>\\^`{{|}}\x7f]|{_PCT})'
+_matcher(
+    Format.uri_template, rf'(?:{_LITERAL}|\{{[+#./;?&=,!@|]?{_VARSPEC}(?:,{_VARSPEC})*\}})*'
+)
+
+
+# json pointers (RFC 6901 / draft-handrews-relative-json-pointer)
+
+_POINTER = r'(?:/(?:[^~/]|~[01])*)*'
+_matcher(Format.json_pointer, _POINTER, re.DOTALL)
+_matcher(
+    Format.relative_json_pointer, rf'(?:0|[1-9][0-9]*)(?:#|{_POINTER})', re.DOTALL
+)
+
+
+# regular expressions
+
+
+@register(Format.regex)
+def regex(s: str) -> bool:
+    # there's no way to check a pattern short of compiling it, `re` caches the compiled pattern so
+    # the cost is only paid once for patterns which are then used.
+    try:
+        re.compile(s)
+    except re.error:
+        return False
+    return True
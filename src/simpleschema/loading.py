@@ -0,0 +1,250 @@
+"""build schema objects from json schema dicts, the reverse of `Schema.to_dict`.
+
+Keywords are mapped back onto schema fields through each schema class's reverse alias table,
+`_fields_by_alias`, built once per class, so `from_dict(schema.to_dict())` gives an equal schema
+whose `constraints()` are the `Constraint` classes of the same keywords, see
+`simpleschema.constraints.by_alias`. Annotations such as `$id`, `$schema` or `examples`, and the
+keywords of other types, eg. `minLength` in a number schema, are ignored as json schema does, and
+so are formats without a checker, eg. `uuid`. Subschemas may be booleans, accepting any value or
+none, but tuple form `items` aren't supported. Validation keywords no schema class supports, eg.
+`enum` or `anyOf`, raise `ValueError` rather than loading a schema accepting values the source
+schema rejects. Draft 4's boolean `exclusiveMinimum`
+and `exclusiveMaximum` are read as making `minimum` or `maximum` exclusive.
+
+A `SchemaLoader` shares a single schema object between every structurally identical schema or
+subschema it builds, so loading many schemas which repeat the same pieces builds, and later
+compiles, each piece once. `load_many` loads a whole batch through one loader. Loaders only hold
+weak references to the schemas they've built, so a long lived loader doesn't keep schemas which
+are no longer used alive.
+
+Examples:
+    >>> schema = from_dict({'type': 'string', 'minLength': 1, 'format': 'email'})
+    >>> type(schema).__name__, schema.min_length
+    ('StringSchema', 1)
+    >>> schema.constraints()
+    [MinLength(1), StringFormat('email')]
+    >>> a, b = load_many([{'type': 'integer', 'minimum': 0}] * 2)
+    >>> a is b
+    True
+"""
+import json
+import weakref
+from typing import IO, Any, Callable, Dict, Hashable, Iterable, List, Optional, Union
+
+from simpleschema.formats import Format
+from simpleschema.schema import (
+    ArraySchema,
+    BooleanSchema,
+    IntegerSchema,
+    NullSchema,
+    NumberSchema,
+    ObjectSchema,
+    StringSchema,
+)
+from simpleschema.schema.base import Schema
+from simpleschema.types import JSONABLE
+
+
+SchemaDict = Dict[str, JSONABLE]
+Resolver = Callable[[str], Schema]
+
+SCHEMA_CLASSES = {
+    cls.type: cls
+    for cls in (
+        StringSchema,
+        NumberSchema,
+        IntegerSchema,
+        BooleanSchema,
+        NullSchema,
+        ObjectSchema,
+        ArraySchema,
+    )
+}
+
+_BOUNDS = (('minimum', 'exclusiveMinimum'), ('maximum', 'exclusiveMaximum'))
+_NUMERIC = ('minimum', 'maximum', 'exclusiveMinimum', 'exclusiveMaximum', 'multipleOf')
+
+# validation keywords no schema class has a field for
+_UNSUPPORTED = frozenset(
+    (
+        'enum',
+        'const',
+        'allOf',
+        'anyOf',
+        'oneOf',
+        'not',
+        'if',
+        'then',
+        'else',
+        'dependencies',
+        'dependentRequired',
+        'dependentSchemas',
+        'propertyNames',
+        'contains',
+        'minContains',
+        'maxContains',
+        'prefixItems',
+        'unevaluatedItems',
+        'unevaluatedProperties',
+        '$dynamicRef',
+        '$recursiveRef',
+    )
+)
+
+_FORMATS = tuple(f.value for f in Format)
+
+_SUBSCHEMA_MAPS = ('properties', 'pattern_properties')
+_SUBSCHEMAS = ('items', 'additional_properties')
+
+
+def _no_refs(ref: str) -> Schema:
+    raise ValueError(f'cannot resolve $ref {ref!r} without a resolver')
+
+
+def _check_keywords(d: SchemaDict):
+    unsupported = sorted(_UNSUPPORTED.intersection(d))
+    if unsupported:
+        raise ValueError(f'unsupported keywords {", ".join(unsupported)} : {d!r}')
+
+
+def _draft4_bound(d: SchemaDict, bound: str, exclusive: str):
+    if bound not in d:
+        raise ValueError(f'boolean {exclusive} without {bound} : {d!r}')
+    if d.pop(exclusive):
+        d[exclusive] = d.pop(bound)
+
+
+def _draft4_bounds(d: SchemaDict) -> SchemaDict:
+    # draft 4 marks `minimum` and `maximum` exclusive with a boolean, later drafts give the bound
+    if not any(isinstance(d.get(k), bool) for k in _NUMERIC):
+        return d
+    d = dict(d)
+    for bound, exclusive in _BOUNDS:
+        if isinstance(d.get(exclusive), bool):
+            _draft4_bound(d, bound, exclusive)
+    for k in _NUMERIC:
+        if isinstance(d.get(k), bool):
+            raise ValueError(f'{k} must be a number, not a boolean : {d!r}')
+    return d
+
+
+def _normalized(d: SchemaDict) -> SchemaDict:
+    if d['type'] in ('number', 'integer'):
+        return _draft4_bounds(d)
+    if 'format' in d and d['format'] not in _FORMATS:
+        # like unknown keywords, formats without a checker are annotations
+        return {k: v for k, v in d.items() if k != 'format'}
+    return d
+
+
+def _typed(x: Any) -> Hashable:
+    # hashable form of a json value keeping the type of every value, so that schemas which only
+    # differ by eg. `1` and `1.0` aren't shared and each serializes back to its own json
+    if isinstance(x, dict):
+        return frozenset((k, _typed(v)) for k, v in x.items())
+    if isinstance(x, list):
+        return tuple(_typed(v) for v in x)
+    return type(x), x
+
+
+def _key(field: str, value: Any) -> Hashable:
+    # subschemas are already shared, so they're identified by their object
+    if isinstance(value, Schema):
+        return id(value)
+    if field in _SUBSCHEMA_MAPS:
+        return frozenset((k, _key(k, s)) for k, s in value.items())
+    return _typed(value)
+
+
+class SchemaLoader:
+    """builds schema objects from json schema dicts, sharing identical schemas and subschemas.
+
+    Built schemas are only shared while something else references them, and are frozen as they
+    may be shared, see `Schema.freeze`.
+
+    Args:
+        resolve (Optional[Resolver]): returns the schema object for a `$ref`, by default refs
+            raise `ValueError`.
+    """
+
+    def __init__(self, resolve: Optional[Resolver] = None):
+        self.resolve = resolve or _no_refs
+        # a schema holds its subschemas, so while a key is in the memo the subschemas whose ids it
+        # holds are alive, and the ids can't have been reused
+        self._memo: 'weakref.WeakValueDictionary[Hashable, Schema]' = weakref.WeakValueDictionary()
+
+    def __len__(self) -> int:
+        return len(self._memo)
+
+    def __call__(self, d: SchemaDict, resolve: Optional[Resolver] = None) -> Schema:
+        """build the schema object for a json schema dict.
+
+        Args:
+            d (SchemaDict): json schema, with a `type` or a `$ref`
+            resolve (Optional[Resolver]): overrides the loader's resolver for this schema
+
+        Raises:
+            ValueError: for a schema without a known type, an unresolved `$ref`, an unsupported
+                validation keyword, tuple form `items`, or a boolean numeric keyword other than
+                draft 4's exclusive bounds
+        """
+        resolve = resolve or self.resolve
+        if '$ref' in d:
+            return resolve(d['$ref'])
+        try:
+            cls = SCHEMA_CLASSES[d['type']]
+        except (KeyError, TypeError):
+            raise ValueError(f'cannot build a schema without a known type : {d!r}') from None
+        _check_keywords(d)
+        d = _normalized(d)
+        fields = cls._fields_by_alias
+        kwargs = {
+            fields[alias]: self._field(fields[alias], value, resolve)
+            for alias, value in d.items()
+            if alias in fields and alias != 'type'
+        }
+        key = (cls, frozenset((k, _key(k, v)) for k, v in kwargs.items()))
+        try:
+            return self._memo[key]
+        except KeyError:
+            schema = self._memo[key] = cls(**kwargs).freeze()
+            return schema
+
+    def _field(self, field: str, value: JSONABLE, resolve: Resolver) -> Any:
+        if field in _SUBSCHEMA_MAPS:
+            return {k: self._subschema(v, resolve) for k, v in value.items()}
+        if field == 'items' and isinstance(value, list):
+            raise ValueError(f'tuple form items, a list of schemas, are not supported : {value!r}')
+        if field in _SUBSCHEMAS:
+            return self._subschema(value, resolve)
+        return value
+
+    def _subschema(self, value: JSONABLE, resolve: Resolver) -> Union[bool, Schema]:
+        # boolean subschemas accept any value or none, and are kept as they are
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, dict):
+            return self(value, resolve)
+        raise ValueError(f'subschemas must be json schema objects or booleans, not {value!r}')
+
+
+def from_dict(d: SchemaDict, resolve: Optional[Resolver] = None) -> Schema:
+    """build the schema object for a json schema dict, see `SchemaLoader`.
+    """
+    return SchemaLoader(resolve)(d)
+
+
+def load(source: Union[str, bytes, IO], resolve: Optional[Resolver] = None) -> Schema:
+    """build the schema object for a json schema document, or a file object holding one.
+    """
+    d = json.load(source) if hasattr(source, 'read') else json.loads(source)
+    return from_dict(d, resolve)
+
+
+def load_many(
+    schemas: Iterable[SchemaDict], resolve: Optional[Resolver] = None
+) -> List[Schema]:
+    """build the schema objects for many json schema dicts, sharing identical (sub)schemas.
+    """
+    loader = SchemaLoader(resolve)
+    return [loader(d) for d in schemas]
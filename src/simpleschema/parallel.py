@@ -0,0 +1,124 @@
+"""validate many records in parallel with a process or thread pool.
+
+The schema is sent to each worker once, when the worker starts, and compiled there. Records are then
+streamed to the workers in chunks, with a bounded number of chunks in flight so memory use doesn't
+grow with the number of records.
+
+Examples:
+    >>> from simpleschema.schema import IntegerSchema
+    >>> list(validate_many(IntegerSchema(minimum=0), [1, -1, 2], backend='thread'))
+    [(0, True), (1, False), (2, True)]
+"""
+import os
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+from simpleschema.compiler import Validator, compile, get_validator
+
+
+CHUNK_SIZE = 1024
+
+_validate: Optional[Validator] = None
+
+
+def _init_process(schema):
+    global _validate
+    _validate = compile(schema)
+
+
+def _check(validate: Validator, start: int, chunk: List[Any]) -> Tuple[int, List[bool]]:
+    return start, [validate(record) for record in chunk]
+
+
+def _check_in_process(start: int, chunk: List[Any]) -> Tuple[int, List[bool]]:
+    return _check(_validate, start, chunk)
+
+
+def _chunks(records: Iterable[Any], size: int) -> Iterator[Tuple[int, List[Any]]]:
+    it = iter(records)
+    start = 0
+    chunk = list(islice(it, size))
+    while chunk:
+        yield start, chunk
+        start += len(chunk)
+        chunk = list(islice(it, size))
+
+
+def _executor(schema, backend: str, workers: int) -> Tuple[Executor, Callable]:
+    if backend == 'process':
+        executor = ProcessPoolExecutor(workers, initializer=_init_process, initargs=(schema,))
+        return executor, _check_in_process
+    if backend == 'thread':
+        validate = get_validator(schema)
+        return ThreadPoolExecutor(workers), lambda start, chunk: _check(validate, start, chunk)
+    raise ValueError(f"backend must be 'process' or 'thread' not {backend}")
+
+
+def _expand(future: Future) -> Iterator[Tuple[int, bool]]:
+    start, results = future.result()
+    return enumerate(results, start)
+
+
+def _ordered(
+    executor: Executor, check: Callable, chunks: Iterable, max_in_flight: int
+) -> Iterator[Tuple[int, bool]]:
+    in_flight = deque()
+    for start, chunk in chunks:
+        in_flight.append(executor.submit(check, start, chunk))
+        if len(in_flight) >= max_in_flight:
+            yield from _expand(in_flight.popleft())
+    while in_flight:
+        yield from _expand(in_flight.popleft())
+
+
+def _unordered(
+    executor: Executor, check: Callable, chunks: Iterable, max_in_flight: int
+) -> Iterator[Tuple[int, bool]]:
+    in_flight = set()
+    for start, chunk in chunks:
+        in_flight.add(executor.submit(check, start, chunk))
+        if len(in_flight) >= max_in_flight:
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from _expand(future)
+    for future in as_completed(in_flight):
+        yield from _expand(future)
+
+
+def validate_many(
+    schema,
+    records: Iterable[Any],
+    workers: Optional[int] = None,
+    backend: str = 'process',
+    chunk_size: int = CHUNK_SIZE,
+    ordered: bool = True,
+) -> Iterator[Tuple[int, bool]]:
+    """validate records against a schema in parallel.
+
+    Args:
+        schema: schema object or dict accepted by `compile`, must be picklable for the process
+            backend.
+        records (Iterable[Any]): records to validate, consumed lazily
+        workers (Optional[int]): number of workers, defaults to the number of cpus
+        backend (str): `'process'` or `'thread'`
+        chunk_size (int): number of records sent to a worker at a time
+        ordered (bool): yield results in record order, otherwise as each chunk completes
+
+    Yields:
+        Tuple[int, bool]: index of each record and whether it's valid
+    """
+    workers = workers or os.cpu_count() or 1
+    executor, check = _executor(schema, backend, workers)
+    collect = _ordered if ordered else _unordered
+    with executor:
+        yield from collect(executor, check, _chunks(records, chunk_size), workers * 2)
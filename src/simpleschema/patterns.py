@@ -0,0 +1,193 @@
+"""a process wide cache of compiled `Pattern` constraint expressions.
+
+`re` keeps its own cache of compiled patterns but it's small, so when many schemas are built from
+the same handful of patterns they get recompiled over and over. `PatternCache` holds them in a
+size bounded cache with either lru or fifo eviction.
+
+Each entry also holds a matcher, `str -> bool`, with `re.match` semantics. For simple patterns,
+anchored literals, prefixes and suffixes, the matcher is built from plain string operations and
+skips the regex engine entirely. Character class runs like `^[a-z]+$` are left to `re`, which
+matches them as fast as a set based check on short strings and much faster on long ones.
+
+Examples:
+    >>> cache = PatternCache(maxsize=2)
+    >>> cache.get('^boop$').match('boop')
+    True
+    >>> cache.stats()
+    CacheStats(hits=0, misses=1, evictions=0, size=1, maxsize=2)
+"""
+import re
+import threading
+from collections import OrderedDict
+from typing import Callable, NamedTuple, Optional, Tuple
+
+
+Matcher = Callable[[str], bool]
+
+_SPECIAL = set('.^$*+?{}[]\\|()')
+
+
+class CompiledPattern(NamedTuple):
+
+    expr: re.Pattern
+    match: Matcher
+
+
+class CacheStats(NamedTuple):
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+
+def _literal(s: str) -> Optional[str]:
+    out = []
+    chars = iter(s)
+    for c in chars:
+        if c == '\\':
+            c = next(chars, None)
+            if c is None or c.isalnum():
+                return None
+        elif c in _SPECIAL:
+            return None
+        if c == '\n':
+            return None
+        out.append(c)
+    return ''.join(out)
+
+
+def _dollar(test: Matcher) -> Matcher:
+    # `$` also matches just before a trailing newline.
+    def match(s: str) -> bool:
+        return test(s) or (s[-1:] == '\n' and test(s[:-1]))
+
+    return match
+
+
+def fast_matcher(pattern: str) -> Optional[Matcher]:
+    """build a matcher from string operations for simple patterns.
+
+    Handles `^lit`, `^lit$` and `^.*lit$`, with either `$` or `\\Z` as the end anchor (the leading
+    `^` is optional since `Pattern` uses match semantics).
+
+    Returns:
+        Optional[Matcher]: the matcher, or None if the pattern isn't simple enough
+    """
+    body, end = _split_anchors(pattern)
+    lit = _literal(body)
+    if lit is not None:
+        return _literal_matcher(lit, end)
+    if end and body.startswith('.*'):
+        lit = _literal(body[2:])
+        if lit:
+            return _suffix_matcher(lit, end)
+    return None
+
+
+def _split_anchors(pattern: str) -> Tuple[str, str]:
+    body = pattern[1:] if pattern.startswith('^') else pattern
+    for anchor in ('\\Z', '$'):
+        if body.endswith(anchor) and not body.endswith('\\' + anchor):
+            return body[: -len(anchor)], anchor
+    return body, ''
+
+
+def _literal_matcher(lit: str, end: str) -> Matcher:
+    if not end:
+        return lambda s: s.startswith(lit)
+    if end == '\\Z':
+        return lambda s: s == lit
+    with_newline = lit + '\n'
+    return lambda s: s == lit or s == with_newline
+
+
+def _suffix_matcher(lit: str, end: str) -> Matcher:
+    def test(s: str) -> bool:
+        return s.endswith(lit) and '\n' not in s
+
+    return test if end == '\\Z' else _dollar(test)
+
+
+def _regex_matcher(expr: re.Pattern) -> Matcher:
+    match = expr.match
+
+    def matcher(s: str) -> bool:
+        return match(s) is not None
+
+    return matcher
+
+
+class PatternCache:
+    """size bounded cache of compiled patterns.
+
+    Args:
+        maxsize (int): number of patterns to keep
+        policy (str): eviction policy, `'lru'` evicts the least recently used pattern and `'fifo'`
+            the oldest, which makes hits slightly cheaper.
+        fast (bool): use string operation matchers for simple patterns
+    """
+
+    policies = ('lru', 'fifo')
+
+    def __init__(self, maxsize: int = 4096, policy: str = 'lru', fast: bool = True):
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+        self.configure(maxsize, policy, fast)
+
+    def configure(self, maxsize: int = None, policy: str = None, fast: bool = None):
+        """change the cache settings, unset arguments are left unchanged. Clears the cache.
+        """
+        if policy is not None and policy not in self.policies:
+            raise ValueError(f'policy must be one of {self.policies}')
+        if maxsize is not None and maxsize < 1:
+            raise ValueError('maxsize must be >= 1')
+        with self._lock:
+            self.maxsize = maxsize or self.maxsize
+            self.policy = policy or self.policy
+            self.fast = self.fast if fast is None else fast
+            self._data.clear()
+
+    def get(self, pattern: str) -> CompiledPattern:
+        """get the compiled pattern, compiling and caching it on a miss.
+
+        Raises:
+            re.error: if the pattern is invalid
+            TypeError: if the pattern isn't a string
+        """
+        try:
+            compiled = self._data[pattern]
+        except KeyError:
+            return self._compile(pattern)
+        self.hits += 1
+        if self.policy == 'lru':
+            try:
+                self._data.move_to_end(pattern)
+            except KeyError:  # evicted by another thread
+                pass
+        return compiled
+
+    def _compile(self, pattern: str) -> CompiledPattern:
+        expr = re.compile(pattern)
+        match = (self.fast and fast_matcher(pattern)) or _regex_matcher(expr)
+        compiled = CompiledPattern(expr, match)
+        with self._lock:
+            self.misses += 1
+            self._data[pattern] = compiled
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+        return compiled
+
+    def stats(self) -> CacheStats:
+        return CacheStats(self.hits, self.misses, self.evictions, len(self._data), self.maxsize)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+
+pattern_cache = PatternCache()
@@ -0,0 +1,211 @@
+"""opt-in profiling of constraint and schema validation.
+
+While profiling is enabled every `Constraint` subclass's `__call__` is wrapped to record its call
+count, cumulative time and failures, and `Schema.validator` builds validators which call each
+constraint rather than inlining it, recording the same per schema. Disabling restores the original
+methods, so there's no cost at all when profiling isn't in use, not even a branch.
+
+Schemas are reported by their title, so schemas sharing a title, eg. one per tenant, are counted
+together. Untitled schemas are reported by class name and json. Constraints are reported by class
+name, and times are cumulative so they include any nested validation, eg. of object properties.
+
+Constraint classes defined while profiling is enabled aren't instrumented, and validators from
+`compile` or taken from `Schema.validator` before profiling started aren't either. Counts may be
+slightly off when validating from many threads at once.
+
+Examples:
+    >>> from simpleschema.schema import StringSchema
+    >>> schema = StringSchema(title='name', min_length=2)
+    >>> with profile() as stats:
+    ...     schema.validator()('a')
+    False
+    >>> stats.schemas['name'].calls, stats.constraints['MinLength'].failures
+    (1, 1)
+"""
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from simpleschema.compiler import Validator, compile
+from simpleschema.constraints import Constraint
+from simpleschema.schema.base import Schema
+
+
+class Stats:
+    """call count, cumulative time in seconds and number of failed calls.
+    """
+
+    __slots__ = ('calls', 'seconds', 'failures')
+
+    def __init__(self, calls: int = 0, seconds: float = 0.0, failures: int = 0):
+        self.calls = calls
+        self.seconds = seconds
+        self.failures = failures
+
+    @property
+    def failure_rate(self) -> float:
+        return self.failures / self.calls if self.calls else 0.0
+
+    def copy(self) -> 'Stats':
+        return Stats(self.calls, self.seconds, self.failures)
+
+    def __repr__(self) -> str:
+        return f'Stats(calls={self.calls}, seconds={self.seconds:.6f}, failures={self.failures})'
+
+
+class ProfileStats(NamedTuple):
+
+    constraints: Dict[str, Stats]
+    schemas: Dict[str, Stats]
+
+
+_constraint_stats: Dict[str, Stats] = defaultdict(Stats)
+_schema_stats: Dict[str, Stats] = defaultdict(Stats)
+
+_depth = 0
+_patched: List[Tuple[type, Optional[Callable]]] = []
+_original_validator = Schema.validator
+_validators: Dict[int, Tuple[Schema, Validator]] = {}
+
+
+def _timed_call(call: Callable, stats: Stats) -> Callable:
+    perf_counter = time.perf_counter
+
+    def __call__(self, x):
+        start = perf_counter()
+        ok = call(self, x)
+        stats.seconds += perf_counter() - start
+        stats.calls += 1
+        stats.failures += ok is False
+        return ok
+
+    return __call__
+
+
+def _timed_validator(validate: Validator, stats: Stats) -> Validator:
+    perf_counter = time.perf_counter
+
+    def timed(x):
+        start = perf_counter()
+        ok = validate(x)
+        stats.seconds += perf_counter() - start
+        stats.calls += 1
+        stats.failures += ok is False
+        return ok
+
+    timed.__source__ = getattr(validate, '__source__', None)
+    return timed
+
+
+def schema_label(schema: Schema) -> str:
+    """the name a schema's stats are reported under.
+    """
+    title = getattr(schema, 'title', None)
+    if title is not None:
+        return title
+    return f'{schema.__class__.__name__} {schema.to_json().decode()}'
+
+
+def _profiled_validator(self: Schema) -> Validator:
+    try:
+        return _validators[id(self)][1]
+    except KeyError:
+        validate = _timed_validator(compile(self, inline=False), _schema_stats[schema_label(self)])
+        # the schema is kept alive alongside its validator so its id can't be reused
+        _validators[id(self)] = (self, validate)
+        return validate
+
+
+def _constraint_classes() -> Iterator[type]:
+    seen, stack = set(), [Constraint]
+    while stack:
+        cls = stack.pop()
+        stack.extend(c for c in cls.__subclasses__() if c not in seen)
+        seen.update(cls.__subclasses__())
+        if not getattr(cls.__call__, '__isabstractmethod__', False):
+            yield cls
+
+
+def enable():
+    """start profiling, calls nest so profiling stops at the matching `disable`.
+    """
+    global _depth
+    _depth += 1
+    if _depth > 1:
+        return
+    # resolve every class's __call__ before patching any, subclasses inheriting it included
+    calls = [(cls, cls.__call__) for cls in _constraint_classes()]
+    for cls, call in calls:
+        _patched.append((cls, cls.__dict__.get('__call__')))
+        cls.__call__ = _timed_call(call, _constraint_stats[cls.__name__])
+    Schema.validator = _profiled_validator
+
+
+def disable():
+    """stop profiling, restoring the original methods.
+    """
+    global _depth
+    if _depth == 0:
+        return
+    _depth -= 1
+    if _depth > 0:
+        return
+    Schema.validator = _original_validator
+    _validators.clear()
+    while _patched:
+        cls, original = _patched.pop()
+        if original is None:
+            del cls.__call__
+        else:
+            cls.__call__ = original
+
+
+def is_enabled() -> bool:
+    return _depth > 0
+
+
+def stats() -> ProfileStats:
+    """a snapshot of the stats recorded since the last `reset`.
+    """
+    return ProfileStats(
+        {k: s.copy() for k, s in _constraint_stats.items()},
+        {k: s.copy() for k, s in _schema_stats.items()},
+    )
+
+
+def _since(before: Dict[str, Stats], after: Dict[str, Stats]) -> Dict[str, Stats]:
+    delta = {}
+    for k, s in after.items():
+        prior = before.get(k, Stats())
+        if s.calls > prior.calls:
+            delta[k] = Stats(
+                s.calls - prior.calls, s.seconds - prior.seconds, s.failures - prior.failures
+            )
+    return delta
+
+
+def reset():
+    """clear all recorded stats.
+    """
+    for s in (*_constraint_stats.values(), *_schema_stats.values()):
+        s.calls, s.seconds, s.failures = 0, 0.0, 0
+
+
+@contextmanager
+def profile() -> Iterator[ProfileStats]:
+    """profile the enclosed block.
+
+    Yields:
+        ProfileStats: empty until the block exits, then filled with the stats recorded within it
+    """
+    before = stats()
+    result = ProfileStats({}, {})
+    enable()
+    try:
+        yield result
+    finally:
+        disable()
+        after = stats()
+        result.constraints.update(_since(before.constraints, after.constraints))
+        result.schemas.update(_since(before.schemas, after.schemas))
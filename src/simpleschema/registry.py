@@ -0,0 +1,153 @@
+"""a registry of schemas by id, with `$ref`s between them resolved into direct object links.
+
+Schemas are added as json schema dicts, or loaded in bulk from a directory of json files, and built
+into schema objects the first time they're looked up. A subschema `{"$ref": "<id>"}` is replaced
+by the registered schema object itself, so a built schema holds no references to resolve and its
+validator is compiled straight through them. Looking a schema up is a single dict lookup.
+
+Registering a new definition for an id invalidates just that entry and the entries linking to it,
+which are rebuilt on their next lookup. Entries are built with a single `SchemaLoader`, so
+structurally identical schemas and subschemas across entries share one object and one validator.
+
+Schema objects are immutable, so recursive references, eg. a tree node whose children are nodes,
+can't be linked and raise `ValueError`. Refs are to registered ids only, json pointer fragments
+aren't supported.
+
+Examples:
+    >>> registry = SchemaRegistry()
+    >>> registry.add('name', {'type': 'string', 'minLength': 1})
+    >>> registry.add('user', {'type': 'object', 'properties': {'name': {'$ref': 'name'}}})
+    >>> registry['user'].properties['name'] is registry['name']
+    True
+    >>> registry.validator('user')({'name': ''})
+    False
+"""
+import json
+import os
+from typing import Any, Dict, Iterator, List, Set, Union
+
+from simpleschema.compiler import Validator
+from simpleschema.loading import SchemaDict, SchemaLoader
+from simpleschema.schema.base import Schema
+
+
+class SchemaRegistry:
+    """schemas by id, built on first lookup with their `$ref`s linked, see the module docs.
+    """
+
+    def __init__(self):
+        self._definitions: Dict[str, Union[SchemaDict, Schema]] = {}
+        self._built: Dict[str, Schema] = {}
+        # ids of the entries each entry's built schema links to, and the reverse
+        self._links: Dict[str, Set[str]] = {}
+        self._dependents: Dict[str, Set[str]] = {}
+        self._building: List[str] = []
+        self._loader = SchemaLoader()
+
+    def add(self, id_: str, schema: Union[SchemaDict, Schema]):
+        """register a json schema dict, or an already built schema object, under `id_`.
+
+        Replacing an existing entry invalidates it and every entry linking to it.
+        """
+        if id_ in self._definitions:
+            self.invalidate(id_)
+        self._definitions[id_] = schema
+
+    def load(self, path: str) -> str:
+        """register the json schema in a file, under its `$id` or else its file name.
+
+        Returns:
+            str: the id it was registered under
+        """
+        # json only parses str and bytes, so a memory map would be copied whole anyway, a plain read
+        # is one copy and a syscall cheaper
+        with open(path, 'rb') as f:
+            schema = json.loads(f.read())
+        id_ = schema.get('$id') or os.path.splitext(os.path.basename(path))[0]
+        self.add(id_, schema)
+        return id_
+
+    def load_directory(self, directory: str, suffix: str = '.json') -> List[str]:
+        """register every json schema file directly in `directory`.
+
+        Schemas are only parsed, not built, so unresolved refs are only reported on lookup, or for
+        every entry at once by `build`.
+
+        Returns:
+            List[str]: the ids registered, in file name order
+        """
+        names = sorted(e.name for e in os.scandir(directory) if e.name.endswith(suffix))
+        return [self.load(os.path.join(directory, name)) for name in names]
+
+    def invalidate(self, id_: str):
+        """drop the built schema for `id_` and every entry linking to it, to be rebuilt on lookup.
+        """
+        stack = [id_]
+        while stack:
+            key = stack.pop()
+            if self._built.pop(key, None) is None:
+                continue
+            for target in self._links.pop(key, ()):
+                self._dependents.get(target, set()).discard(key)
+            stack.extend(self._dependents.pop(key, ()))
+
+    def remove(self, id_: str):
+        """unregister `id_`, invalidating every entry linking to it.
+        """
+        self.invalidate(id_)
+        del self._definitions[id_]
+
+    def build(self) -> Dict[str, Schema]:
+        """build every entry, raising for the first unresolved or recursive ref.
+        """
+        return {id_: self[id_] for id_ in self._definitions}
+
+    def __getitem__(self, id_: str) -> Schema:
+        try:
+            return self._built[id_]
+        except KeyError:
+            return self._build(id_)
+
+    def _build(self, id_: str) -> Schema:
+        definition = self._definitions[id_]
+        if id_ in self._building:
+            chain = ' -> '.join(self._building[self._building.index(id_):] + [id_])
+            raise ValueError(f'recursive $ref cannot be linked : {chain}')
+        links = set()
+
+        def resolve(ref: str) -> Schema:
+            target = ref[:-1] if ref.endswith('#') else ref
+            if target not in self._definitions:
+                raise ValueError(f'unresolved $ref {ref!r} in {id_!r}')
+            links.add(target)
+            return self[target]
+
+        self._building.append(id_)
+        try:
+            schema = definition
+            if not isinstance(definition, Schema):
+                schema = self._loader(definition, resolve)
+        finally:
+            self._building.pop()
+        self._built[id_] = schema
+        self._links[id_] = links
+        for target in links:
+            self._dependents.setdefault(target, set()).add(id_)
+        return schema
+
+    def validator(self, id_: str) -> Validator:
+        """the compiled validator for the schema registered under `id_`.
+        """
+        return self[id_].validator()
+
+    def get(self, id_: str, default: Any = None) -> Any:
+        return self[id_] if id_ in self._definitions else default
+
+    def __contains__(self, id_: str) -> bool:
+        return id_ in self._definitions
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._definitions)
+
+    def __len__(self) -> int:
+        return len(self._definitions)
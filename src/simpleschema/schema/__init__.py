@@ -1 +1,2 @@
 from .atomics import StringSchema, NumberSchema, IntegerSchema, NullSchema, BooleanSchema
+from .compound import ObjectSchema, ArraySchema
@@ -1,49 +1,46 @@
-from typing import Union, ClassVar, get_type_hints
+from decimal import Decimal
+from fractions import Fraction
+from typing import Union, ClassVar, Iterable
 
-from simpleschema.formats import Format
-from simpleschema.utils import to_pascalcase
+from simpleschema.constraints import BatchResult, _as_fraction, as_numeric_array, numpy
+from simpleschema.formats import Format, FormatEnum
 from simpleschema.types import JSONABLE
-from simpleschema.schema.base import SchemaABC
+from simpleschema.schema.base import Schema
 
 
-class AtomicSchema(SchemaABC):
+class AtomicSchema(Schema):
 
-    def __init_subclass__(cls, **kwargs):
-        cls._fields = get_type_hints(cls)
-        cls._aliases = {k: to_pascalcase(k) for k in cls._fields}
-        super().__init_subclass__(**kwargs)
-
-    def __init__(self, **kwargs):
-        self.__dict__['_fields_set'] = ['type']
-        for k, v in kwargs.items():
-            setattr(self, k, v)
-
-    def __setattr__(self, k: str, v: JSONABLE):
-        if k not in self._fields:
-            raise ValueError(f'field {k} is invalid for {self.__class__.__name__}')
-
-        if k in self._fields_set:
-            raise ValueError(f'fields in a schema are immutable once set')
-
-        self.__dict__[k] = v
-        self._fields_set.append(k)
-
-    def to_dict(self):
-        return {self._aliases.get(k, k): getattr(self, k) for k in self._fields_set}
+    # kinds of ndarray dtypes whose values all pass the type check
+    _dtype_kinds = ''
 
 
 class StringSchema(AtomicSchema):
 
     type: ClassVar[str] = 'string'
+    _dtype_kinds = 'U'
     min_length: int
     max_length: int
     pattern: str
     format: Format
 
-    def __getattribute__(self, k: str):
+    def __setattr__(self, k: str, v: JSONABLE):
         if k == 'format':
-            return self.__dict__[k].value
-        return super().__getattribute__(k)
+            # members of any format enum, eg. `formats.Date.date_time`, or a format's name
+            v = v.value if isinstance(v, FormatEnum) else Format(v).value
+        super().__setattr__(k, v)
+
+
+def _json_number(value: Union[Decimal, Fraction]) -> Union[int, float]:
+    # the json number an exact value equals, a float standing for the decimal it's written as like
+    # it does for `MultipleOf`
+    if isinstance(value, Decimal) and not value.is_finite():
+        return float(value)
+    if value == int(value):
+        return int(value)
+    as_float = float(value)
+    if _as_fraction(as_float) != Fraction(value):
+        raise ValueError(f'{value!r} cannot be written exactly as a json number')
+    return as_float
 
 
 class BaseNumericSchema(AtomicSchema):
@@ -54,15 +51,36 @@ class BaseNumericSchema(AtomicSchema):
     exclusive_maximum: Union[int, float]
     multiple_of: Union[int, float]
 
+    def __setattr__(self, k: str, v: JSONABLE):
+        if isinstance(v, (Decimal, Fraction)):
+            v = _json_number(v)
+        super().__setattr__(k, v)
+
+    def batch(self, xs: Iterable) -> BatchResult:
+        """validate a column of values against this schema.
+
+        ndarrays of a matching dtype are checked with vectorized comparisons, anything else falls
+        back to the compiled validator per value.
+        """
+        arr = as_numeric_array(xs, self._dtype_kinds) if hasattr(xs, 'dtype') else None
+        if arr is None:
+            return super().batch(xs)
+        mask = numpy().ones(len(arr), dtype=bool)
+        for constraint in self.constraints():
+            mask &= constraint.batch(arr).mask
+        return BatchResult.from_mask(mask)
+
 
 class NumberSchema(BaseNumericSchema):
 
     type: ClassVar[str] = 'number'
+    _dtype_kinds = 'iuf'
 
 
 class IntegerSchema(BaseNumericSchema):
 
     type: ClassVar[str] = 'integer'
+    _dtype_kinds = 'iu'
 
 
 class NullSchema(AtomicSchema):
@@ -73,3 +91,4 @@ class NullSchema(AtomicSchema):
 class BooleanSchema(AtomicSchema):
 
     type: ClassVar[str] = 'boolean'
+    _dtype_kinds = 'b'
@@ -1,12 +1,274 @@
+import hashlib
+import json
 from abc import ABCMeta, abstractmethod
+from typing import Any, ClassVar, Dict, Iterable, Iterator, List, Tuple, get_type_hints
 
+from simpleschema.compiler import Validator, compile
+from simpleschema.constraints import BatchResult, Constraint, ValidationError, ValidationErrors
+from simpleschema.types import JSONABLE
+from simpleschema.utils import lazy_classattr, to_pascalcase
 
-class SchemaABC(metaclass=ABCMeta):
 
-    type: str
+class SchemaMeta(ABCMeta):
+    """metaclass generating `__slots__` for the fields a schema class declares.
+
+    Every annotated name which isn't a `ClassVar` and doesn't already have a class level value
+    gets a slot, alongside any `__slots__` declared explicitly, so schema instances carry no per
+    instance `__dict__`.
+    """
+
+    def __new__(mcs, name, bases, namespace, **kwargs):
+        namespace['__slots__'] = tuple(namespace.get('__slots__', ())) + tuple(
+            k
+            for k, v in namespace.get('__annotations__', {}).items()
+            if k not in namespace and getattr(v, '__origin__', None) is not ClassVar
+        )
+        return super().__new__(mcs, name, bases, namespace, **kwargs)
+
+
+class SchemaABC(metaclass=SchemaMeta):
+
+    type: ClassVar[str]
     title: str
     description: str
 
     @abstractmethod
     def to_dict(self):
         return NotImplemented
+
+
+NO_ERRORS: Tuple[ValidationError, ...] = ()
+
+_type_validators: Dict[str, Validator] = {}
+
+
+def _type_validator(type_: str) -> Validator:
+    try:
+        return _type_validators[type_]
+    except KeyError:
+        validate = _type_validators[type_] = compile({'type': type_})
+        return validate
+
+
+def json_pointer(path: str, key: Any) -> str:
+    """extend the json pointer `path` by an object key or array index.
+    """
+    return f"{path}/{str(key).replace('~', '~0').replace('/', '~1')}"
+
+
+def _serialize(v):
+    if isinstance(v, Schema):
+        return v._as_dict()
+    if isinstance(v, SchemaABC):
+        return v.to_dict()
+    if isinstance(v, dict):
+        return {k: _serialize(item) for k, item in v.items()}
+    if isinstance(v, (list, tuple)):
+        return [_serialize(item) for item in v]
+    return v
+
+
+class Schema(SchemaABC):
+    """base for schemas built from a fixed set of annotated fields, each immutable once set.
+    """
+
+    __slots__ = ('_mask', '_frozen', '_dict', '_json', '_validator', '_fingerprint', '__weakref__')
+
+    # field metadata is resolved on first use rather than when each schema class is defined, so
+    # importing or generating many schema classes stays cheap.
+
+    @lazy_classattr
+    def _fields(cls) -> Dict[str, type]:
+        return get_type_hints(cls)
+
+    @lazy_classattr
+    def _aliases(cls) -> Dict[str, str]:
+        return {k: to_pascalcase(k) for k in cls._fields}
+
+    @lazy_classattr
+    def _fields_by_alias(cls) -> Dict[str, str]:
+        return {alias: k for k, alias in cls._aliases.items()}
+
+    @lazy_classattr
+    def _bits(cls) -> Dict[str, int]:
+        return {k: 1 << i for i, k in enumerate(cls._fields)}
+
+    def __init_subclass__(cls, **kwargs):
+        for attr in _LAZY_FIELD_ATTRS:
+            setattr(cls, attr.name, attr)
+        super().__init_subclass__(**kwargs)
+
+    def __init__(self, **kwargs):
+        object.__setattr__(self, '_mask', self._bits['type'])
+        object.__setattr__(self, '_frozen', False)
+        self._clear_caches()
+        for k, v in kwargs.items():
+            setattr(self, k, v)
+
+    def __setattr__(self, k: str, v: JSONABLE):
+        try:
+            bit = self._bits[k]
+        except KeyError:
+            raise ValueError(f'field {k} is invalid for {self.__class__.__name__}') from None
+
+        if self._mask & bit:
+            raise ValueError(f'fields in a schema are immutable once set')
+        if self._frozen:
+            raise ValueError(f'{self.__class__.__name__} is frozen, no more fields can be set')
+
+        object.__setattr__(self, k, v)
+        object.__setattr__(self, '_mask', self._mask | bit)
+        self._clear_caches()
+
+    def freeze(self) -> 'Schema':
+        """stop any more fields being set on this schema, for instances shared between callers.
+
+        Returns:
+            Schema: this schema
+        """
+        object.__setattr__(self, '_frozen', True)
+        return self
+
+    def _clear_caches(self):
+        object.__setattr__(self, '_dict', None)
+        object.__setattr__(self, '_json', None)
+        object.__setattr__(self, '_validator', None)
+        object.__setattr__(self, '_fingerprint', None)
+
+    def __reduce__(self):
+        # pickle just the class and the fields set on it, caches are rebuilt on demand
+        fields = {k: getattr(self, k) for k in self._fields_set if k != 'type'}
+        return self.__class__, (), fields
+
+    def __setstate__(self, fields: Dict[str, JSONABLE]):
+        for k, v in fields.items():
+            setattr(self, k, v)
+
+    @property
+    def _fields_set(self) -> Tuple[str, ...]:
+        mask = self._mask
+        return tuple(k for k, bit in self._bits.items() if mask & bit)
+
+    def to_dict(self) -> Dict[str, JSONABLE]:
+        """the json schema dict for this schema, a fresh copy the caller is free to mutate.
+        """
+        return _serialize(self._as_dict())
+
+    def _as_dict(self) -> Dict[str, JSONABLE]:
+        # cached until another field is set, shared with the parent schemas' own cached dicts, so
+        # it never leaves the schema where it could be mutated under `to_json` and `fingerprint`
+        if self._dict is None:
+            d = {self._aliases[k]: _serialize(getattr(self, k)) for k in self._fields_set}
+            object.__setattr__(self, '_dict', d)
+        return self._dict
+
+    def to_json(self) -> bytes:
+        """the compact utf-8 encoded json for this schema, cached until another field is set.
+        """
+        if self._json is None:
+            encoded = json.dumps(self._as_dict(), separators=(',', ':')).encode()
+            object.__setattr__(self, '_json', encoded)
+        return self._json
+
+    def fingerprint(self) -> str:
+        """a stable hex digest of this schema's content, cached like `to_json`.
+
+        Schemas with the same json schema share a fingerprint whatever their class, and it's the
+        same across processes and runs, so it can key persistent caches.
+        """
+        if self._fingerprint is None:
+            canonical = json.dumps(self._as_dict(), sort_keys=True, separators=(',', ':'))
+            digest = hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+            object.__setattr__(self, '_fingerprint', digest)
+        return self._fingerprint
+
+    def constraints(self) -> List[Constraint]:
+        """build the `Constraint` instances for every constraint field set on this schema.
+        """
+        registry = Constraint.__registry__
+        return [registry[k](getattr(self, k)) for k in self._fields_set if k in registry]
+
+    def validator(self) -> Validator:
+        """the compiled validator for this schema, cached until another field is set.
+        """
+        if self._validator is None:
+            object.__setattr__(self, '_validator', compile(self))
+        return self._validator
+
+    def batch(self, xs: Iterable) -> BatchResult:
+        """validate a column of values against this schema.
+
+        Args:
+            xs (Iterable): values to validate
+
+        Returns:
+            BatchResult: per value mask and failing indices
+        """
+        validate = self.validator()
+        return BatchResult.from_mask([validate(x) for x in xs])
+
+    def validate(self, x: Any, fail_fast: bool = True):
+        """validate a value, raising if it's invalid.
+
+        Args:
+            x (Any): value to validate
+            fail_fast (bool): raise the first error found, otherwise collect every error and raise
+                them together.
+
+        Raises:
+            ValidationError: the first error, when failing fast
+            ValidationErrors: every error, when not failing fast
+        """
+        if self.validator()(x):
+            return
+        if fail_fast:
+            raise next(self.iter_errors(x))
+        raise ValidationErrors(tuple(self.iter_errors(x)))
+
+    def errors(self, x: Any, fail_fast: bool = False) -> Tuple[ValidationError, ...]:
+        """the errors for a value, empty if it's valid.
+
+        Valid values only pay for the compiled validator, the shared empty `NO_ERRORS` tuple is
+        returned for them without allocating anything.
+
+        Args:
+            x (Any): value to validate
+            fail_fast (bool): stop at the first error
+
+        Returns:
+            Tuple[ValidationError, ...]: the errors found
+        """
+        if self.validator()(x):
+            return NO_ERRORS
+        errors = self.iter_errors(x)
+        return (next(errors),) if fail_fast else tuple(errors)
+
+    def iter_errors(self, x: Any, path: str = '') -> Iterator[ValidationError]:
+        """yield an error for each constraint `x` fails, lazily and in field order.
+
+        The compiled validator is tried first so valid values, and valid parts of nested values,
+        are skipped at its cost.
+
+        Args:
+            x (Any): value to validate
+            path (str): json pointer to `x`, prefixing the path of each error
+        """
+        if self.validator()(x):
+            return
+        if not _type_validator(self.type)(x):
+            yield ValidationError(path, 'type', f'is not of type {self.type}')
+        else:
+            yield from self._iter_errors(x, path)
+
+    def _iter_errors(self, x: Any, path: str) -> Iterator[ValidationError]:
+        # errors from the constraint fields, subschemas are checked by subclasses
+        registry = Constraint.__registry__
+        for k in self._fields_set:
+            if k in registry:
+                value = getattr(self, k)
+                if not registry[k](value)(x):
+                    alias = self._aliases[k]
+                    yield ValidationError(path, alias, f'does not satisfy {alias} {value!r}')
+
+
+_LAZY_FIELD_ATTRS = tuple(v for v in vars(Schema).values() if isinstance(v, lazy_classattr))
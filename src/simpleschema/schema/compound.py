@@ -0,0 +1,157 @@
+from typing import Any, Callable, ClassVar, Dict, Iterator, List, Tuple, Union
+
+from simpleschema.compiler import Validator
+from simpleschema.constraints import Constraint, ValidationError
+from simpleschema.patterns import pattern_cache
+from simpleschema.schema.base import Schema, SchemaABC, json_pointer
+
+
+def _reject(x: Any) -> bool:
+    return False
+
+
+def _checks(schema: Union[bool, Schema]) -> Tuple[Validator, ...]:
+    # `True` accepts any value and `False` none, as boolean subschemas do in json schema
+    if schema is True:
+        return ()
+    if schema is False:
+        return (_reject,)
+    return (schema.validator(),)
+
+
+class PropertyIndex(Constraint):
+    """checks each property of an object against the subschemas which apply to it.
+
+    The validators that apply to a property name, from `properties`, every matching
+    `pattern_properties` pattern and otherwise `additional_properties`, are resolved the first time
+    the name is seen and memoized (up to `max_names` names), so checking an object costs a single
+    dict lookup per key with no rescanning of the patterns.
+    """
+
+    __json_type__ = 'object'
+    __cost__ = 8
+
+    max_names = 4096
+
+    def __init__(
+        self,
+        properties: Dict[str, Union[bool, Schema]],
+        pattern_properties: Dict[str, Union[bool, Schema]],
+        additional_properties: Union[bool, Schema] = True,
+    ):
+        self.properties = {k: _checks(s) for k, s in properties.items()}
+        self.patterns = [
+            (pattern_cache.get(p).match, _checks(s)) for p, s in pattern_properties.items()
+        ]
+        self.additional = _checks(additional_properties)
+        self.plan: Dict[Any, Tuple[Validator, ...]] = dict(self.properties)
+
+    def resolve(self, key: Any) -> Tuple[Validator, ...]:
+        matched = ()
+        if isinstance(key, str):
+            matched = tuple(v for match, checks in self.patterns if match(key) for v in checks)
+        if key in self.properties:
+            checks = self.properties[key] + matched
+        else:
+            checks = matched or self.additional
+        if len(self.plan) < self.max_names:
+            self.plan[key] = checks
+        return checks
+
+    def __call__(self, x: Dict[str, Any]) -> bool:
+        plan = self.plan
+        for k, v in x.items():
+            checks = plan.get(k)
+            if checks is None:
+                checks = self.resolve(k)
+            for check in checks:
+                if not check(v):
+                    return False
+        return True
+
+    def inline(self, x: str, bind: Callable[[Any], str]) -> str:
+        return f'{bind(self)}({x})'
+
+
+class Items(Constraint):
+
+    __json_type__ = 'array'
+    __template__ = 'all(map({value}, {x}))'
+    __cost__ = 8
+
+    def __init__(self, value: Validator):
+        self.value = value
+
+    def __call__(self, x: List[Any]) -> bool:
+        return all(map(self.value, x))
+
+
+class ObjectSchema(Schema):
+
+    type: ClassVar[str] = 'object'
+    properties: Dict[str, Union[bool, SchemaABC]]
+    pattern_properties: Dict[str, Union[bool, SchemaABC]]
+    additional_properties: Union[bool, SchemaABC]
+    required: List[str]
+    min_properties: int
+    max_properties: int
+
+    _subschema_fields = ('properties', 'pattern_properties', 'additional_properties')
+
+    def constraints(self) -> List[Constraint]:
+        constraints = super().constraints()
+        if any(hasattr(self, k) for k in self._subschema_fields):
+            index = PropertyIndex(
+                getattr(self, 'properties', {}),
+                getattr(self, 'pattern_properties', {}),
+                getattr(self, 'additional_properties', True),
+            )
+            constraints.append(index)
+        return constraints
+
+    def _subschemas(self, key: Any) -> List[Tuple[str, Union[bool, SchemaABC]]]:
+        # the subschemas applying to a property, with the keyword each is from
+        properties = getattr(self, 'properties', {})
+        matched = [
+            ('patternProperties', s)
+            for p, s in getattr(self, 'pattern_properties', {}).items()
+            if isinstance(key, str) and pattern_cache.get(p).match(key)
+        ]
+        if key in properties:
+            return [('properties', properties[key])] + matched
+        return matched or [('additionalProperties', getattr(self, 'additional_properties', True))]
+
+    def _iter_errors(self, x: Dict[str, Any], path: str) -> Iterator[ValidationError]:
+        yield from super()._iter_errors(x, path)
+        if not any(hasattr(self, k) for k in self._subschema_fields):
+            return
+        for k, v in x.items():
+            for keyword, schema in self._subschemas(k):
+                if schema is False:
+                    yield ValidationError(json_pointer(path, k), keyword, 'is not allowed')
+                elif schema is not True:
+                    yield from schema.iter_errors(v, json_pointer(path, k))
+
+
+class ArraySchema(Schema):
+
+    type: ClassVar[str] = 'array'
+    items: Union[bool, SchemaABC]
+    min_items: int
+    max_items: int
+    unique_items: bool
+
+    def constraints(self) -> List[Constraint]:
+        constraints = super().constraints()
+        if getattr(self, 'items', True) is not True:
+            constraints.append(Items(_checks(self.items)[0]))
+        return constraints
+
+    def _iter_errors(self, x: List[Any], path: str) -> Iterator[ValidationError]:
+        yield from super()._iter_errors(x, path)
+        items = getattr(self, 'items', True)
+        for i, item in enumerate(x if items is not True else ()):
+            if items is False:
+                yield ValidationError(json_pointer(path, i), 'items', 'is not allowed')
+            else:
+                yield from items.iter_errors(item, json_pointer(path, i))
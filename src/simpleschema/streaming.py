@@ -0,0 +1,238 @@
+"""streaming validation of NDJSON and large JSON arrays.
+
+Both validators read their source a chunk at a time and yield a `RecordResult` for each record as
+soon as it's been read, so memory use is bounded by the chunk size and the largest single record
+rather than the size of the document. Schemas are compiled once, see
+`simpleschema.compiler.get_validator`.
+
+Sources may be binary or text file objects, or any iterable of `bytes` (or `str`) chunks. Positions
+are reported as 1 based line numbers and 0 based byte offsets into the utf-8 encoded stream.
+
+Examples:
+    >>> from simpleschema.schema import IntegerSchema
+    >>> for result in validate_ndjson(IntegerSchema(minimum=0), [b'1\\n-1\\n', b'x\\n']):
+    ...     print(result.line, result.offset, result.error)
+    1 0 None
+    2 2 does not match schema
+    3 5 invalid json : Expecting value
+"""
+import codecs
+import json
+import re
+from typing import Any, Iterable, Iterator, NamedTuple, Optional, Tuple, Union, IO
+
+from simpleschema.compiler import get_validator
+
+
+Source = Union[IO, Iterable[bytes], Iterable[str]]
+
+CHUNK_SIZE = 1 << 16
+MAX_RECORD_SIZE = 1 << 26
+SCHEMA_MISMATCH = 'does not match schema'
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+
+class RecordResult(NamedTuple):
+
+    index: int
+    line: int
+    offset: int
+    value: Any
+    error: Optional[str]
+
+    @property
+    def valid(self) -> bool:
+        return self.error is None
+
+
+class StreamError(ValueError):
+
+    pass
+
+
+def _chunks(source: Source, chunk_size: int) -> Iterator[bytes]:
+    if hasattr(source, 'read'):
+        read = source.read
+        source = iter(lambda: read(chunk_size), read(0))
+    for chunk in source:
+        yield chunk.encode() if isinstance(chunk, str) else chunk
+
+
+def _lines(chunks: Iterable[bytes]) -> Iterator[Tuple[int, int, bytes]]:
+    lineno, offset, pending = 0, 0, []
+    for chunk in chunks:
+        *complete, last = chunk.split(b'\n')
+        for part in complete:
+            pending.append(part)
+            line = b''.join(pending)
+            pending = []
+            lineno += 1
+            yield lineno, offset, line
+            offset += len(line) + 1
+        if last:
+            pending.append(last)
+    if pending:
+        yield lineno + 1, offset, b''.join(pending)
+
+
+def validate_ndjson(
+    schema, source: Source, chunk_size: int = CHUNK_SIZE
+) -> Iterator[RecordResult]:
+    """validate each line of an NDJSON stream against a schema, skipping blank lines.
+
+    Lines which aren't valid json are reported with the position of the decoding error and
+    validation carries on with the next line.
+
+    Args:
+        schema: schema object or dict accepted by `compile`
+        source (Source): file object or iterable of chunks
+        chunk_size (int): bytes to read at a time from file objects
+
+    Yields:
+        RecordResult: result for each record
+    """
+    validate = get_validator(schema)
+    index = 0
+    for lineno, offset, raw in _lines(_chunks(source, chunk_size)):
+        if not raw.strip():
+            continue
+        try:
+            text = raw.decode('utf-8')
+        except UnicodeDecodeError as err:
+            error = f'invalid utf-8 : {err.reason}'
+            yield RecordResult(index, lineno, offset + err.start, None, error)
+        else:
+            try:
+                value = json.loads(text)
+            except json.JSONDecodeError as err:
+                pos = offset + len(text[: err.pos].encode())
+                yield RecordResult(index, lineno, pos, None, f'invalid json : {err.msg}')
+            else:
+                yield RecordResult(
+                    index, lineno, offset, value, None if validate(value) else SCHEMA_MISMATCH
+                )
+        index += 1
+
+
+class _TextStream:
+    """incrementally decoded text, tracking the line and byte offset of the read position.
+    """
+
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = chunks
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self.buf = ''
+        self.pos = 0
+        self.line = 1
+        self.offset = 0
+        self.exhausted = False
+
+    def more(self, size: int = 0) -> bool:
+        """read another chunk, and more until `size` characters past the read position are buffered.
+        """
+        if self.exhausted:
+            return False
+        parts = [self.buf[self.pos:]]
+        buffered = len(parts[0])
+        while not self.exhausted and (len(parts) == 1 or buffered < size):
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self.exhausted = True
+                text = self._decoder.decode(b'', final=True)
+            else:
+                text = self._decoder.decode(chunk)
+            parts.append(text)
+            buffered += len(text)
+        # joined once, so reading a large value a chunk at a time isn't quadratic in its size
+        self.buf = ''.join(parts)
+        self.pos = 0
+        return True
+
+    def advance(self, end: int):
+        consumed = self.buf[self.pos:end]
+        self.line += consumed.count('\n')
+        self.offset += len(consumed.encode())
+        self.pos = end
+
+    def peek(self) -> Optional[str]:
+        """skip whitespace and return the next character, or None at the end of the stream.
+        """
+        while True:
+            self.advance(_WHITESPACE.match(self.buf, self.pos).end())
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.more():
+                return None
+
+    def decode(self, decoder: json.JSONDecoder, max_size: int) -> Any:
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError as err:
+                if self.exhausted or len(self.buf) - self.pos > max_size:
+                    self.advance(err.pos)
+                    raise StreamError(f'invalid json : {err.msg}') from None
+            else:
+                # a value running up to the end of the buffer may be cut short, eg. a number
+                if end < len(self.buf) or self.exhausted:
+                    self.advance(end)
+                    return value
+            # the value is parsed again from its start, so the buffered text is doubled before
+            # each retry to keep the parsing of a value spanning many chunks linear in its size
+            self.more(min(2 * (len(self.buf) - self.pos), max_size + 1))
+
+
+def _elements(stream: _TextStream, max_size: int) -> Iterator[Tuple[int, int, Any]]:
+    decoder = json.JSONDecoder()
+    if stream.peek() != '[':
+        raise StreamError('expected a json array')
+    stream.advance(stream.pos + 1)
+    delimiter = stream.peek()
+    if delimiter == ']':
+        stream.advance(stream.pos + 1)
+    while delimiter != ']':
+        stream.peek()
+        line, offset = stream.line, stream.offset
+        yield line, offset, stream.decode(decoder, max_size)
+        delimiter = stream.peek()
+        if delimiter not in (',', ']'):
+            raise StreamError("expected ',' or ']'")
+        stream.advance(stream.pos + 1)
+    if stream.peek() is not None:
+        raise StreamError('extra data after array')
+
+
+def validate_json_array(
+    schema,
+    source: Source,
+    chunk_size: int = CHUNK_SIZE,
+    max_record_size: int = MAX_RECORD_SIZE,
+) -> Iterator[RecordResult]:
+    """validate each element of a json document holding a top level array against a schema.
+
+    Malformed json can't be recovered from, so a malformed document yields a final result carrying
+    the error and its position, and stops.
+
+    Args:
+        schema: schema object or dict accepted by `compile`
+        source (Source): file object or iterable of chunks
+        chunk_size (int): bytes to read at a time from file objects
+        max_record_size (int): characters a single element may span before it's considered
+            malformed, bounding memory use.
+
+    Yields:
+        RecordResult: result for each element
+    """
+    validate = get_validator(schema)
+    stream = _TextStream(_chunks(source, chunk_size))
+    index = 0
+    try:
+        for line, offset, value in _elements(stream, max_record_size):
+            error = None if validate(value) else SCHEMA_MISMATCH
+            yield RecordResult(index, line, offset, value, error)
+            index += 1
+    except StreamError as err:
+        yield RecordResult(index, stream.line, stream.offset, None, str(err))
+    except UnicodeDecodeError as err:
+        yield RecordResult(index, stream.line, stream.offset, None, f'invalid utf-8 : {err.reason}')
@@ -1,6 +1,7 @@
 """generic utilities used by the simpleschema lib.
 """
-from typing import Callable
+from typing import Any, Callable, Dict, Optional
+from types import MethodType
 import functools
 
 
@@ -19,7 +20,79 @@ def to_pascalcase(s: str) -> str:
     return f'{first}{"".join([word.title() for word in other])}'
 
 
-def method_dispatch(f: Callable) -> Callable:
+class lazy_classattr:
+    """a class attribute computed from the class the first time it's looked up, then stored on it.
+
+    The stored value shadows the descriptor for the class and its subclasses, so a subclass that
+    needs its own value must have the descriptor set on it again, eg. in `__init_subclass__`.
+
+    Args:
+        f (Callable[[type], Any]): computes the value from the class
+        name (str): attribute name, defaults to the name it's assigned to in a class body
+    """
+
+    def __init__(self, f: Callable[[type], Any], name: Optional[str] = None):
+        self.f = f
+        self.name = name or f.__name__
+        self.__doc__ = f.__doc__
+
+    def __set_name__(self, owner: type, name: str):
+        self.name = name
+
+    def __get__(self, instance, owner: type) -> Any:
+        value = self.f(owner)
+        setattr(owner, self.name, value)
+        return value
+
+
+class MethodDispatcher:
+    """single dispatch descriptor for methods, dispatching on the first arguement *after* self.
+
+    Resolved handlers are cached per argument class in a plain dict so repeated calls skip
+    `singledispatch` resolution entirely. The cache is cleared whenever a new handler is registered.
+    Note that registering a virtual subclass on an ABC after a class has been resolved won't be
+    seen.
+
+    Args:
+        f (Callable): default implementation, called when no registered type matches
+    """
+
+    def __init__(self, f: Callable):
+        self.dispatcher = functools.singledispatch(f)
+        self.cache: Dict[type, Callable] = {}
+        self.owner = None
+        functools.update_wrapper(self, f)
+
+    def __set_name__(self, owner: type, name: str):
+        self.owner = owner
+        self.__name__ = name
+
+    def __get__(self, instance, owner: type) -> Callable:
+        if instance is None:
+            return self
+        return MethodType(self, instance)
+
+    def __call__(self, instance, *args, **kw):
+        cls = args[0].__class__
+        try:
+            handler = self.cache[cls]
+        except KeyError:
+            handler = self.dispatch(cls)
+        return handler(instance, *args, **kw)
+
+    def register(self, cls, func: Optional[Callable] = None) -> Callable:
+        self.cache.clear()
+        return self.dispatcher.register(cls, func)
+
+    def dispatch(self, cls: type) -> Callable:
+        try:
+            return self.cache[cls]
+        except KeyError:
+            handler = self.cache[cls] = self.dispatcher.dispatch(cls)
+            return handler
+
+
+def method_dispatch(f: Callable) -> MethodDispatcher:
     """a single dispatch wrapper for methods. Inspects the first arguement *after* self.
 
     functools standard `singledispatch` decorator looks at the first arg, to find the type and so it
@@ -30,13 +103,6 @@ def method_dispatch(f: Callable) -> Callable:
         f (Callable): method to decorate as single dispatch
 
     Returns:
-        Callable: decorated method
+        MethodDispatcher: decorated method
     """
-    dispatcher = functools.singledispatch(f)
-
-    @functools.wraps(f)
-    def wrapper(self, *args, **kw):
-        return dispatcher.dispatch(args[0].__class__)(self, *args, **kw)
-
-    wrapper.register = dispatcher.register
-    return wrapper
+    return MethodDispatcher(f)
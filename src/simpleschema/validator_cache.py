@@ -0,0 +1,175 @@
+"""a size bounded on disk cache of compiled validators, keyed by schema fingerprint.
+
+A cache miss generates a standalone validator module with `simpleschema.codegen`, compiles it to
+bytecode and stores the marshalled code object under the schema's fingerprint. A hit only has to
+unmarshal and run that code, skipping both building the validator from the schema and compiling
+python source, so a restarted worker with a warm cache pays next to nothing per schema.
+
+Entries are written atomically, so several processes can share a directory. Marshalled code is
+specific to the python version, and generated code to the modules generating it, so the python
+version and a digest of those modules are part of each entry's name. Once the entries outgrow
+`max_bytes` the least recently used are removed.
+
+Schemas which can't be generated as standalone code, eg. using custom format checkers, fall back to
+`Schema.validator` and aren't stored.
+
+Examples:
+    >>> import tempfile
+    >>> from simpleschema.schema import StringSchema
+    >>> cache = ValidatorCache(tempfile.mkdtemp())
+    >>> cache.get(StringSchema(min_length=1))('boop')
+    True
+"""
+import builtins
+import hashlib
+import marshal
+import os
+import sys
+import tempfile
+import threading
+from typing import Dict, List, Tuple
+
+from simpleschema import algebra, codegen, compiler, constraints, format_checkers, patterns
+from simpleschema.codegen import generate
+from simpleschema.compiler import Validator
+from simpleschema.schema.base import Schema
+
+
+MAX_BYTES = 64 << 20
+
+
+def _digest(*modules) -> str:
+    # generated code changes with these modules' code, which a release version doesn't track
+    digest = hashlib.blake2b(digest_size=8)
+    for module in modules:
+        with open(module.__file__, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+CODEGEN_DIGEST = _digest(algebra, codegen, compiler, constraints, format_checkers, patterns)
+
+SUFFIX = f'.{sys.implementation.cache_tag}-simpleschema-{CODEGEN_DIGEST}.bin'
+
+_NAME = 'validate'
+
+
+class ValidatorCache:
+    """on disk cache of compiled validators.
+
+    Validators loaded or built are also kept in memory, so each is only read from disk once per
+    process.
+
+    Args:
+        directory (str): where entries are stored, created if it doesn't exist
+        max_bytes (int): total size of the entries to keep
+    """
+
+    def __init__(self, directory: str, max_bytes: int = MAX_BYTES):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = self.misses = 0
+        self._loaded: Dict[str, Validator] = {}
+        self._lock = threading.Lock()
+        self._size = sum(size for _, size, _ in self._entries())
+
+    def path(self, fingerprint: str) -> str:
+        return os.path.join(self.directory, fingerprint + SUFFIX)
+
+    def get(self, schema: Schema) -> Validator:
+        """the validator for a schema, loaded from disk or built and stored.
+        """
+        fingerprint = schema.fingerprint()
+        try:
+            return self._loaded[fingerprint]
+        except KeyError:
+            pass
+        validate = self._load(fingerprint)
+        if validate is None:
+            validate = self._build(schema, fingerprint)
+        self._loaded[fingerprint] = validate
+        return validate
+
+    def _load(self, fingerprint: str) -> Validator:
+        path = self.path(fingerprint)
+        try:
+            with open(path, 'rb') as f:
+                code = marshal.loads(f.read())
+        except FileNotFoundError:
+            return None
+        except (EOFError, ValueError, TypeError):  # a corrupt entry is rebuilt
+            return None
+        try:
+            os.utime(path)
+        except OSError:  # evicted by another process
+            pass
+        self.hits += 1
+        return self._exec(code)
+
+    def _build(self, schema: Schema, fingerprint: str) -> Validator:
+        self.misses += 1
+        try:
+            source = generate({_NAME: schema})
+        except ValueError:
+            return schema.validator()
+        code = builtins.compile(source, f'<simpleschema validator {fingerprint}>', 'exec')
+        self._store(fingerprint, marshal.dumps(code))
+        return self._exec(code)
+
+    @staticmethod
+    def _exec(code) -> Validator:
+        namespace = {}
+        exec(code, namespace)
+        return namespace[_NAME]
+
+    def _store(self, fingerprint: str, data: bytes):
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, self.path(fingerprint))
+        with self._lock:
+            self._size += len(data)
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _entries(self) -> List[Tuple[str, int, float]]:
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(SUFFIX):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((entry.path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def _evict(self):
+        # other processes may be writing too, so the size is recounted from the directory
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        self._size = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if self._size <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            self._size -= size
+
+    def size(self) -> int:
+        """bytes used by the entries, as last counted.
+        """
+        return self._size
+
+    def clear(self):
+        """remove every entry, from disk and memory.
+        """
+        with self._lock:
+            for path, _, _ in self._entries():
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+            self._size = 0
+            self._loaded.clear()
@@ -0,0 +1,94 @@
+import pytest
+
+from simpleschema import adaptive
+from simpleschema.adaptive import AdaptiveValidator, FailureStats
+from simpleschema.constraints import MaxLength, MinLength, Pattern
+from simpleschema.schema import IntegerSchema, StringSchema
+
+
+def _adaptive(schema, **kwargs):
+    return AdaptiveValidator(schema, stats=FailureStats(), **kwargs)
+
+
+def test_results_match_compiled_validator():
+    schema = StringSchema(min_length=1, max_length=4, pattern='^[a-z]+$')
+    validate = _adaptive(schema, sample_every=2, refresh_every=8)
+    values = ['boop', 'Boop', '', 'boooop', 1, None] * 20
+    assert [validate(x) for x in values] == [schema.validator()(x) for x in values]
+
+
+def test_untyped_dict_keywords_apply_to_their_type():
+    validate = _adaptive({'minLength': 1, 'minimum': 1}, sample_every=1)
+    assert [validate(x) for x in ['a', '', 2, 0, None]] == [True, False, True, False, True]
+
+
+def test_untyped_contradiction_fails_its_own_type():
+    validate = _adaptive({'minimum': 5, 'maximum': 1, 'maxLength': 2}, sample_every=1)
+    assert [validate(x) for x in ['a', 'abc', 3, None]] == [True, False, False, True]
+
+
+def test_reorders_by_failure_rate():
+    schema = StringSchema(min_length=1, max_length=64, pattern='^[a-z]+$')
+    validate = _adaptive(schema, sample_every=1, refresh_every=100)
+    assert validate.order[-1] is Pattern
+    for _ in range(100):
+        validate('Boop')
+    assert validate.order[0] is Pattern
+    assert validate.stats.get(Pattern).failures == 100
+    assert validate.stats.get(MinLength).failures == 0
+    assert validate.validator('Boop') is False
+
+
+def test_only_recompiles_when_it_saves_time(monkeypatch):
+    compiled = []
+    compile = adaptive.compile
+
+    def counting(*args, **kwargs):
+        compiled.append(args)
+        return compile(*args, **kwargs)
+
+    monkeypatch.setattr(adaptive, 'compile', counting)
+    validate = _adaptive(StringSchema(min_length=1, max_length=8), sample_every=1, refresh_every=10)
+    for _ in range(100):
+        validate('boop')
+    assert len(compiled) == 1
+
+
+def test_samples_every_n():
+    validate = _adaptive(StringSchema(max_length=2), sample_every=10)
+    for _ in range(100):
+        validate('abc')
+    assert validate.stats.get(MaxLength).calls == 10
+
+
+def test_wrong_type_is_not_sampled():
+    validate = _adaptive(StringSchema(max_length=2), sample_every=1)
+    assert validate(1) is False
+    assert validate.stats.get(MaxLength).calls == 0
+
+
+def test_window():
+    stats = FailureStats(window=4)
+    for _ in range(4):
+        stats.record(Pattern, True, 1.0)
+    assert (stats.get(Pattern).calls, stats.get(Pattern).failures) == (2, 2)
+
+
+def test_dict_schema():
+    validate = _adaptive({'type': 'integer', 'minimum': 0}, sample_every=1)
+    assert validate(1) is True
+    assert validate(-1) is False
+
+
+def test_unknown_type():
+    with pytest.raises(ValueError):
+        _adaptive({'type': 'boop'})
+
+
+def test_shared_stats():
+    stats = FailureStats()
+    a = AdaptiveValidator(IntegerSchema(minimum=0), stats=stats, sample_every=1)
+    b = AdaptiveValidator(IntegerSchema(minimum=5), stats=stats, sample_every=1)
+    a(-1)
+    b(1)
+    assert stats.get(type(a._constraints[0])).failures == 2
@@ -0,0 +1,113 @@
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from simpleschema import aio
+from simpleschema.aio import is_cpu_heavy, validate_async
+from simpleschema.schema import ArraySchema, IntegerSchema, ObjectSchema, StringSchema
+
+
+async def _arange(n):
+    for i in range(n):
+        if i % 100 == 0:
+            await asyncio.sleep(0)
+        yield i
+
+
+def _collect(results):
+    async def collect():
+        return [r async for r in results]
+
+    return asyncio.run(collect())
+
+
+def _expected(n, validate):
+    return [(i, validate(i)) for i in range(n)]
+
+
+@pytest.mark.parametrize('records', [lambda: range(10), lambda: _arange(10)])
+def test_inline(records):
+    schema = IntegerSchema(multiple_of=2)
+    assert _collect(validate_async(schema, records())) == _expected(10, schema.validator())
+
+
+def test_yields_to_event_loop():
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(None)
+            await asyncio.sleep(0)
+
+    async def run():
+        task = asyncio.ensure_future(ticker())
+        await asyncio.sleep(0)
+        async for _ in validate_async(IntegerSchema(), range(1000), yield_every=100):
+            pass
+        task.cancel()
+        return len(ticks)
+
+    assert asyncio.run(run()) >= 10
+
+
+@pytest.mark.parametrize('pool', [ThreadPoolExecutor, ProcessPoolExecutor])
+def test_offloaded(pool):
+    schema = StringSchema(pattern='^[0-9]*[02468]$')
+    records = [str(i) for i in range(2500)]
+    with pool(2) as executor:
+        results = _collect(validate_async(schema, records, executor=executor, chunk_size=100))
+    assert results == [(i, i % 2 == 0) for i in range(2500)]
+
+
+def test_offload_needs_executor():
+    with pytest.raises(ValueError):
+        validate_async(IntegerSchema(), [], offload=True)
+
+
+def test_pending_chunks_are_bounded():
+    pulled = []
+
+    async def records():
+        for i in range(100):
+            pulled.append(i)
+            yield 'a'
+
+    async def run():
+        with ThreadPoolExecutor(1) as executor:
+            results = validate_async(
+                StringSchema(format='email'),
+                records(),
+                executor=executor,
+                chunk_size=10,
+                max_pending=2,
+            )
+            await results.__anext__()
+            await results.aclose()
+        return len(pulled)
+
+    assert asyncio.run(run()) <= 20
+
+
+def test_is_cpu_heavy():
+    assert not is_cpu_heavy(ObjectSchema(properties={'a': IntegerSchema(minimum=1)}))
+    assert is_cpu_heavy(ArraySchema(items=StringSchema(format='email')))
+    assert is_cpu_heavy({'type': 'object', 'properties': {'a': {'pattern': '^a'}}})
+    assert is_cpu_heavy({'type': 'object', 'additionalProperties': {'format': 'email'}})
+    assert not is_cpu_heavy({'type': 'object', 'properties': {'a': True}, 'items': False})
+
+
+def test_property_names_are_not_keywords():
+    assert not is_cpu_heavy(ObjectSchema(properties={'pattern': IntegerSchema()}))
+    assert not is_cpu_heavy({'type': 'object', 'properties': {'format': {'type': 'string'}}})
+
+
+def test_worker_validators_are_bounded(monkeypatch):
+    monkeypatch.setattr(aio, 'MAX_VALIDATORS', 2)
+    monkeypatch.setattr(aio, '_validators', OrderedDict())
+    schemas = [IntegerSchema(minimum=i) for i in range(3)]
+    for schema in schemas + schemas[2:]:
+        aio._check_chunk(schema, 0, [1])
+    assert list(aio._validators) == [s.fingerprint() for s in schemas[1:]]
+    assert aio._check_chunk(schemas[0], 0, [-1, 1]) == (0, [False, True])
@@ -0,0 +1,150 @@
+from decimal import Decimal
+from fractions import Fraction
+
+import pytest
+
+from simpleschema.algebra import Unsatisfiable, simplify
+from simpleschema.compiler import compile
+from simpleschema.constraints import (
+    ExclusiveMaximum,
+    ExclusiveMinimum,
+    MaxItems,
+    MaxLength,
+    MaxProperties,
+    Maximum,
+    MinItems,
+    MinLength,
+    Minimum,
+    MultipleOf,
+    Pattern,
+    Required,
+    UniqueItems,
+)
+from simpleschema.schema import IntegerSchema, NumberSchema, StringSchema
+
+
+def _values(constraints):
+    return [(type(c), c.value) for c in constraints]
+
+
+@pytest.mark.parametrize(
+    'constraints, expected',
+    [
+        ([Minimum(1), Minimum(3)], [(Minimum, 3)]),
+        ([Maximum(1), Maximum(3)], [(Maximum, 1)]),
+        ([Minimum(2), ExclusiveMinimum(2)], [(ExclusiveMinimum, 2)]),
+        ([Minimum(3), ExclusiveMinimum(2)], [(Minimum, 3)]),
+        ([Maximum(2), ExclusiveMaximum(2)], [(ExclusiveMaximum, 2)]),
+        ([Maximum(1), ExclusiveMaximum(2)], [(Maximum, 1)]),
+        ([MinLength(1), MinLength(2), MaxLength(4)], [(MinLength, 2), (MaxLength, 4)]),
+        ([MultipleOf(4), MultipleOf(6)], [(MultipleOf, 12)]),
+        ([MultipleOf(0.1), MultipleOf(0.25)], [(MultipleOf, 0.5)]),
+        ([MultipleOf(Decimal('0.1')), MultipleOf(3)], [(MultipleOf, Fraction(3))]),
+        ([Required(['a']), Required(['b'])], [(Required, frozenset('ab'))]),
+        ([UniqueItems(False), UniqueItems(True)], [(UniqueItems, True)]),
+        ([Pattern('^a'), Pattern('^a'), Pattern('b$')], [(Pattern, '^a'), (Pattern, 'b$')]),
+    ],
+)
+def test_merge(constraints, expected):
+    assert _values(simplify(constraints)) == expected
+
+
+@pytest.mark.parametrize(
+    'constraints, type_',
+    [
+        ([Minimum(3), Maximum(2)], None),
+        ([ExclusiveMinimum(2), Maximum(2)], None),
+        ([Minimum(2), ExclusiveMaximum(2)], None),
+        ([MinLength(3), MaxLength(2)], None),
+        ([MinItems(1), MinItems(3), MaxItems(2)], None),
+        ([Required(['a', 'b']), MaxProperties(1)], None),
+        ([Minimum(1), Maximum(9), MultipleOf(10)], None),
+        ([ExclusiveMinimum(0), ExclusiveMaximum(10), MultipleOf(10)], None),
+        ([Minimum(0.31), Maximum(0.39), MultipleOf(0.1)], None),
+        ([Minimum(1.2), Maximum(1.8)], 'integer'),
+        ([Minimum(1), Maximum(5), MultipleOf(3.5)], 'integer'),
+    ],
+)
+def test_unsatisfiable(constraints, type_):
+    (constraint,) = simplify(constraints, type_)
+    assert isinstance(constraint, Unsatisfiable)
+    assert constraint(1) is False
+
+
+@pytest.mark.parametrize(
+    'constraints, type_',
+    [
+        ([Minimum(2), Maximum(2)], None),
+        ([Minimum(1), Maximum(10), MultipleOf(10)], None),
+        ([Minimum(0.3), Maximum(0.3), MultipleOf(0.1)], None),
+        ([Minimum(1.2), Maximum(2)], 'integer'),
+        ([Minimum(float('-inf')), Maximum(2), MultipleOf(3)], 'integer'),
+        ([MinItems(3), MaxLength(2)], None),
+    ],
+)
+def test_satisfiable(constraints, type_):
+    assert not any(isinstance(c, Unsatisfiable) for c in simplify(constraints, type_))
+
+
+def test_untyped_unsatisfiable_replaces_its_json_type():
+    constraints = [Minimum(5), Maximum(1), MaxLength(3), MinItems(2), MaxItems(1)]
+    simplified = simplify(constraints)
+    assert sorted(type(c).__name__ for c in simplified) == [
+        'MaxLength',
+        'Unsatisfiable',
+        'Unsatisfiable',
+    ]
+    assert {c.__json_type__ for c in simplified if isinstance(c, Unsatisfiable)} == {
+        'number',
+        'array',
+    }
+
+
+@pytest.mark.parametrize('inline', [True, False])
+@pytest.mark.parametrize(
+    'schema, valid, invalid',
+    [
+        ({'minimum': 5, 'maximum': 1}, ['abc', None, [1]], [3, 1.5]),
+        ({'minLength': 5, 'maxLength': 1, 'minimum': 2}, [3, {}], ['a', 1]),
+        ({'required': ['a', 'b'], 'maxProperties': 1, 'maxItems': 1}, ['s', [1]], [{}, [1, 2]]),
+        ({'type': 'string', 'minimum': 5, 'maximum': 1}, ['abc'], [3]),
+        ({'type': 'integer', 'minLength': 5, 'maxLength': 1}, [3], [1.5, 'abc']),
+    ],
+)
+def test_compile_contradictions_fail_their_own_type(inline, schema, valid, invalid):
+    validate = compile(schema, inline=inline)
+    assert all(validate(x) is True for x in valid)
+    assert all(validate(x) is False for x in invalid)
+
+
+def test_cheapest_first():
+    constraints = [Pattern('^a'), UniqueItems(True), MultipleOf(2), Minimum(1), MaxLength(2)]
+    assert [type(c) for c in simplify(constraints)] == [
+        Minimum,
+        MaxLength,
+        MultipleOf,
+        Pattern,
+        UniqueItems,
+    ]
+
+
+def test_compile_unsatisfiable():
+    validate = compile(StringSchema(min_length=3, max_length=2))
+    assert 'False' in validate.__source__
+    assert 'len(' not in validate.__source__
+    assert validate('ab') is False
+
+
+@pytest.mark.parametrize(
+    'schema, valid, invalid',
+    [
+        (NumberSchema(minimum=2, exclusive_minimum=2, maximum=4), [3, 4], [2, 5]),
+        (IntegerSchema(minimum=1.2, maximum=1.8), [], [1, 2]),
+        (NumberSchema(minimum=0, multiple_of=0.1, maximum=0.3), [0, 0.3], [0.35, 0.4]),
+    ],
+)
+def test_compile_simplified(schema, valid, invalid):
+    validate = schema.validator()
+    assert all(validate(x) is True for x in valid)
+    assert all(validate(x) is False for x in invalid)
+    assert all(list(schema.iter_errors(x)) for x in invalid)
@@ -1,4 +1,15 @@
+import pytest
+
 from simpleschema.atomics import String, Number, Integer, Boolean, Null
+from simpleschema.atomics import (
+    SCHEMA_CACHE_SIZE,
+    clear_schema_cache,
+    intern_schema,
+    schema_cache_info,
+    set_schema_cache_size,
+)
+from simpleschema.formats import Format
+from simpleschema.schema import StringSchema, NumberSchema, IntegerSchema
 
 
 class TestString:
@@ -81,3 +92,56 @@ class TestNull:
 
     def test_init(self):
         assert self.T() is None
+
+
+class TestSchemaInterning:
+
+    def setup_method(self):
+        clear_schema_cache()
+
+    def test_identical_schemas_are_shared(self):
+        first = intern_schema(StringSchema, min_length=1, max_length=2)
+        assert intern_schema(StringSchema, max_length=2, min_length=1) is first
+        assert String.__schema__(min_length=1) == String.__schema__(min_length=1)
+
+    def test_schema_dict_is_a_copy(self):
+        String.__schema__(min_length=1)['maxLength'] = 2
+        assert String.__schema__(min_length=1) == {'type': 'string', 'minLength': 1}
+        assert intern_schema(StringSchema, min_length=1).to_dict() == {
+            'type': 'string',
+            'minLength': 1,
+        }
+
+    def test_distinct_keys(self):
+        integer = intern_schema(NumberSchema, minimum=1)
+        assert integer is not intern_schema(NumberSchema, minimum=1.0)
+        assert intern_schema(NumberSchema, minimum=1) is not intern_schema(IntegerSchema, minimum=1)
+
+    def test_shared_schemas_are_frozen(self):
+        schema = intern_schema(StringSchema, min_length=1)
+        with pytest.raises(ValueError, match='frozen'):
+            schema.max_length = 2
+        assert intern_schema(StringSchema, min_length=1).to_dict() == {
+            'type': 'string',
+            'minLength': 1,
+        }
+
+    def test_enum_normalized(self):
+        assert intern_schema(StringSchema, format=Format.email) is intern_schema(
+            StringSchema, format='email'
+        )
+
+    def test_stats(self):
+        Integer.__schema__(minimum=1)
+        Integer.__schema__(minimum=1)
+        info = schema_cache_info()
+        assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+    def test_bounded(self):
+        set_schema_cache_size(2)
+        try:
+            for i in range(5):
+                Integer.__schema__(minimum=i)
+            assert schema_cache_info().currsize == 2
+        finally:
+            set_schema_cache_size(SCHEMA_CACHE_SIZE)
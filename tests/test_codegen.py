@@ -0,0 +1,97 @@
+import subprocess
+import sys
+
+import pytest
+
+from simpleschema import format_checkers
+from simpleschema.codegen import generate, write
+from simpleschema.formats import Format
+from simpleschema.schema import (
+    ArraySchema,
+    BooleanSchema,
+    IntegerSchema,
+    NumberSchema,
+    ObjectSchema,
+    StringSchema,
+)
+
+
+def _load(source):
+    namespace = {}
+    exec(source, namespace)
+    return namespace
+
+
+@pytest.mark.parametrize(
+    'schema, valid, invalid',
+    [
+        (StringSchema(min_length=2, pattern=r'^[a-z]+$'), ['ab', 'boop'], ['a', 'Boop', 1]),
+        (StringSchema(format=Format.email), ['a@b.com'], ['a', '@b.com']),
+        (StringSchema(format=Format.date_time), ['2019-08-04T12:30:00Z'], ['2019-02-30T00:00:00Z']),
+        (StringSchema(format=Format.ipv6), ['::ffff:1.2.3.4', '::1'], ['::1.2.3.256', '1::2::3']),
+        (NumberSchema(minimum=1, maximum=float('inf')), [1, 1e300], [0, None]),
+        (NumberSchema(multiple_of=0.1), [0.3, 2, 1e300], [0.35, float('nan')]),
+        (NumberSchema(multiple_of=1e-30), [3e-30], [3e-31]),
+        (ArraySchema(items=IntegerSchema(multiple_of=2), unique_items=True), [[2]], [[2, 2], [3]]),
+        (
+            ObjectSchema(
+                properties={'a': StringSchema()},
+                pattern_properties={'^n': NumberSchema()},
+                additional_properties=BooleanSchema(),
+                required=['a'],
+            ),
+            [{'a': 'x', 'n1': 1, 'z': True}],
+            [{'n1': 1}, {'a': 1}, {'a': 'x', 'n1': 'x'}, {'a': 'x', 'z': 1}],
+        ),
+        (ObjectSchema(additional_properties=False), [{}], [{'b': 0}]),
+        (
+            ObjectSchema(
+                properties={'a': True, 'b': False, 'c': ArraySchema(items=False)},
+                pattern_properties={'^n': False},
+                additional_properties=False,
+            ),
+            [{'a': None, 'c': []}],
+            [{'b': 0}, {'n1': 1}, {'c': [1]}, {'d': 1}],
+        ),
+    ],
+)
+def test_generate_matches_compile(schema, valid, invalid):
+    validate = _load(generate({'validate': schema}))['validate']
+    assert all(validate(x) is True for x in valid)
+    assert all(validate(x) is False for x in invalid)
+    values = valid + invalid
+    assert [validate(x) for x in values] == [schema.validator()(x) for x in values]
+
+
+def test_generate_from_dict():
+    validate = _load(generate({'validate': {'type': 'string', 'maxLength': 2}}))['validate']
+    assert validate('ab') is True
+    assert validate('abc') is False
+
+
+def test_generate_untyped_contradiction():
+    validate = _load(generate({'validate': {'minimum': 5, 'maximum': 1}}))['validate']
+    assert [validate(x) for x in ['abc', None, 3]] == [True, True, False]
+
+
+def test_generated_module_is_standalone(tmp_path):
+    path = tmp_path / 'validators.py'
+    write({'validate_ip': StringSchema(format=Format.ipv4)}, str(path))
+    code = (
+        'import sys, validators; '
+        "assert validators.validate_ip('10.0.0.1') and not validators.validate_ip('10.0.0.256'); "
+        "assert not any(m.startswith('simpleschema') for m in sys.modules)"
+    )
+    subprocess.run([sys.executable, '-c', code], cwd=str(tmp_path), check=True)
+
+
+@pytest.mark.parametrize('name', ['_private', 'class', 'not valid', 're'])
+def test_invalid_names(name):
+    with pytest.raises(ValueError):
+        generate({name: StringSchema(pattern='^a')})
+
+
+def test_custom_format_checker_is_rejected(monkeypatch):
+    monkeypatch.setitem(format_checkers._checkers, 'boop', lambda s: s == 'boop')
+    with pytest.raises(ValueError, match='boop format'):
+        generate({'validate': {'type': 'string', 'format': 'boop'}})
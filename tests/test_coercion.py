@@ -0,0 +1,79 @@
+import pytest
+
+from simpleschema.atomics import Boolean, Integer, Null, Number, String
+from simpleschema.coercion import NO_ERRORS, RecordCoercer, coerce_and_validate
+
+
+@pytest.mark.parametrize(
+    'atomic, x, kwargs, expected',
+    [
+        (String, 1, {}, '1'),
+        (String, 'ab', {'max_length': 2}, 'ab'),
+        (Number, '1.5', {'minimum': 0}, 1.5),
+        (Integer, '3', {'multiple_of': 3}, 3),
+        (Integer, 2.9, {}, 2),
+        (Boolean, 1, {}, True),
+        (Null, None, {}, None),
+    ],
+)
+def test_coerce_valid(atomic, x, kwargs, expected):
+    value, error = coerce_and_validate(atomic, x, **kwargs)
+    assert error is None
+    assert value == expected
+    assert type(value) is type(expected)
+
+
+@pytest.mark.parametrize(
+    'atomic, x, kwargs, keyword',
+    [
+        (String, 'abc', {'max_length': 2}, 'maxLength'),
+        (Number, 'boop', {}, 'type'),
+        (Integer, '1.5', {}, 'type'),
+        (Integer, '-1', {'minimum': 0}, 'minimum'),
+        (Null, 0, {}, 'type'),
+        (Integer, float('inf'), {}, 'type'),
+        (Integer, float('nan'), {}, 'type'),
+    ],
+)
+def test_coerce_invalid(atomic, x, kwargs, keyword):
+    value, error = coerce_and_validate(atomic, x, **kwargs)
+    assert value is None
+    assert error.keyword == keyword
+
+
+def test_values_of_the_cast_type_are_not_copied():
+    s = 'boop' * 100
+    assert coerce_and_validate(String, s)[0] is s
+
+
+class TestRecordCoercer:
+
+    @pytest.fixture
+    def coerce(self):
+        return RecordCoercer(
+            {'name': (String, {'min_length': 1}), 'age': (Integer, {'minimum': 0}), 'ok': Boolean}
+        )
+
+    def test_valid(self, coerce):
+        out, errors = coerce({'name': 'joe', 'age': '42', 'ok': 1, 'extra': 'x'})
+        assert out == {'name': 'joe', 'age': 42, 'ok': True}
+        assert errors is NO_ERRORS
+
+    def test_errors_by_field(self, coerce):
+        out, errors = coerce({'name': '', 'age': 'x'})
+        assert out == {}
+        assert {k: (e.path, e.keyword) for k, e in errors.items()} == {
+            'name': ('/name', 'minLength'),
+            'age': ('/age', 'type'),
+            'ok': ('/ok', 'required'),
+        }
+
+    def test_cast_overflow(self):
+        out, errors = RecordCoercer({'a': Integer})({'a': float('inf')})
+        assert out == {}
+        assert errors['a'].keyword == 'type'
+
+    def test_many(self, coerce):
+        results = list(coerce.many([{'name': 'a', 'age': 1, 'ok': 0}, {'name': 'b', 'age': -1}]))
+        assert results[0] == ({'name': 'a', 'age': 1, 'ok': False}, NO_ERRORS)
+        assert set(results[1][1]) == {'age', 'ok'}
@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+
+from simpleschema.columnar import validate_columns
+from simpleschema.schema import (
+    BooleanSchema,
+    IntegerSchema,
+    NullSchema,
+    NumberSchema,
+    StringSchema,
+)
+
+
+SCHEMAS = {
+    'id': IntegerSchema(minimum=1),
+    'price': NumberSchema(minimum=0, multiple_of=0.01),
+    'name': StringSchema(min_length=1, pattern='^[a-z]'),
+    'active': BooleanSchema(),
+    'deleted': NullSchema(),
+}
+
+ROWS = [
+    {'id': 1, 'price': 19.99, 'name': 'a', 'active': True, 'deleted': None},
+    {'id': 0, 'price': 1.005, 'name': 'b', 'active': False, 'deleted': None},
+    {'id': 3, 'price': -1.0, 'name': '', 'active': True, 'deleted': None},
+    {'id': 4, 'price': 2.5, 'name': 'Boop', 'active': True, 'deleted': None},
+    {'id': 5, 'price': 0.1, 'name': 'c', 'active': False, 'deleted': None},
+]
+
+
+def _columns(rows, wrap):
+    return {k: wrap([r[k] for r in rows]) for k in rows[0]}
+
+
+def _as_array(values):
+    return np.array(values, dtype=object if None in values else None)
+
+
+@pytest.mark.parametrize('vectorize', [True, False])
+@pytest.mark.parametrize('wrap', [list, _as_array])
+def test_matches_row_validation(monkeypatch, vectorize, wrap):
+    columns = _columns(ROWS, wrap)
+    if not vectorize:
+        if wrap is _as_array:
+            pytest.skip('arrays need numpy')
+        monkeypatch.setattr('simpleschema.constraints.np', None)
+    result = validate_columns(SCHEMAS, columns)
+    expected = [all(SCHEMAS[k].validator()(v) for k, v in row.items()) for row in ROWS]
+    assert [bool(v) for v in result.valid] == expected
+    assert list(result.failures) == [1, 2, 3]
+    assert list(result.columns['id'].failures) == [1]
+    assert result.columns['price'].keywords == {'minimum': 1, 'multipleOf': 1}
+    assert result.columns['name'].keywords == {'minLength': 1, 'pattern': 2}
+    assert result.columns['active'].valid
+    assert result.columns['deleted'].valid
+
+
+@pytest.mark.parametrize(
+    'schema, column, failures, keywords',
+    [
+        (IntegerSchema(), np.array([1.0, 2.0]), [0, 1], {'type': 2}),
+        (NumberSchema(), np.array([True, False]), [0, 1], {'type': 2}),
+        (NumberSchema(maximum=2), [1, True, 'x', 3], [1, 2, 3], {'type': 2, 'maximum': 1}),
+        (StringSchema(max_length=1), np.array(['a', 'bc']), [1], {'maxLength': 1}),
+        (StringSchema(), np.array([1, 2]), [0, 1], {'type': 2}),
+        (NullSchema(), np.array([None, 0], dtype=object), [1], {'type': 1}),
+    ],
+)
+def test_types(schema, column, failures, keywords):
+    summary = validate_columns({'c': schema}, {'c': column}).columns['c']
+    assert list(summary.failures) == failures
+    assert summary.keywords == keywords
+
+
+def test_missing_column():
+    result = validate_columns({'a': IntegerSchema(), 'b': IntegerSchema()}, {'a': [1, 2]})
+    assert not any(result.valid)
+    assert result.columns['b'].keywords == {'required': 2}
+
+
+def test_unknown_columns_are_ignored():
+    result = validate_columns({'a': IntegerSchema()}, {'a': [1], 'b': ['x', 'y']})
+    assert list(result.valid) == [True]
+    assert list(result.columns) == ['a']
+
+
+def test_columns_of_different_lengths():
+    with pytest.raises(ValueError):
+        validate_columns({'a': IntegerSchema(), 'b': IntegerSchema()}, {'a': [1], 'b': [1, 2]})
+
+
+def test_array_like_column():
+    class Column:
+        def __array__(self, dtype=None, copy=None):
+            return np.array([1, -1])
+
+    result = validate_columns({'a': IntegerSchema(minimum=0)}, {'a': Column()})
+    assert list(result.failures) == [1]
@@ -0,0 +1,76 @@
+import pytest
+
+from simpleschema.compiler import compile
+from simpleschema.formats import Format
+from simpleschema.schema import StringSchema, NumberSchema, IntegerSchema, NullSchema, BooleanSchema
+
+
+@pytest.mark.parametrize(
+    'schema, valid, invalid',
+    [
+        (StringSchema(), ['', 'boop'], [1, None, b'boop']),
+        (StringSchema(min_length=2, max_length=3), ['ab', 'abc'], ['a', 'abcd', 12]),
+        (StringSchema(pattern=r'^[a-z]+$'), ['boop'], ['Boop', '1', 1]),
+        (StringSchema(format=Format.email), ['a@b.com'], ['a', '@b.com']),
+        (StringSchema(format=Format.ipv4, min_length=8), ['10.0.0.1'], ['1.1.1.1', '10.0.0.256']),
+        (NumberSchema(minimum=1, maximum=10), [1, 5.5, 10], [0, 10.5, '5', True]),
+        (NumberSchema(exclusive_minimum=1, exclusive_maximum=10), [2, 9.9], [1, 10]),
+        (NumberSchema(multiple_of=2), [4, 4.0, -2], [3, 3.5]),
+        (NumberSchema(maximum=float('inf')), [1e300], [None]),
+        (IntegerSchema(minimum=0), [0, 100], [-1, 1.5, False]),
+        (NullSchema(), [None], [0, '', False]),
+        (BooleanSchema(), [True, False], [0, 1, None]),
+    ],
+)
+def test_compile(schema, valid, invalid):
+    for validate in (compile(schema), compile(schema.to_dict())):
+        assert all(validate(x) is True for x in valid)
+        assert all(validate(x) is False for x in invalid)
+
+
+def test_compile_inlines_constraints():
+    validate = compile(NumberSchema(minimum=1, multiple_of=2))
+    assert 'x >= 1' in validate.__source__
+    assert 'x % 2 == 0' in validate.__source__
+
+
+def test_compile_untyped_dict():
+    validate = compile({'minLength': 1})
+    assert validate('a') is True
+    assert validate('') is False
+
+
+@pytest.mark.parametrize('inline', [True, False])
+@pytest.mark.parametrize(
+    'schema, valid, invalid',
+    [
+        ({'minLength': 1}, [5, None, 'a'], ['']),
+        ({'minimum': 1}, ['a', True, 2], [0]),
+        ({'format': 'email'}, [3, 'joe@example.com'], ['joe']),
+        ({'required': ['a'], 'maxItems': 1}, ['s', [1], {'a': 1}], [{}, [1, 2]]),
+    ],
+)
+def test_untyped_dict_keywords_apply_to_their_type(inline, schema, valid, invalid):
+    validate = compile(schema, inline=inline)
+    assert all(validate(x) is True for x in valid)
+    assert not any(validate(x) for x in invalid)
+
+
+@pytest.mark.parametrize('inline', [True, False])
+@pytest.mark.parametrize(
+    'schema, valid, invalid',
+    [
+        ({'type': 'string', 'minimum': 1}, ['a', ''], [1]),
+        ({'type': 'integer', 'minLength': 5, 'maximum': 3}, [1, 3], [4, 'abcdef']),
+        ({'type': 'number', 'required': ['a'], 'multipleOf': 2}, [2, 4.0], [3, {}]),
+    ],
+)
+def test_typed_dict_ignores_keywords_of_other_types(inline, schema, valid, invalid):
+    validate = compile(schema, inline=inline)
+    assert all(validate(x) is True for x in valid)
+    assert all(validate(x) is False for x in invalid)
+
+
+def test_compile_unknown_type():
+    with pytest.raises(ValueError):
+        compile({'type': 'tuple'})
@@ -1,5 +1,7 @@
 import string
 import re
+from decimal import Decimal
+from fractions import Fraction
 
 import pytest
 
@@ -7,7 +9,7 @@ import pytest
 from hypothesis import strategies as st
 from hypothesis import given, example
 
-from simpleschema.constraints import InvalidConstraintError
+from simpleschema.constraints import InvalidConstraintError, _as_fraction
 from simpleschema.constraints import (
     MinLength,
     MaxLength,
@@ -19,6 +21,10 @@ from simpleschema.constraints import (
     ExclusiveMaximum,
     ExclusiveMinimum,
     MultipleOf,
+    MinProperties,
+    MaxProperties,
+    Required,
+    UniqueItems,
 )
 
 
@@ -240,3 +246,190 @@ class TestMultipleOf(ConstraintSuite):
     )
     def test_validate_on_invalid(self, inp):
         super().test_validate_on_invalid(inp)
+
+
+class TestExactMultipleOf:
+
+    @pytest.mark.parametrize(
+        'value, valid, invalid',
+        [
+            (0.1, [0.3, 0.7, 1.1, 3, -0.2, 1e300], [0.35, 0.30000000000000004, 1e-20]),
+            (0.01, [19.99, 0.07, 100], [19.999, 0.001]),
+            (2.5, [7.5, 5, 0.0], [3, 2.4]),
+            (1e-05, [3e-05, 0.00012], [3e-06]),
+            (1e-30, [3e-30], [3e-31]),
+            (Decimal('0.1'), [0.3, Decimal('0.3'), Fraction(3, 10), 2], [Decimal('0.35'), 0.35]),
+            (Fraction(1, 3), [Fraction(2, 3), 1.0, 3], [0.3, Fraction(1, 2)]),
+            (2, [Decimal('4'), Fraction(8, 2)], [Decimal('4.5')]),
+        ],
+    )
+    def test_validate(self, value, valid, invalid):
+        constr = MultipleOf(value)
+        assert all(constr(x) is True for x in valid)
+        assert not any(constr(x) for x in invalid)
+
+    @pytest.mark.parametrize('value', [0.1, Decimal('0.1'), Fraction(1, 10)])
+    @pytest.mark.parametrize('x', [float('inf'), float('-inf'), float('nan')])
+    def test_validate_non_finite(self, value, x):
+        assert MultipleOf(value)(x) is False
+
+    @pytest.mark.parametrize('value', [float('inf'), float('nan'), Decimal('-0.1'), Fraction(0)])
+    def test_init_with_invalid_constr(self, value):
+        with pytest.raises(InvalidConstraintError):
+            MultipleOf(value)
+
+    @pytest.mark.parametrize('value', [2, 0.1, 0.25, 1e-30, Fraction(1, 3)])
+    @given(
+        st.lists(st.integers(-10 ** 6, 10 ** 6).map(lambda n: n / 100) | st.floats())
+        | st.lists(st.integers(-10 ** 6, 10 ** 6))
+    )
+    def test_batch_matches_call(self, value, inp):
+        constr = MultipleOf(value)
+        assert [bool(m) for m in constr.batch(inp).mask] == [constr(x) for x in inp]
+
+    @given(
+        st.sampled_from([0.01, 0.1, 2.5, 1e-10, 3.0]),
+        st.floats(allow_nan=False, allow_infinity=False)
+        | st.integers(-10 ** 17, 10 ** 17).map(lambda n: n / 100)
+        | st.integers(-10 ** 16, 10 ** 16).map(lambda n: n / 10 ** 10),
+    )
+    @example(value=0.01, x=39515962185005.13)
+    @example(value=1e-10, x=-279817.2429251695)
+    def test_scaled_matches_fractions(self, value, x):
+        expected = _as_fraction(x) % _as_fraction(value) == 0
+        assert MultipleOf(value)(x) is expected
+
+    @pytest.mark.parametrize('value', [10 ** 20, 1e20, 1e-23])
+    def test_batch_outside_dtype(self, value):
+        np = pytest.importorskip('numpy')
+        for inp in ([1, 2], [3e-23]):
+            constr = MultipleOf(value)
+            assert [bool(m) for m in constr.batch(np.array(inp)).mask] == [constr(x) for x in inp]
+
+
+class TestBatch:
+
+    @pytest.mark.parametrize('vectorize', [True, False])
+    @pytest.mark.parametrize(
+        'constr, inp, expected',
+        [
+            (Minimum(2), [1, 2, 3], [1, 2]),
+            (Maximum(2), [1, 2, 3], [0, 1]),
+            (ExclusiveMinimum(2), [1.5, 2, 3.5], [2]),
+            (ExclusiveMaximum(2), [1.5, 2, 3.5], [0]),
+            (MultipleOf(2), [1, 2, 3, 4], [1, 3]),
+            (MultipleOf(0.1), [0.3, 0.35, 1e300, float('nan')], [0, 2]),
+            (MinLength(2), ['a', 'ab'], [1]),
+            (Pattern('^a'), ['ab', 'ba'], [0]),
+        ],
+    )
+    def test_batch(self, monkeypatch, vectorize, constr, inp, expected):
+        if not vectorize:
+            monkeypatch.setattr('simpleschema.constraints.np', None)
+        mask, failures = constr.batch(inp)
+        assert list(failures) == [i for i, _ in enumerate(inp) if i not in expected]
+        assert [bool(m) for m in mask] == [i in expected for i, _ in enumerate(inp)]
+
+    @pytest.mark.parametrize('constr, expected', [(MinLength(2), [1, 2]), (MaxLength(1), [0])])
+    def test_batch_str_array(self, constr, expected):
+        np = pytest.importorskip('numpy')
+        mask, failures = constr.batch(np.array(['a', 'ab', 'abc']))
+        assert [bool(m) for m in mask] == [i in expected for i in range(3)]
+
+
+class TestMinProperties(ConstraintSuite):
+
+    Constr = MinProperties
+    constr = MinProperties(2)
+
+    @pytest.mark.parametrize('param', [0, 2])
+    def test_init_with_valid_constr(self, param):
+        super().test_init_with_valid_constr(param)
+
+    @pytest.mark.parametrize('param', [-1, 1.5, '2', None])
+    def test_init_with_invalid_constr(self, param):
+        super().test_init_with_invalid_constr(param)
+
+    @given(st.dictionaries(st.text(), st.integers(), min_size=2))
+    def test_validate_on_valid(self, inp):
+        super().test_validate_on_valid(inp)
+
+    @given(st.dictionaries(st.text(), st.integers(), max_size=1))
+    def test_validate_on_invalid(self, inp):
+        super().test_validate_on_invalid(inp)
+
+
+class TestMaxProperties(ConstraintSuite):
+
+    Constr = MaxProperties
+    constr = MaxProperties(2)
+
+    @pytest.mark.parametrize('param', [0, 2])
+    def test_init_with_valid_constr(self, param):
+        super().test_init_with_valid_constr(param)
+
+    @pytest.mark.parametrize('param', [-1, 1.5, '2', None])
+    def test_init_with_invalid_constr(self, param):
+        super().test_init_with_invalid_constr(param)
+
+    @given(st.dictionaries(st.text(), st.integers(), max_size=2))
+    def test_validate_on_valid(self, inp):
+        super().test_validate_on_valid(inp)
+
+    @given(st.dictionaries(st.text(), st.integers(), min_size=3))
+    def test_validate_on_invalid(self, inp):
+        super().test_validate_on_invalid(inp)
+
+
+class TestRequired(ConstraintSuite):
+
+    Constr = Required
+    constr = Required(['a', 'b'])
+
+    def test_init_with_valid_constr(self):
+        assert self.Constr(['a', 'b', 'a']).value == {'a', 'b'}
+
+    @pytest.mark.parametrize('param', ['a', 1, [1], None])
+    def test_init_with_invalid_constr(self, param):
+        super().test_init_with_invalid_constr(param)
+
+    @given(st.dictionaries(st.text(), st.integers()).map(lambda d: {**d, 'a': 1, 'b': 2}))
+    def test_validate_on_valid(self, inp):
+        super().test_validate_on_valid(inp)
+
+    @given(st.dictionaries(st.text().filter(lambda k: k != 'b'), st.integers()))
+    def test_validate_on_invalid(self, inp):
+        super().test_validate_on_invalid(inp)
+
+
+class TestUniqueItems(ConstraintSuite):
+
+    Constr = UniqueItems
+    constr = UniqueItems(True)
+
+    @pytest.mark.parametrize('param', [True, False])
+    def test_init_with_valid_constr(self, param):
+        super().test_init_with_valid_constr(param)
+
+    @pytest.mark.parametrize('param', [1, 'true', None])
+    def test_init_with_invalid_constr(self, param):
+        super().test_init_with_invalid_constr(param)
+
+    @given(st.sets(st.integers() | st.text()).map(list))
+    def test_validate_on_valid(self, inp):
+        super().test_validate_on_valid(inp)
+
+    @given(st.lists(st.integers(), min_size=1).map(lambda x: x + x[:1]))
+    def test_validate_on_invalid(self, inp):
+        super().test_validate_on_invalid(inp)
+
+    def test_disabled(self):
+        assert UniqueItems(False)([1, 1]) is True
+
+
+class TestAlias:
+
+    def test_alias_resolved_per_class(self):
+        assert MinLength.__alias__ == 'minLength'
+        assert MinItems.__alias__ == 'minItems'
+        assert MaxProperties.__alias__ == 'maxProperties'
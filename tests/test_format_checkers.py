@@ -0,0 +1,83 @@
+import pytest
+
+from simpleschema.constraints import InvalidConstraintError, StringFormat
+from simpleschema.format_checkers import get_checker, register
+from simpleschema.formats import Format
+
+
+CASES = {
+    Format.date_time: (
+        ['2019-08-04T12:30:00Z', '2019-08-04t12:30:00.123+01:00', '2016-12-31T23:59:60Z'],
+        ['2019-08-04', '2019-08-04 12:30:00Z', '2019-02-30T12:30:00Z', '2019-08-04T24:00:00Z'],
+    ),
+    Format.time: (['12:30:00Z', '23:59:59.999-05:30'], ['12:30:00', '12:60:00Z', '1:30:00Z']),
+    Format.date: (
+        ['2019-08-04', '2020-02-29'],
+        ['2019-02-29', '2019-13-01', '19-08-04', '2019-8-4'],
+    ),
+    Format.email: (['joe.bloggs@example.com', "o'hara+x@a-b.co"], ['joe', 'a..b@x.com', '@x.com']),
+    Format.idn_email: (['실례@실례.테스트', 'joe@example.com'], ['실례', 'a b@x.com']),
+    Format.hostname: (
+        ['example.com', 'a-b.c1', 'localhost'],
+        ['-a.com', 'a_b.com', 'a..b', 'a' * 64],
+    ),
+    Format.idn_hostname: (['실례.테스트', 'example.com'], ['-실례', 'a_b', '']),
+    Format.ipv4: (['127.0.0.1', '255.255.255.255'], ['256.0.0.1', '1.2.3', '01.2.3.4', '1.2.3.٣']),
+    Format.ipv6: (
+        ['::1', '::', '1:2:3:4:5:6:7:8', 'fe80::1', '::ffff:192.168.0.1', '1:2:3:4:5:6:1.2.3.4'],
+        [':::', '1::2::3', '1:2:3:4:5:6:7:8:9', '12345::', '::1.2.3.256', '1:2:3:4:5:6:7'],
+    ),
+    Format.uri: (['http://example.com/a?b=c#d', 'urn:isbn:0451450523'], ['//x.com', 'http://a b']),
+    Format.uri_reference: (['//example.com', '/a/b?c', '#frag', ''], ['\\\\x', 'a b', '#a#b']),
+    Format.iri: (['http://ƒøø.ßår/?∂éœ=πîx#πîüx'], ['/relative', 'http://a<b']),
+    Format.iri_reference: (['/∂éœ', 'http://ƒøø.ßår/'], ['a b', '#ƒ#ƒ']),
+    Format.uri_template: (
+        ['http://example.com/{term:1}/{term}', '{+path}/{;x,y*}', 'no-vars'],
+        ['http://example.com/{term', '{}', '{term:0}'],
+    ),
+    Format.json_pointer: (['', '/foo/0', '/a~0b/c~1d', '/'], ['foo', '/a~2', '/~']),
+    Format.relative_json_pointer: (['0', '1/foo', '2#'], ['-1', '01', '/foo', '1#/']),
+    Format.regex: ([r'^[a-z]+$', r'(a|b)*'], ['(', '[a-', '*']),
+}
+
+
+def test_all_formats_have_cases():
+    assert set(CASES) == set(Format)
+
+
+@pytest.mark.parametrize('fmt', list(CASES), ids=lambda f: f.value)
+def test_checker(fmt):
+    check = get_checker(fmt)
+    valid, invalid = CASES[fmt]
+    assert [v for v in valid if check(v) is not True] == []
+    assert [v for v in invalid if check(v) is not False] == []
+
+
+def test_get_checker_by_name():
+    assert get_checker('ipv4') is get_checker(Format.ipv4)
+
+
+def test_register_replaces_checker():
+    original = get_checker(Format.hostname)
+    try:
+        register('hostname')(str.islower)
+        assert StringFormat('hostname')('abc') is True
+    finally:
+        register(Format.hostname)(original)
+
+
+class TestStringFormat:
+
+    def test_init(self):
+        assert StringFormat(Format.email).value == 'email'
+        assert StringFormat('email').value == 'email'
+
+    @pytest.mark.parametrize('param', ['boop', 1, ['email']])
+    def test_init_with_invalid_constr(self, param):
+        with pytest.raises(InvalidConstraintError):
+            StringFormat(param)
+
+    def test_call(self):
+        constr = StringFormat(Format.date)
+        assert constr('2019-08-04') is True
+        assert constr('2019-08-32') is False
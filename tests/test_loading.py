@@ -0,0 +1,252 @@
+import gc
+import io
+import json
+
+import pytest
+
+from simpleschema.constraints import (
+    ExclusiveMaximum,
+    MinLength,
+    MultipleOf,
+    StringFormat,
+    by_alias,
+)
+from simpleschema.loading import SchemaLoader, from_dict, load, load_many
+from simpleschema.schema import (
+    ArraySchema,
+    IntegerSchema,
+    NumberSchema,
+    ObjectSchema,
+    StringSchema,
+)
+
+
+SCHEMAS = [
+    StringSchema(min_length=1, max_length=4, pattern='^a'),
+    NumberSchema(minimum=0, exclusive_maximum=10, multiple_of=0.5),
+    IntegerSchema(maximum=3),
+    ArraySchema(items=StringSchema(min_length=1), min_items=1, unique_items=True),
+    ObjectSchema(
+        properties={'a': IntegerSchema(minimum=0), 'b': ArraySchema(items=NumberSchema())},
+        required=['a'],
+        additional_properties=False,
+    ),
+]
+
+
+@pytest.mark.parametrize('schema', SCHEMAS)
+def test_round_trip(schema):
+    loaded = from_dict(schema.to_dict())
+    assert type(loaded) is type(schema)
+    assert loaded.to_dict() == schema.to_dict()
+
+
+def test_constraints():
+    schema = from_dict(
+        {'type': 'number', 'exclusiveMaximum': 3, 'multipleOf': 0.5, '$id': 'n', 'title': 'n'}
+    )
+    assert {type(c) for c in schema.constraints()} == {ExclusiveMaximum, MultipleOf}
+    validate = schema.validator()
+    assert validate(2.5) is True
+    assert validate(3) is False
+    assert validate(0.3) is False
+
+
+def test_string_constraints():
+    schema = from_dict({'type': 'string', 'minLength': 2, 'format': 'email'})
+    assert [type(c) for c in schema.constraints()] == [MinLength, StringFormat]
+
+
+def test_nested_validator():
+    schema = from_dict(
+        {
+            'type': 'object',
+            'properties': {'tags': {'type': 'array', 'items': {'type': 'string', 'minLength': 1}}},
+            'required': ['tags'],
+        }
+    )
+    validate = schema.validator()
+    assert validate({'tags': ['a']}) is True
+    assert validate({'tags': ['']}) is False
+    assert validate({}) is False
+
+
+def test_load_many_shares_subschemas():
+    tag = {'type': 'string', 'minLength': 1}
+    a, b, c = load_many(
+        [
+            {'type': 'array', 'items': dict(tag)},
+            {'type': 'object', 'properties': {'t': dict(tag), 'u': dict(tag)}},
+            {'type': 'array', 'items': dict(tag)},
+        ]
+    )
+    assert a is c
+    assert a.items is b.properties['t'] is b.properties['u']
+
+
+def test_shared_schemas_are_frozen():
+    a, b = load_many([{'type': 'string'}, {'type': 'string'}])
+    with pytest.raises(ValueError, match='frozen'):
+        a.min_length = 1
+    assert b.to_dict() == {'type': 'string'}
+
+
+def test_loader_memo():
+    loader = SchemaLoader()
+    schemas = [
+        loader({'type': 'array', 'items': {'type': 'integer'}}),
+        loader({'type': 'array', 'items': {'type': 'integer'}}),
+        loader({'type': 'array', 'items': {'type': 'integer', 'minimum': 0}}),
+    ]
+    assert len(loader) == 4
+    del schemas
+    gc.collect()
+    assert len(loader) == 0
+
+
+def test_distinct_values_not_shared():
+    a, b = load_many([{'type': 'number', 'minimum': 1}, {'type': 'number', 'minimum': 1.5}])
+    assert a is not b
+
+
+def test_equal_values_of_distinct_types_not_shared():
+    d1, d2 = {'type': 'number', 'minimum': 1}, {'type': 'number', 'minimum': 1.0}
+    a, b = load_many([d1, d2])
+    assert a is not b
+    assert [json.loads(s.to_json()) for s in (a, b)] == [d1, d2]
+    assert b.to_json() == b'{"type":"number","minimum":1.0}'
+    assert b.fingerprint() == NumberSchema(minimum=1.0).fingerprint()
+
+
+def test_refs():
+    name = StringSchema(min_length=1)
+    schema = from_dict(
+        {'type': 'object', 'properties': {'name': {'$ref': 'name'}}}, {'name': name}.__getitem__
+    )
+    assert schema.properties['name'] is name
+    with pytest.raises(ValueError, match='resolve'):
+        from_dict({'type': 'array', 'items': {'$ref': 'name'}})
+
+
+@pytest.mark.parametrize(
+    'd, fields',
+    [
+        ({'maximum': 5, 'exclusiveMaximum': True}, {'exclusive_maximum': 5}),
+        ({'maximum': 5, 'exclusiveMaximum': False}, {'maximum': 5}),
+        (
+            {'minimum': 0, 'exclusiveMinimum': True, 'maximum': 1},
+            {'exclusive_minimum': 0, 'maximum': 1},
+        ),
+        ({'exclusiveMaximum': 5}, {'exclusive_maximum': 5}),
+    ],
+)
+def test_draft4_exclusive_bounds(d, fields):
+    schema = from_dict(dict(d, type='number'))
+    assert schema.to_dict() == NumberSchema(**fields).to_dict()
+
+
+def test_draft4_exclusive_maximum_validates():
+    validate = from_dict({'type': 'integer', 'maximum': 5, 'exclusiveMaximum': True}).validator()
+    assert validate(3) is True
+    assert validate(5) is False
+
+
+@pytest.mark.parametrize(
+    'd', [{'exclusiveMaximum': True}, {'minimum': True}, {'multipleOf': False, 'maximum': 1}]
+)
+def test_boolean_numeric_keywords(d):
+    with pytest.raises(ValueError, match='boolean'):
+        from_dict(dict(d, type='number'))
+
+
+@pytest.mark.parametrize(
+    'd',
+    [
+        {'type': 'string', 'enum': ['a']},
+        {'type': 'integer', 'const': 1},
+        {'type': 'object', 'properties': {'a': {'type': 'string', 'anyOf': []}}},
+        {'type': 'array', 'items': {'type': 'string'}, 'contains': {'type': 'string'}},
+        {'type': 'object', 'dependencies': {'a': ['b']}, 'not': {'required': ['c']}},
+    ],
+)
+def test_unsupported_keywords(d):
+    with pytest.raises(ValueError, match='unsupported keywords'):
+        from_dict(d)
+
+
+def test_boolean_subschemas():
+    schema = from_dict(
+        {
+            'type': 'object',
+            'properties': {'a': True, 'b': False, 'c': {'type': 'array', 'items': False}},
+            'additionalProperties': False,
+        }
+    )
+    validate = schema.validator()
+    assert validate({'a': {}, 'c': []}) is True
+    assert not any(validate(x) for x in [{'b': 1}, {'c': [1]}, {'d': 1}])
+    assert [(e.path, e.keyword) for e in schema.iter_errors({'a': 1, 'b': 1, 'c': [1], 'd': 1})] == [
+        ('/b', 'properties'),
+        ('/c/0', 'items'),
+        ('/d', 'additionalProperties'),
+    ]
+    assert from_dict(schema.to_dict()).to_dict() == schema.to_dict()
+    assert from_dict({'type': 'array', 'items': True}).validator()([1, 'a']) is True
+
+
+def test_boolean_and_schema_subschemas_not_shared():
+    a, b = load_many(
+        [
+            {'type': 'object', 'properties': {'a': True}},
+            {'type': 'object', 'properties': {'a': False}},
+        ]
+    )
+    assert a is not b
+
+
+@pytest.mark.parametrize('items', [[{'type': 'string'}], 'string'])
+def test_invalid_items(items):
+    with pytest.raises(ValueError, match='tuple form items|subschemas must be'):
+        from_dict({'type': 'array', 'items': items})
+
+
+def test_unknown_format_ignored():
+    schema = from_dict({'type': 'string', 'format': 'uuid', 'minLength': 1})
+    assert schema.to_dict() == {'type': 'string', 'minLength': 1}
+    assert schema.validator()('not a uuid') is True
+
+
+def test_annotations_and_keywords_of_other_types_ignored():
+    schema = from_dict(
+        {
+            '$schema': 'http://json-schema.org/draft-07/schema#',
+            '$id': 'n',
+            '$comment': 'a count',
+            'type': 'integer',
+            'examples': [1],
+            'default': 0,
+            'minLength': 2,
+            'maximum': 3,
+        }
+    )
+    assert schema.to_dict() == {'type': 'integer', 'maximum': 3}
+
+
+@pytest.mark.parametrize('d', [{'minimum': 1}, {'type': 'thing'}, {'type': ['string', 'null']}])
+def test_unknown_type(d):
+    with pytest.raises(ValueError):
+        from_dict(d)
+
+
+@pytest.mark.parametrize('wrap', [lambda s: s, str.encode, io.StringIO])
+def test_load(wrap):
+    schema = load(wrap(json.dumps({'type': 'integer', 'minimum': 1})))
+    assert isinstance(schema, IntegerSchema)
+    assert schema.minimum == 1
+
+
+def test_by_alias():
+    classes = by_alias()
+    assert classes['minLength'] is MinLength
+    assert classes['multipleOf'] is MultipleOf
+    assert 'type' not in classes
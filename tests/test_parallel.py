@@ -0,0 +1,61 @@
+import threading
+
+import pytest
+
+from simpleschema.parallel import validate_many
+from simpleschema.schema import IntegerSchema, StringSchema
+
+
+RECORDS = list(range(-50, 250))
+EXPECTED = [(i, 0 <= x <= 200 and x % 2 == 0) for i, x in enumerate(RECORDS)]
+
+
+@pytest.mark.parametrize('backend', ['process', 'thread'])
+def test_validate_many_ordered(backend):
+    schema = IntegerSchema(minimum=0, maximum=200, multiple_of=2)
+    results = validate_many(schema, iter(RECORDS), workers=2, backend=backend, chunk_size=7)
+    assert list(results) == EXPECTED
+
+
+@pytest.mark.parametrize('backend', ['process', 'thread'])
+def test_validate_many_unordered(backend):
+    schema = {'type': 'integer', 'minimum': 0, 'maximum': 200, 'multipleOf': 2}
+    results = validate_many(
+        schema, RECORDS, workers=2, backend=backend, chunk_size=7, ordered=False
+    )
+    assert sorted(results) == EXPECTED
+
+
+class _Gated(int):
+    # an int whose comparisons wait for the gate to open, or give up after a while
+
+    gate = threading.Event()
+    compared = threading.Event()
+
+    def __ge__(self, other):
+        self.gate.wait(5)
+        self.compared.set()
+        return int(self) >= other
+
+
+def test_validate_many_unordered_yields_as_completed():
+    records = [_Gated(1), 2]
+    results = validate_many(
+        IntegerSchema(minimum=0), records, workers=2, backend='thread', chunk_size=1, ordered=False
+    )
+    try:
+        # the slow first chunk mustn't hold back the second, which is done
+        assert next(results) == (1, True)
+        assert not _Gated.compared.is_set()
+    finally:
+        _Gated.gate.set()
+    assert list(results) == [(0, True)]
+
+
+def test_validate_many_empty():
+    assert list(validate_many(StringSchema(), [], backend='thread')) == []
+
+
+def test_validate_many_unknown_backend():
+    with pytest.raises(ValueError):
+        list(validate_many(StringSchema(), ['a'], backend='gpu'))
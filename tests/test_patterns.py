@@ -0,0 +1,71 @@
+import re
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from simpleschema.constraints import Pattern
+from simpleschema.patterns import PatternCache, fast_matcher, pattern_cache
+
+
+SIMPLE = ['^abc$', 'abc', '^abc\\Z', '^a\\.b', '^$', '^', '^.*\\.com$', '.*x\\Z', 'a\\$']
+COMPLEX = ['^[a-z]+$', '^a|b$', '^\\d+$', '^.*$', 'a\\\\$', '^a\\nb$', '(ab)+']
+
+
+@pytest.mark.parametrize('pattern', SIMPLE)
+def test_fast_matcher_used(pattern):
+    assert fast_matcher(pattern) is not None
+
+
+@pytest.mark.parametrize('pattern', COMPLEX)
+def test_fast_matcher_falls_back(pattern):
+    assert fast_matcher(pattern) is None
+
+
+@pytest.mark.parametrize('pattern', SIMPLE)
+@given(s=st.text('abcx.$\n') | st.sampled_from(['abc', 'abc\n', 'a.b', 'x.com', 'x.com\n']))
+def test_fast_matcher_matches_re(pattern, s):
+    assert fast_matcher(pattern)(s) == (re.match(pattern, s) is not None)
+
+
+class TestPatternCache:
+
+    def test_hits_and_misses(self):
+        cache = PatternCache()
+        first = cache.get('^a')
+        assert cache.get('^a') is first
+        assert cache.stats()[:4] == (1, 1, 0, 1)
+
+    @pytest.mark.parametrize('policy, kept', [('lru', {'a', 'c'}), ('fifo', {'b', 'c'})])
+    def test_eviction(self, policy, kept):
+        cache = PatternCache(maxsize=2, policy=policy)
+        cache.get('a')
+        cache.get('b')
+        cache.get('a')
+        cache.get('c')
+        assert set(cache._data) == kept
+        assert cache.stats().evictions == 1
+
+    def test_without_fast_matchers(self):
+        cache = PatternCache(fast=False)
+        assert cache.get('^abc$').match('abc') is True
+
+    def test_invalid(self):
+        cache = PatternCache()
+        with pytest.raises(re.error):
+            cache.get('(')
+        assert cache.stats().size == 0
+
+    def test_configure(self):
+        cache = PatternCache()
+        with pytest.raises(ValueError):
+            cache.configure(policy='random')
+        cache.configure(maxsize=1)
+        cache.get('a')
+        cache.get('b')
+        assert cache.stats().size == 1
+
+
+def test_pattern_constraints_share_cache():
+    assert Pattern('^shared$').expr is Pattern('^shared$').expr
+    assert '^shared$' in pattern_cache._data
@@ -0,0 +1,78 @@
+import pytest
+
+from simpleschema import profiling
+from simpleschema.constraints import MinItems, MinLength
+from simpleschema.schema import ArraySchema, IntegerSchema, ObjectSchema, StringSchema
+from simpleschema.schema.base import Schema
+from simpleschema.streaming import validate_ndjson
+
+
+@pytest.fixture(autouse=True)
+def reset():
+    profiling.reset()
+    yield
+    while profiling.is_enabled():
+        profiling.disable()
+
+
+def test_disabled_leaves_methods_untouched():
+    call, validator = MinLength.__call__, Schema.validator
+    with profiling.profile():
+        assert MinLength.__call__ is not call
+        assert Schema.validator is not validator
+    assert MinLength.__call__ is call
+    assert Schema.validator is validator
+    assert '__call__' not in vars(MinItems)
+
+
+def test_constraint_stats_per_subclass():
+    with profiling.profile() as stats:
+        MinLength(2)('a')
+        MinLength(2)('ab')
+        MinItems(1)([1])
+    assert stats.constraints['MinLength'].calls == 2
+    assert stats.constraints['MinLength'].failures == 1
+    assert stats.constraints['MinLength'].failure_rate == 0.5
+    assert stats.constraints['MinItems'].calls == 1
+    assert stats.constraints['MinLength'].seconds > 0
+
+
+def test_schema_stats_by_title():
+    schema = ObjectSchema(
+        title='tenant',
+        properties={'tags': ArraySchema(title='tags', items=StringSchema(), min_items=1)},
+    )
+    with profiling.profile() as stats:
+        assert schema.errors({'tags': []})
+        schema.validate({'tags': ['a']})
+    # errors() runs the validator, then finds the errors starting from the validator again
+    assert stats.schemas['tenant'].calls == 3
+    assert stats.schemas['tenant'].failures == 2
+    assert stats.schemas['tags'].calls == 4
+    assert stats.schemas['tags'].failures == 3
+
+
+def test_untitled_schema_label():
+    schema = IntegerSchema(minimum=0)
+    with profiling.profile() as stats:
+        list(validate_ndjson(schema, [b'1\n-1\n']))
+    assert stats.schemas['IntegerSchema {"type":"integer","minimum":0}'].calls == 2
+    assert stats.constraints['Minimum'].failures == 1
+
+
+def test_nested_profiles():
+    with profiling.profile() as outer:
+        with profiling.profile() as inner:
+            MinLength(1)('a')
+        assert profiling.is_enabled()
+        MinLength(1)('a')
+    assert not profiling.is_enabled()
+    assert inner.constraints['MinLength'].calls == 1
+    assert outer.constraints['MinLength'].calls == 2
+    assert profiling.stats().constraints['MinLength'].calls == 2
+
+
+def test_validation_results_unchanged():
+    schema = StringSchema(min_length=2, pattern='^a')
+    with profiling.profile():
+        assert [schema.validator()(x) for x in ['ab', 'a', 'bb', 1]] == [True, False, False, False]
@@ -0,0 +1,133 @@
+import gc
+import json
+
+import pytest
+
+from simpleschema.registry import SchemaRegistry
+from simpleschema.schema import ArraySchema, IntegerSchema, ObjectSchema, StringSchema
+
+
+@pytest.fixture
+def registry():
+    registry = SchemaRegistry()
+    registry.add('name', {'type': 'string', 'minLength': 1})
+    registry.add('age', {'type': 'integer', 'minimum': 0})
+    registry.add(
+        'user',
+        {
+            'type': 'object',
+            'properties': {'name': {'$ref': 'name'}, 'age': {'$ref': 'age#'}},
+            'required': ['name'],
+        },
+    )
+    registry.add('users', {'type': 'array', 'items': {'$ref': 'user'}})
+    return registry
+
+
+def test_refs_are_linked(registry):
+    users = registry['users']
+    assert isinstance(users, ArraySchema)
+    assert users.items is registry['user']
+    assert registry['user'].properties['name'] is registry['name']
+    assert registry['users'] is users
+
+
+def test_validator(registry):
+    validate = registry.validator('users')
+    assert validate([{'name': 'a', 'age': 1}]) is True
+    assert validate([{'name': '', 'age': 1}]) is False
+    assert validate([{'age': 1}]) is False
+
+
+def test_invalidate_rebuilds_only_dependents(registry):
+    users, user, age = registry['users'], registry['user'], registry['age']
+    registry.add('name', {'type': 'string', 'minLength': 2})
+    assert registry['age'] is age
+    assert registry['user'] is not user
+    assert registry['users'] is not users
+    assert registry.validator('users')([{'name': 'a'}]) is False
+    assert registry['users'].items is registry['user']
+
+
+def test_invalidate_leaf(registry):
+    name, users = registry['name'], registry['users']
+    registry.invalidate('age')
+    assert 'users' not in registry._built
+    assert registry['name'] is name
+    # rebuilt from unchanged definitions, so the same shared objects
+    assert registry['users'] is users
+
+
+def test_identical_schemas_are_shared():
+    registry = SchemaRegistry()
+    registry.add('a', {'type': 'array', 'items': {'type': 'string', 'minLength': 1}})
+    registry.add('b', {'type': 'object', 'properties': {'x': {'type': 'string', 'minLength': 1}}})
+    assert registry['a'].items is registry['b'].properties['x']
+
+
+def test_replaced_definitions_are_released(registry):
+    for i in range(100):
+        registry.add('name', {'type': 'string', 'minLength': i})
+        registry.validator('users')
+    gc.collect()
+    # only the current name, age, user and users schemas are left
+    assert len(registry._loader) == 4
+
+
+def test_add_schema_object(registry):
+    registry.add('name', StringSchema(max_length=1))
+    assert registry['user'].properties['name'] is registry['name']
+    assert registry.validator('user')({'name': 'ab'}) is False
+
+
+def test_unresolved_ref():
+    registry = SchemaRegistry()
+    registry.add('a', {'type': 'array', 'items': {'$ref': 'b'}})
+    with pytest.raises(ValueError, match="unresolved"):
+        registry['a']
+    registry.add('b', {'type': 'integer'})
+    assert isinstance(registry['a'].items, IntegerSchema)
+
+
+def test_recursive_ref():
+    registry = SchemaRegistry()
+    registry.add('node', {'type': 'object', 'properties': {'children': {'$ref': 'nodes'}}})
+    registry.add('nodes', {'type': 'array', 'items': {'$ref': 'node'}})
+    with pytest.raises(ValueError, match='node -> nodes -> node'):
+        registry['node']
+    with pytest.raises(ValueError):
+        registry.build()
+
+
+def test_unknown_type():
+    registry = SchemaRegistry()
+    registry.add('a', {'minimum': 1})
+    with pytest.raises(ValueError):
+        registry['a']
+
+
+def test_remove(registry):
+    registry.remove('users')
+    assert 'users' not in registry
+    assert len(registry) == 3
+    with pytest.raises(KeyError):
+        registry['users']
+
+
+def test_load_directory(tmp_path):
+    (tmp_path / 'name.json').write_text(json.dumps({'type': 'string'}))
+    (tmp_path / 'b.json').write_text(
+        json.dumps({'$id': 'user', 'type': 'object', 'properties': {'n': {'$ref': 'name'}}})
+    )
+    (tmp_path / 'notes.txt').write_text('not a schema')
+    registry = SchemaRegistry()
+    assert registry.load_directory(str(tmp_path)) == ['user', 'name']
+    assert set(registry) == {'user', 'name'}
+    assert isinstance(registry['user'], ObjectSchema)
+    assert registry.build().keys() == {'user', 'name'}
+
+
+def test_load_empty_file(tmp_path):
+    (tmp_path / 'empty.json').write_text('')
+    with pytest.raises(ValueError):
+        SchemaRegistry().load(str(tmp_path / 'empty.json'))
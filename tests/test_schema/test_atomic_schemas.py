@@ -1,6 +1,12 @@
+import pickle
+from decimal import Decimal
+from fractions import Fraction
+
 import pytest
 
-from simpleschema.formats import Format
+from simpleschema.formats import Date, Format
+from simpleschema.loading import load
+from simpleschema.utils import lazy_classattr
 from simpleschema.schema import StringSchema, NumberSchema, IntegerSchema, NullSchema, BooleanSchema
 
 
@@ -142,3 +148,170 @@ class TestIntegerSchema(TestNumberSchema):
             'exclusiveMaximum': 11,
             'multipleOf': 2,
         }
+
+
+class TestBatch:
+
+    def test_string_batch(self):
+        mask, failures = StringSchema(min_length=2).batch(['ab', 'a', 1])
+        assert mask == [True, False, False]
+        assert failures == [1, 2]
+
+    @pytest.mark.parametrize('vectorize', [True, False])
+    def test_number_batch(self, monkeypatch, vectorize):
+        np = pytest.importorskip('numpy')
+        if not vectorize:
+            monkeypatch.setattr('simpleschema.constraints.np', None)
+        schema = NumberSchema(minimum=1, exclusive_maximum=4)
+        mask, failures = schema.batch(np.array([0, 1, 2.5, 4]))
+        assert [bool(m) for m in mask] == [False, True, True, False]
+        assert list(failures) == [0, 3]
+
+    def test_number_batch_multiple_of_float(self):
+        np = pytest.importorskip('numpy')
+        mask, failures = NumberSchema(multiple_of=0.1).batch(np.array([0.3, 0.35, 0.7]))
+        assert list(failures) == [1]
+
+    def test_integer_batch_rejects_non_integers(self):
+        mask, failures = IntegerSchema(minimum=1).batch([1, True, 2.0, 3])
+        assert mask == [True, False, False, True]
+        assert failures == [1, 2]
+
+
+class TestSlots:
+
+    @pytest.mark.parametrize(
+        'SchemaCls', [StringSchema, NumberSchema, IntegerSchema, NullSchema, BooleanSchema]
+    )
+    def test_no_instance_dict(self, SchemaCls):
+        assert not hasattr(SchemaCls(title='t'), '__dict__')
+
+    def test_fields_set_in_declaration_order(self):
+        schema = StringSchema(max_length=2, min_length=1)
+        assert schema._fields_set == ('type', 'min_length', 'max_length')
+
+    def test_type_is_immutable(self):
+        with pytest.raises(ValueError):
+            StringSchema(type='number')
+
+    def test_freeze(self):
+        schema = StringSchema(min_length=1).freeze()
+        with pytest.raises(ValueError):
+            schema.max_length = 2
+        assert pickle.loads(pickle.dumps(schema)).to_dict() == schema.to_dict()
+
+    def test_format_accepts_value(self):
+        assert StringSchema(format='ipv4').format == 'ipv4'
+        assert StringSchema(format=Format.ipv4).format == 'ipv4'
+        assert StringSchema(format=Date.date_time).format == 'date-time'
+        with pytest.raises(ValueError):
+            StringSchema(format='boop')
+
+
+class TestLazyFields:
+
+    def test_subclass_fields_are_resolved_on_first_use(self):
+        class BoopSchema(StringSchema):
+            boop_count: int
+
+        assert isinstance(vars(BoopSchema)['_fields'], lazy_classattr)
+        assert BoopSchema(boop_count=2).to_dict() == {'type': 'string', 'boopCount': 2}
+        assert 'boop_count' in vars(BoopSchema)['_fields']
+        assert 'boop_count' not in StringSchema._fields
+
+    def test_resolved_parent_fields_are_not_inherited(self):
+        assert 'boop_count' not in NumberSchema._aliases
+
+        class BoopSchema(NumberSchema):
+            boop_count: int
+
+        assert BoopSchema._aliases['boop_count'] == 'boopCount'
+        assert BoopSchema._bits.keys() == BoopSchema._fields.keys()
+
+
+class TestSerialization:
+
+    def test_to_dict_is_a_copy(self):
+        schema = StringSchema(min_length=1)
+        fingerprint = schema.fingerprint()
+        schema.to_dict()['minLength'] = 0
+        assert schema.to_dict() == {'type': 'string', 'minLength': 1}
+        assert schema.to_json() == b'{"type":"string","minLength":1}'
+        assert schema.fingerprint() == fingerprint
+
+    def test_to_dict_invalidated_on_set(self):
+        schema = StringSchema(min_length=1)
+        schema.to_json()
+        schema.max_length = 3
+        assert schema.to_dict() == {'type': 'string', 'minLength': 1, 'maxLength': 3}
+        assert schema.to_json() == b'{"type":"string","minLength":1,"maxLength":3}'
+
+    def test_to_json(self):
+        schema = NumberSchema(minimum=1, multiple_of=0.5)
+        assert schema.to_json() == b'{"type":"number","minimum":1,"multipleOf":0.5}'
+        assert schema.to_json() is schema.to_json()
+
+    def test_exact_numbers(self):
+        schema = NumberSchema(multiple_of=Decimal('0.1'), minimum=Fraction(1, 4), maximum=Decimal(2))
+        assert schema.to_json() == b'{"type":"number","minimum":0.25,"maximum":2,"multipleOf":0.1}'
+        assert schema.fingerprint() == load(schema.to_json()).fingerprint()
+        assert schema.validator()(0.3) is True
+
+    @pytest.mark.parametrize('value', [Fraction(1, 3), Decimal('0.1000000000000000000001')])
+    def test_inexact_numbers(self, value):
+        with pytest.raises(ValueError, match='exactly'):
+            NumberSchema(multiple_of=value)
+
+
+class TestFingerprint:
+
+    def test_cached(self):
+        schema = StringSchema(min_length=1)
+        assert schema.fingerprint() is schema.fingerprint()
+
+    def test_content_addressed(self):
+        a = StringSchema(min_length=1, max_length=2)
+        b = StringSchema(max_length=2, min_length=1)
+        assert a.fingerprint() == b.fingerprint()
+        assert len(a.fingerprint()) == 32
+
+    def test_distinguishes_values(self):
+        fingerprints = {
+            NumberSchema(minimum=1).fingerprint(),
+            NumberSchema(minimum=1.0).fingerprint(),
+            NumberSchema(maximum=1).fingerprint(),
+            IntegerSchema(minimum=1).fingerprint(),
+        }
+        assert len(fingerprints) == 4
+
+    def test_invalidated_on_set(self):
+        schema = StringSchema(min_length=1)
+        before = schema.fingerprint()
+        schema.max_length = 3
+        assert schema.fingerprint() != before
+
+    def test_stable(self):
+        assert StringSchema().fingerprint() == 'a2e1b7301492226460ee87ce7fd9a8ae'
+
+
+class TestPickle:
+
+    @pytest.mark.parametrize(
+        'schema',
+        [
+            StringSchema(min_length=1, pattern='^a', format=Format.email, title='t'),
+            NumberSchema(minimum=0.5, multiple_of=2),
+            IntegerSchema(),
+            NullSchema(description='nothing'),
+            BooleanSchema(),
+        ],
+    )
+    def test_roundtrip(self, schema):
+        schema.to_json()
+        restored = pickle.loads(pickle.dumps(schema))
+        assert type(restored) is type(schema)
+        assert restored.to_dict() == schema.to_dict()
+        assert restored._json is None
+
+    def test_payload_is_small(self):
+        assert len(pickle.dumps(IntegerSchema(minimum=1))) < 120
@@ -0,0 +1,144 @@
+import pickle
+
+import pytest
+
+from simpleschema.compiler import compile
+from simpleschema.schema import (
+    ArraySchema,
+    BooleanSchema,
+    IntegerSchema,
+    NumberSchema,
+    ObjectSchema,
+    StringSchema,
+)
+from simpleschema.schema.compound import PropertyIndex
+
+
+@pytest.fixture
+def person():
+    return ObjectSchema(
+        properties={
+            'name': StringSchema(min_length=1),
+            'age': IntegerSchema(minimum=0),
+            'tags': ArraySchema(items=StringSchema(), unique_items=True, max_items=3),
+        },
+        pattern_properties={'^x_': NumberSchema(), '^x_int': IntegerSchema()},
+        additional_properties=BooleanSchema(),
+        required=['name'],
+        max_properties=5,
+    )
+
+
+class TestObjectSchema:
+
+    def test_to_dict(self, person):
+        assert person.to_dict() == {
+            'type': 'object',
+            'properties': {
+                'name': {'type': 'string', 'minLength': 1},
+                'age': {'type': 'integer', 'minimum': 0},
+                'tags': {
+                    'type': 'array',
+                    'items': {'type': 'string'},
+                    'maxItems': 3,
+                    'uniqueItems': True,
+                },
+            },
+            'patternProperties': {'^x_': {'type': 'number'}, '^x_int': {'type': 'integer'}},
+            'additionalProperties': {'type': 'boolean'},
+            'required': ['name'],
+            'maxProperties': 5,
+        }
+
+    @pytest.mark.parametrize(
+        'record',
+        [
+            {'name': 'a'},
+            {'name': 'a', 'age': 1, 'tags': ['x', 'y']},
+            {'name': 'a', 'x_1': 1.5, 'x_int': 2, 'flag': True},
+        ],
+    )
+    def test_valid(self, person, record):
+        assert person.validator()(record) is True
+
+    @pytest.mark.parametrize(
+        'record',
+        [
+            {'age': 1},
+            {'name': ''},
+            {'name': 'a', 'age': -1},
+            {'name': 'a', 'tags': ['x', 'x']},
+            {'name': 'a', 'tags': ['a', 'b', 'c', 'd']},
+            {'name': 'a', 'x_int': 1.5},
+            {'name': 'a', 'flag': 1},
+            {'name': 'a', 'a': True, 'b': True, 'c': True, 'd': True, 'e': True},
+            ['name'],
+        ],
+    )
+    def test_invalid(self, person, record):
+        assert person.validator()(record) is False
+
+    def test_nested_dicts_are_copies(self, person):
+        name = person.properties['name']
+        validate = person.validator()
+        person.to_dict()['properties']['name']['minLength'] = 0
+        assert name.to_dict() == {'type': 'string', 'minLength': 1}
+        assert person.to_dict()['properties']['name'] == name.to_dict()
+        assert person.validator() is validate
+
+    def test_no_additional_properties(self):
+        validate = ObjectSchema(properties={'a': StringSchema()}, additional_properties=False)
+        assert validate.validator()({'a': 'x'}) is True
+        assert validate.validator()({'a': 'x', 'b': 'y'}) is False
+
+    def test_empty(self):
+        assert ObjectSchema().validator()({'anything': object()}) is True
+
+    def test_validator_is_cached(self, person):
+        assert person.validator() is person.validator()
+
+    def test_pickle(self, person):
+        assert pickle.loads(pickle.dumps(person)).to_dict() == person.to_dict()
+
+    def test_dict_form_not_compiled(self, person):
+        with pytest.raises(ValueError):
+            compile(person.to_dict())
+
+
+class TestPropertyIndex:
+
+    def test_names_resolved_once(self):
+        index = PropertyIndex({'a': StringSchema()}, {'^x': IntegerSchema()}, False)
+        assert index({'a': 'x', 'x1': 1}) is True
+        assert index({'b': 1}) is False
+        assert set(index.plan) == {'a', 'x1', 'b'}
+
+    def test_memo_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(PropertyIndex, 'max_names', 2)
+        index = PropertyIndex({}, {'^x': IntegerSchema()})
+        assert index({f'x{i}': i for i in range(10)}) is True
+        assert len(index.plan) == 2
+
+
+class TestArraySchema:
+
+    def test_to_dict(self):
+        schema = ArraySchema(items=IntegerSchema(minimum=1), min_items=1)
+        assert schema.to_dict() == {
+            'type': 'array',
+            'items': {'type': 'integer', 'minimum': 1},
+            'minItems': 1,
+        }
+
+    def test_validate(self):
+        validate = ArraySchema(items=IntegerSchema(minimum=1), min_items=1).validator()
+        assert validate([1, 2]) is True
+        assert validate([]) is False
+        assert validate([0]) is False
+        assert validate((1,)) is False
+
+    def test_unique_items_keeps_booleans_apart(self):
+        validate = ArraySchema(unique_items=True).validator()
+        assert validate([1, True, [1], [True], {'a': 1}, {'a': True}]) is True
+        assert validate([1, 1.0]) is False
+        assert validate([{'a': [1]}, {'a': [1]}]) is False
@@ -0,0 +1,83 @@
+import pickle
+import tracemalloc
+
+import pytest
+
+from simpleschema.constraints import ValidationError, ValidationErrors
+from simpleschema.schema import ArraySchema, IntegerSchema, ObjectSchema, StringSchema
+from simpleschema.schema.base import NO_ERRORS
+
+
+@pytest.fixture
+def schema():
+    return ObjectSchema(
+        properties={
+            'name': StringSchema(min_length=2, pattern='^[a-z]'),
+            'tags/ids': ArraySchema(items=IntegerSchema(minimum=0)),
+        },
+        required=['name'],
+        additional_properties=False,
+    )
+
+
+def test_valid_returns_shared_empty_tuple(schema):
+    assert schema.errors({'name': 'boop', 'tags/ids': [1]}) is NO_ERRORS
+    assert schema.validate({'name': 'boop'}) is None
+
+
+def test_success_path_allocates_nothing(schema):
+    value = {'name': 'boop', 'tags/ids': [1, 2]}
+    schema.errors(value)
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        for _ in range(100):
+            schema.errors(value)
+            schema.validate(value)
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    filters = [tracemalloc.Filter(True, '*simpleschema*'), tracemalloc.Filter(True, '<string>')]
+    diff = after.filter_traces(filters).compare_to(before.filter_traces(filters), 'filename')
+    assert sum(d.size_diff for d in diff) == 0
+
+
+def test_collect_all(schema):
+    errors = schema.errors({'name': '1', 'tags/ids': [1, -1, 'x'], 'boop': 1})
+    assert [(e.path, e.keyword) for e in errors] == [
+        ('/name', 'minLength'),
+        ('/name', 'pattern'),
+        ('/tags~1ids/1', 'minimum'),
+        ('/tags~1ids/2', 'type'),
+        ('/boop', 'additionalProperties'),
+    ]
+
+
+def test_fail_fast(schema):
+    errors = schema.errors({'tags/ids': 'x'}, fail_fast=True)
+    assert [(e.path, e.keyword) for e in errors] == [('', 'required')]
+
+
+def test_validate_raises_first_error(schema):
+    with pytest.raises(ValidationError) as errinfo:
+        schema.validate({'name': 'b'})
+    assert errinfo.value.path == '/name'
+    assert str(errinfo.value) == 'Invalid value at #/name : does not satisfy minLength 2'
+
+
+def test_validate_collect_all_raises_every_error(schema):
+    with pytest.raises(ValidationErrors) as errinfo:
+        schema.validate({'name': 'B'}, fail_fast=False)
+    assert [e.keyword for e in errinfo.value.errors] == ['minLength', 'pattern']
+
+
+def test_type_error_stops_descent():
+    errors = ArraySchema(items=StringSchema(), min_items=2).errors('boop')
+    assert [(e.path, e.keyword) for e in errors] == [('', 'type')]
+
+
+def test_errors_pickle():
+    err = ValidationError('/a', 'minimum', 'does not satisfy minimum 0')
+    errs = pickle.loads(pickle.dumps(ValidationErrors([err])))
+    assert str(errs.errors[0]) == str(err)
+    assert errs.errors[0].keyword == 'minimum'
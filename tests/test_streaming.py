@@ -0,0 +1,101 @@
+import io
+import json
+
+import pytest
+
+from simpleschema.schema import ArraySchema, IntegerSchema, StringSchema
+from simpleschema.streaming import SCHEMA_MISMATCH, validate_json_array, validate_ndjson
+
+
+def chunked(data: bytes, size: int):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class TestValidateNDJSON:
+
+    schema = IntegerSchema(minimum=0)
+
+    @pytest.mark.parametrize('size', [1, 3, 1024])
+    def test_results(self, size):
+        data = b'1\n\n-1\n"\xc3\xa9"\n  2'
+        results = list(validate_ndjson(self.schema, chunked(data, size)))
+        assert [(r.index, r.line, r.offset, r.value, r.error) for r in results] == [
+            (0, 1, 0, 1, None),
+            (1, 3, 3, -1, SCHEMA_MISMATCH),
+            (2, 4, 6, 'é', SCHEMA_MISMATCH),
+            (3, 5, 11, 2, None),
+        ]
+
+    def test_invalid_json_position(self):
+        [result] = validate_ndjson(self.schema, io.BytesIO('"é" x\n'.encode()))
+        assert result.error.startswith('invalid json')
+        assert (result.line, result.offset) == (1, 5)
+
+    def test_invalid_utf8(self):
+        [_, result] = validate_ndjson(self.schema, [b'1\n', b'"\xff"\n'])
+        assert result.error.startswith('invalid utf-8')
+        assert result.offset == 3
+
+    def test_text_file(self):
+        results = validate_ndjson(StringSchema(min_length=2), io.StringIO('"ab"\n"a"\n'))
+        assert [r.valid for r in results] == [True, False]
+
+
+class TestValidateJSONArray:
+
+    schema = IntegerSchema(minimum=0)
+
+    @pytest.mark.parametrize('size', [1, 2, 1024])
+    def test_results(self, size):
+        data = b'[1,\n  -1 , 123,\n"\xc3\xa9", 4]\n'
+        results = list(validate_json_array(self.schema, chunked(data, size)))
+        assert [(r.index, r.line, r.offset, r.value, r.error) for r in results] == [
+            (0, 1, 1, 1, None),
+            (1, 2, 6, -1, SCHEMA_MISMATCH),
+            (2, 2, 11, 123, None),
+            (3, 3, 16, 'é', SCHEMA_MISMATCH),
+            (4, 3, 22, 4, None),
+        ]
+
+    def test_empty(self):
+        assert list(validate_json_array(self.schema, [b' [ ] '])) == []
+
+    def test_file(self):
+        data = json.dumps(list(range(1000))).encode()
+        results = validate_json_array(self.schema, io.BytesIO(data), chunk_size=7)
+        assert sum(r.valid for r in results) == 1000
+
+    @pytest.mark.parametrize(
+        'data, n_valid, error, offset',
+        [
+            (b'{"a": 1}', 0, 'expected a json array', 0),
+            (b'[1, 2', 2, "expected ',' or ']'", 5),
+            (b'[1, }]', 1, 'invalid json : Expecting value', 4),
+            (b'[1,]', 1, 'invalid json : Expecting value', 3),
+            (b'[1] 2', 1, 'extra data after array', 4),
+        ],
+    )
+    def test_malformed(self, data, n_valid, error, offset):
+        *valid, last = validate_json_array(self.schema, chunked(data, 2))
+        assert len(valid) == n_valid and all(r.valid for r in valid)
+        assert (last.error, last.offset) == (error, offset)
+
+    def test_max_record_size(self):
+        data = [b'[', b'"' + b'a' * 10] + [b'a' * 10] * 100
+        [result] = validate_json_array(StringSchema(), data, max_record_size=50)
+        assert result.error.startswith('invalid json')
+
+    def test_large_element_parsed_a_few_times(self, monkeypatch):
+        calls = []
+        raw_decode = json.JSONDecoder.raw_decode
+
+        def counting(decoder, s, idx=0):
+            calls.append(idx)
+            return raw_decode(decoder, s, idx)
+
+        monkeypatch.setattr(json.JSONDecoder, 'raw_decode', counting)
+        data = json.dumps([list(range(100_000)), 1]).encode()
+        results = list(validate_json_array(ArraySchema(), io.BytesIO(data), chunk_size=256))
+        assert [r.valid for r in results] == [True, False]
+        # about one parse per doubling of the buffer, rather than one per chunk
+        assert len(calls) < 2 * (len(data) // 256).bit_length()
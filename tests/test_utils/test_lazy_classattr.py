@@ -0,0 +1,28 @@
+from simpleschema.utils import lazy_classattr
+
+
+def test_lazy_classattr():
+    calls = []
+
+    class SomeClass:
+
+        @lazy_classattr
+        def expensive(cls):
+            calls.append(cls)
+            return cls.__name__.lower()
+
+    assert calls == []
+    assert SomeClass.expensive == 'someclass'
+    assert SomeClass().expensive == 'someclass'
+    assert calls == [SomeClass]
+    assert vars(SomeClass)['expensive'] == 'someclass'
+
+
+def test_lazy_classattr_with_name():
+    class SomeClass:
+
+        pass
+
+    SomeClass.__label__ = lazy_classattr(lambda cls: cls.__name__, '__label__')
+    assert SomeClass.__label__ == 'SomeClass'
+    assert vars(SomeClass)['__label__'] == 'SomeClass'
@@ -42,3 +42,51 @@ def test_method_dispatch_on_init():
     assert inst.i == 1
     with pytest.raises(ThisError):
         SomeClass('boop')
+
+
+def test_method_dispatch_caches_resolved_handler():
+    class SomeClass:
+
+        @method_dispatch
+        def describe(self, x):
+            return 'object'
+
+        @describe.register
+        def _(self, x: int):
+            return 'int'
+
+    inst = SomeClass()
+    assert inst.describe(True) == 'int'
+    assert list(SomeClass.describe.cache) == [bool]
+    assert SomeClass.describe.cache[bool] is SomeClass.describe.dispatcher.dispatch(int)
+
+
+def test_method_dispatch_register_invalidates_cache():
+    class SomeClass:
+
+        @method_dispatch
+        def describe(self, x):
+            return 'object'
+
+    inst = SomeClass()
+    assert inst.describe(True) == 'object'
+
+    @SomeClass.describe.register
+    def _(self, x: bool):
+        return 'bool'
+
+    assert inst.describe(True) == 'bool'
+
+
+def test_method_dispatch_bound_and_set_name():
+    class SomeClass:
+
+        @method_dispatch
+        def describe(self, x):
+            return self
+
+    inst = SomeClass()
+    assert SomeClass.describe.owner is SomeClass
+    assert SomeClass.describe.__name__ == 'describe'
+    assert inst.describe.__self__ is inst
+    assert SomeClass.describe(inst, 1) is inst
@@ -0,0 +1,88 @@
+import os
+import types
+
+import pytest
+
+from simpleschema import format_checkers, validator_cache
+from simpleschema.schema import ArraySchema, IntegerSchema, ObjectSchema, StringSchema
+from simpleschema.validator_cache import SUFFIX, ValidatorCache, _digest
+
+
+@pytest.fixture
+def schema():
+    return ObjectSchema(
+        properties={'tags': ArraySchema(items=StringSchema(min_length=1))}, required=['tags']
+    )
+
+
+def test_miss_then_hit(tmp_path, schema):
+    cache = ValidatorCache(str(tmp_path))
+    validate = cache.get(schema)
+    assert validate({'tags': ['a']}) is True
+    assert validate({'tags': ['']}) is False
+    assert (cache.hits, cache.misses) == (0, 1)
+    assert os.path.exists(cache.path(schema.fingerprint()))
+
+    restarted = ValidatorCache(str(tmp_path))
+    validate = restarted.get(schema)
+    assert validate({'tags': ['a']}) is True
+    assert (restarted.hits, restarted.misses) == (1, 0)
+    assert restarted.size() == cache.size() > 0
+
+
+def test_memoized_in_process(tmp_path, schema):
+    cache = ValidatorCache(str(tmp_path))
+    assert cache.get(schema) is cache.get(schema)
+
+
+def test_corrupt_entry_is_rebuilt(tmp_path, schema):
+    cache = ValidatorCache(str(tmp_path))
+    with open(cache.path(schema.fingerprint()), 'wb') as f:
+        f.write(b'boop')
+    assert cache.get(schema)({'tags': []}) is True
+    assert cache.misses == 1
+
+
+def test_entries_keyed_on_codegen(tmp_path, schema, monkeypatch):
+    ValidatorCache(str(tmp_path)).get(schema)
+    monkeypatch.setattr(validator_cache, 'SUFFIX', '.other-codegen.bin')
+    cache = ValidatorCache(str(tmp_path))
+    assert cache.get(schema)({'tags': ['']}) is False
+    assert (cache.hits, cache.misses) == (0, 1)
+
+
+def test_digest_follows_module_source(tmp_path):
+    path = tmp_path / 'module.py'
+    module = types.SimpleNamespace(__file__=str(path))
+    path.write_text('TEMPLATE = "x >= {value}"\n')
+    before = _digest(module)
+    path.write_text('TEMPLATE = "x > {value}"\n')
+    assert _digest(module) != before
+
+
+def test_eviction(tmp_path):
+    cache = ValidatorCache(str(tmp_path), max_bytes=2000)
+    schemas = [IntegerSchema(minimum=i) for i in range(20)]
+    for s in schemas:
+        cache.get(s)
+    entries = [f for f in os.listdir(str(tmp_path)) if f.endswith(SUFFIX)]
+    assert 0 < len(entries) < 20
+    assert cache.size() <= 2000
+    assert os.path.exists(cache.path(schemas[-1].fingerprint()))
+
+
+def test_clear(tmp_path, schema):
+    cache = ValidatorCache(str(tmp_path))
+    cache.get(schema)
+    cache.clear()
+    assert cache.size() == 0
+    assert not os.listdir(str(tmp_path))
+
+
+def test_custom_format_falls_back(tmp_path, monkeypatch):
+    monkeypatch.setitem(format_checkers._checkers, 'email', lambda s: s == 'boop')
+    monkeypatch.delitem(format_checkers._patterns, 'email')
+    cache = ValidatorCache(str(tmp_path))
+    validate = cache.get(StringSchema(format='email'))
+    assert validate('boop') is True
+    assert not os.listdir(str(tmp_path))